@@ -0,0 +1,136 @@
+#startup.py
+# Cold-start profiling for the dashboard. Each measurement runs in a fresh
+# interpreter so nothing is already in sys.modules, in a scratch directory
+# holding a copy of the sample miner CSV (the app's store, caches and market
+# history are relative to the working directory), with the HTTP client offline.
+#
+#   python -m bench.startup                  # import-time report + startup benchmark
+#   python -m bench.startup --module ui.dashboard --top 30
+#   python -m bench.startup --repeats 5 --json startup.json
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from statistics import median
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+SAMPLE_CSV = os.path.join(ROOT, "Book123.csv")
+
+# Modules that should only load when their feature is used
+HEAVY_MODULES = ("bs4", "sklearn", "pyarrow", "plotly.express", "scipy", "matplotlib")
+
+# Loaded anyway by `import streamlit`; left out of the report by default
+BASELINE = "import streamlit, pandas, numpy"
+
+
+def _run(code: str, importtime: bool = True) -> subprocess.CompletedProcess:
+    # A fresh scratch directory per process, so every run starts from the same data
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    flags = ["-X", "importtime"] if importtime else []
+    with tempfile.TemporaryDirectory(prefix="startup-bench-") as workdir:
+        shutil.copy(SAMPLE_CSV, workdir)
+        return subprocess.run([sys.executable, *flags, "-c", code], cwd=workdir, env=env,
+                              capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr: str) -> list:
+    """Rows of (module, self_us, cumulative_us, depth) from `-X importtime` output, in load order."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def import_profile(module: str, baseline: str = BASELINE) -> list:
+    """Import-time rows for `module`, excluding whatever `baseline` already imported."""
+    code = f"{baseline}\nimport {module}" if baseline else f"import {module}"
+    rows = parse_importtime(_run(code).stderr)
+    if baseline:
+        seen = {name for name, *_ in parse_importtime(_run(baseline).stderr)}
+        rows = [row for row in rows if row[0] not in seen]
+    return rows
+
+
+def format_profile(rows: list, top: int = 25) -> str:
+    """The `top` imports with the largest cumulative time, indented by import depth as in -X importtime."""
+    total = sum(cumulative for _, _, cumulative, depth in rows if depth == min((r[3] for r in rows), default=0))
+    lines = [f"{'self [ms]':>10} {'cumul [ms]':>11}  module", f"{'':>10} {total / 1000:>11.1f}  (total)"]
+    for name, self_us, cumulative_us, depth in sorted(rows, key=lambda r: -r[2])[:top]:
+        lines.append(f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>11.1f}  {'  ' * depth}{name}")
+    return "\n".join(lines)
+
+
+_STARTUP_CODE = """
+import json, sys, time
+t0 = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+from data.http_client import Response, client
+client.transport = lambda url, params, headers, timeout: Response(503, "", {{}})  # offline: no live data
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+t2 = time.perf_counter()
+at.run()
+t3 = time.perf_counter()
+print(json.dumps({{
+    "import_streamlit_s": t1 - t0,
+    "first_run_s": t2 - t1,
+    "rerun_s": t3 - t2,
+    "modules": len(sys.modules),
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+    "exceptions": len(at.exception),
+}}))
+"""
+
+
+def startup_benchmark(repeats: int = 3) -> dict:
+    """Median cold first render and warm rerun of the app (bare mode, fresh process per repeat)."""
+    runs = []
+    for _ in range(repeats):
+        out = _run(_STARTUP_CODE.format(app=APP, heavy=HEAVY_MODULES), importtime=False).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    result = {key: median(run[key] for run in runs) for key in ("import_streamlit_s", "first_run_s", "rerun_s", "modules")}
+    result["modules"] = int(result["modules"])
+    result["heavy_loaded"] = sorted({m for run in runs for m in run["heavy_loaded"]})
+    result["exceptions"] = max(run["exceptions"] for run in runs)
+    result["repeats"] = repeats
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time report and startup benchmark for the dashboard")
+    parser.add_argument("--module", default="ui.dashboard", help="module to profile (default: ui.dashboard)")
+    parser.add_argument("--top", type=int, default=25, help="rows in the import report")
+    parser.add_argument("--repeats", type=int, default=3, help="fresh processes for the startup benchmark")
+    parser.add_argument("--no-baseline", action="store_true", help="include streamlit/pandas/numpy in the report")
+    parser.add_argument("--json", help="also write the benchmark result to this file")
+    args = parser.parse_args(argv)
+
+    # run_dashboard imports its dependencies on call, so profile what a first render loads
+    module = args.module
+    if module == "ui.dashboard":
+        module = "ui.dashboard, data.market_refresher, data.miner_data, logic.cache, logic.inputs, utils.charts"
+    print(f"Import time for {args.module}:")
+    print(format_profile(import_profile(module, baseline="" if args.no_baseline else BASELINE), args.top))
+
+    print("\nStartup benchmark:")
+    result = startup_benchmark(args.repeats)
+    for key, value in result.items():
+        print(f"  {key}: {value:.3f}" if isinstance(value, float) else f"  {key}: {value}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#suite.py
+# Benchmarks for the hot paths: clean_and_normalize, calculate_profitability_metrics,
+# calculate_miner_scores and optimize_miner_mix on synthetic catalogs (1k / 100k /
+# 1M rows), and the scenario simulator on grids of increasing size. Records wall
+# time, peak traced memory and allocated blocks; results can be saved as a JSON
+# baseline and later compared against it.
+#
+#   python -m bench.suite --save bench_baseline.json
+#   python -m bench.suite --compare bench_baseline.json --threshold 0.2
+#   python -m bench.suite --sizes 1000,100000,1000000 --only scores
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from statistics import median
+
+import numpy as np
+import pandas as pd
+
+from logic.optimizer import optimize_miner_mix
+from logic.simulate import simulate_all_scenarios, simulate_all_scenarios_reference
+from logic.sweep import sweep_grid
+from utils.cleaning import clean_and_normalize
+from utils.metrics import calculate_profitability_metrics
+from utils.scoring import calculate_miner_scores
+
+CATALOG_SIZES = (1_000, 100_000, 1_000_000)
+GRID_SIZES = (27, 1_000, 8_000)  # cells in the swept parameter grid (cubes: three equal axes)
+SIM_INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 30,
+    "miner_cost": 5000.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 1000.0,
+    "btc_cagr": 15.0,
+    "difficulty": 115e12,
+    "fees_btc": 0.025,
+    "start_year": 2026,
+    "block_reward": 3.125,
+}
+WEIGHTS = {"eff_score": 0.3, "cost_score": 0.2, "profit_score": 0.3, "margin_score": 0.1, "age_score": 0.1}
+COMPARED = ("wall_s", "peak_bytes")
+# Growth below these absolute amounts is timer / allocator noise, never a regression
+MIN_DELTA = {"wall_s": 0.005, "peak_bytes": 1 << 20}
+
+
+def synthetic_catalog(n: int, seed: int = 0) -> pd.DataFrame:
+    """A raw miner CSV as scraped/exported: original headers, "$1,234" costs, "95%" margins."""
+    rng = np.random.default_rng(seed)
+    hashrate = rng.uniform(50, 1000, n).round(1)
+    efficiency = rng.uniform(9, 40, n).round(1)
+    cost = rng.uniform(300, 30_000, n).round(2)
+    return pd.DataFrame({
+        "Model": np.char.add("Miner ", np.arange(n).astype(str)),
+        "Manufacturer": rng.choice(["Bitmain", "MicroBT", "Canaan", "Auradine"], n),
+        "Hashrate (TH/s)": hashrate,
+        "Power (W)": (hashrate * efficiency).round(0),
+        "Efficiency (J/TH)": efficiency,
+        "Release Date": rng.choice(["21-Jan", "22-Jun", "23-Mar", "24-Nov", "25-Feb"], n),
+        "Cost per Miner": pd.Series(cost).map("${:,.2f}".format),
+        "Operating Margin": pd.Series(rng.uniform(50, 99, n).round(1)).astype(str) + "%",
+        "Release Year": rng.integers(2018, 2026, n),
+    })
+
+
+def normalized_catalog(n: int, seed: int = 0) -> pd.DataFrame:
+    df = clean_and_normalize(synthetic_catalog(n, seed))
+    df = df.rename(columns={"hashrate": "hashrate_ths"})
+    df["power_kw"] = df.pop("power") / 1000
+    return df
+
+
+def scored_catalog(n: int, seed: int = 0) -> pd.DataFrame:
+    return calculate_profitability_metrics(normalized_catalog(n, seed), btc_price=100_000, electricity_rate=0.05,
+                                           usd_per_th_per_day=0.05)
+
+
+def _grid(cells: int) -> dict:
+    # Split the cell count over up to three axes, as a dashboard sweep would
+    side = max(1, round(cells ** (1 / 3)))
+    rest = max(1, cells // (side * side))
+    return {
+        "btc_price": np.linspace(50_000, 250_000, side),
+        "electricity_rate": np.linspace(0.02, 0.12, side),
+        "btc_cagr": np.linspace(0, 40, rest),
+    }
+
+
+def cases(sizes, grid_sizes):
+    """(name, rows, setup, run): setup() builds fresh, untimed inputs; run(inputs) is measured."""
+    for n in sizes:
+        yield f"clean_and_normalize/{n}", n, lambda n=n: synthetic_catalog(n), clean_and_normalize
+        yield (f"profitability_metrics/{n}", n, lambda n=n: normalized_catalog(n),
+               lambda df: calculate_profitability_metrics(df, btc_price=100_000, electricity_rate=0.05,
+                                                          difficulty=115e12, block_reward_btc=3.125, fees_btc=0.025,
+                                                          inplace=True))
+        yield f"scores/{n}", n, lambda n=n: scored_catalog(n), lambda df: calculate_miner_scores(df, WEIGHTS)
+        yield (f"allocation/{n}", n, lambda n=n: normalized_catalog(n),
+               lambda df: optimize_miner_mix(df, 1_000_000, electricity_rate=0.05, power_cap_kw=500,
+                                             btc_price=100_000, usd_per_th_per_day=0.05))
+    yield "simulate/reference", 1, lambda: dict(SIM_INPUTS), simulate_all_scenarios_reference
+    yield "simulate/array", 1, lambda: dict(SIM_INPUTS), simulate_all_scenarios
+    for cells in grid_sizes:
+        grid = _grid(cells)
+        size = int(np.prod([len(v) for v in grid.values()]))
+        yield f"sweep/{size}", size, lambda grid=grid: (dict(SIM_INPUTS), grid), lambda args: sweep_grid(*args)
+
+
+def measure(setup, run, repeats: int = 3) -> dict:
+    """Best-of-`repeats` wall time untraced, then one traced run for peak memory and net allocated blocks."""
+    if repeats > 1:
+        run(setup())  # warm-up: first-touch page faults and lazy imports are not the code under test
+    times = []
+    for _ in range(repeats):
+        inputs = setup()
+        start = time.perf_counter()
+        run(inputs)
+        times.append(time.perf_counter() - start)
+
+    inputs = setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = run(inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return {"wall_s": min(times), "wall_median_s": median(times), "peak_bytes": peak, "alloc_blocks": blocks}
+
+
+def run_suite(sizes=CATALOG_SIZES, grid_sizes=GRID_SIZES, repeats: int = 3, only=None, log=print) -> dict:
+    results = {}
+    for name, rows, setup, run in cases(sizes, grid_sizes):
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        # Million-row cases get a single timed run
+        results[name] = measure(setup, run, 1 if rows >= 1_000_000 else repeats)
+        if log:
+            m = results[name]
+            log(f"{name:<32} {m['wall_s'] * 1000:>10.1f} ms {m['peak_bytes'] / 2**20:>10.1f} MiB {m['alloc_blocks']:>10} blocks")
+    return results
+
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+            "machine": platform.machine(), "processor": platform.processor()}
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> list:
+    """Cases where a compared metric grew by more than `threshold` (fraction) over the baseline."""
+    regressions = []
+    for name, metrics in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for key in COMPARED:
+            grew = metrics[key] > base[key] * (1 + threshold) and metrics[key] - base[key] > MIN_DELTA[key]
+            if base.get(key) and grew:
+                regressions.append((name, key, base[key], metrics[key], metrics[key] / base[key] - 1))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite for cleaning, metrics, scoring and simulation")
+    parser.add_argument("--sizes", default=",".join(map(str, CATALOG_SIZES)), help="catalog sizes, comma separated")
+    parser.add_argument("--grids", default=",".join(map(str, GRID_SIZES)), help="sweep grid sizes, comma separated")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", help="comma-separated case name prefixes, e.g. scores,sweep")
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed growth before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        sizes=[int(s) for s in args.sizes.split(",") if s],
+        grid_sizes=[int(s) for s in args.grids.split(",") if s],
+        repeats=args.repeats,
+        only=args.only.split(",") if args.only else None,
+    )
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != environment():
+            print("note: baseline was recorded on a different environment", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.threshold)
+        for name, key, before, after, growth in regressions:
+            print(f"REGRESSION {name} {key}: {before:.4g} -> {after:.4g} (+{growth:.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
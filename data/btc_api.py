@@ -3,31 +3,32 @@
 import requests
 import streamlit as st
 
+from data.http_client import client
+
 COINGECKO_API_URL = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
 HASHPRICE_API_URL = "https://api.hashrateindex.com/v1/hashrateindex/hashprice"
+DIFFICULTY_API_URL = "https://blockchain.info/q/getdifficulty"
 
-@st.cache_data(ttl=600)
-def fetch_btc_prices(days: int = 30, currency: str = "usd") -> list:
+def get_btc_prices(days: int = 30, currency: str = "usd") -> list:
     """
     Fetch BTC price data from CoinGecko API for the last `days` days.
-    Returns a list of [timestamp, price].
+    Returns a list of [timestamp, price]. Raises on network/HTTP errors.
     """
     params = {
         "vs_currency": currency,
         "days": days,
         "interval": "daily"
     }
-    try:
-        response = requests.get(COINGECKO_API_URL, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("prices", [])
-    except Exception as e:
-        st.error(f"Error fetching BTC prices: {e}")
-        return []
+    response = client.get(COINGECKO_API_URL, params=params)
+    response.raise_for_status()
+    data = response.json()
+    return data.get("prices", [])
 
-@st.cache_data(ttl=600)
-def fetch_hashprice() -> tuple[float | None, int | None]:
+def get_hashprice() -> tuple[float, int]:
+    """
+    Fetch current Bitcoin hashprice from Luxor API.
+    Returns (usd_per_th_per_day, sats_per_th_per_day). Raises on network/HTTP errors.
+    """
     headers = {
         "X-Hi-Api-Key": ""
     }
@@ -37,17 +38,37 @@ def fetch_hashprice() -> tuple[float | None, int | None]:
         "bucket": "5m",
         "span": "1D"
     }
+    resp = client.get(HASHPRICE_API_URL, headers=headers, params=params)
+    resp.raise_for_status()
+    data = resp.json()
+    return data["hashprice"]["usd_per_th_per_day"], data["hashprice"]["sats_per_th_per_day"]
+
+def get_difficulty() -> float:
+    """Fetch current network difficulty. Raises on network/HTTP errors."""
+    resp = client.get(DIFFICULTY_API_URL)
+    resp.raise_for_status()
+    return float(resp.text)
+
+@st.cache_data(ttl=600)
+def fetch_btc_prices(days: int = 30, currency: str = "usd") -> list:
+    """
+    Fetch BTC price data from CoinGecko API for the last `days` days.
+    Returns a list of [timestamp, price].
+    """
+    try:
+        return get_btc_prices(days, currency)
+    except Exception as e:
+        st.error(f"Error fetching BTC prices: {e}")
+        return []
+
+@st.cache_data(ttl=600)
+def fetch_hashprice() -> tuple[float | None, int | None]:
     """
     Fetch current Bitcoin hashprice from Luxor API.
     Returns (usd_per_th_per_day, sats_per_th_per_day).
     """
     try:
-        resp = requests.get(HASHPRICE_API_URL, headers=headers, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        usd_per_th_per_day = data["hashprice"]["usd_per_th_per_day"]
-        sats_per_th_per_day = data["hashprice"]["sats_per_th_per_day"]
-        return usd_per_th_per_day, sats_per_th_per_day
+        return get_hashprice()
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
             st.warning("⚠️ Access denied (403) to live hashprice API. Using manual difficulty input instead.")
@@ -56,4 +77,4 @@ def fetch_hashprice() -> tuple[float | None, int | None]:
         return None, None
     except Exception as e:
         st.error(f"Error fetching hashprice: {e}")
-        return None, None
\ No newline at end of file
+        return None, None
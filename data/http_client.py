@@ -0,0 +1,186 @@
+#http_client.py
+# Shared HTTP client for the market data APIs: one pooled keep-alive session,
+# single-flight coalescing of identical in-flight requests, and a per-host
+# circuit breaker that serves the last good response while the upstream is down.
+# The transport is pluggable so the client can be exercised offline.
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+class Response:
+    """Minimal response: status, text and headers. `stale` is set when served from the last good copy."""
+
+    def __init__(self, status_code: int, text: str, headers: Optional[Dict[str, str]] = None, stale: bool = False):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.stale = stale
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class CircuitOpenError(requests.RequestException):
+    """The host's breaker is open and there is no last good response to serve."""
+
+
+class RequestsTransport:
+    """Default transport: a requests.Session with a keep-alive connection pool."""
+
+    def __init__(self, pool_size: int = 10):
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __call__(self, url: str, params: Optional[dict], headers: Optional[dict], timeout: float) -> Response:
+        r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        return Response(r.status_code, r.text, dict(r.headers))
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class _Breaker:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+
+class HttpClient:
+    """
+    GET with coalescing and a circuit breaker.
+
+    Concurrent calls with the same URL, params and headers share one request.
+    After `failure_threshold` consecutive failures (transport errors, 429, 5xx)
+    a host's breaker opens for `cooldown` seconds; while open, and whenever a
+    request fails, the last good response for that request is returned with
+    `stale=True`. After the cooldown one probe request is let through.
+    """
+
+    def __init__(self, transport: Optional[Callable[..., Response]] = None, timeout: float = 10,
+                 failure_threshold: int = 3, cooldown: float = 60):
+        self.transport = transport or RequestsTransport()
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._flights = {}  # request key -> _Flight
+        self._last_good = {}  # request key -> Response
+        self._breakers = {}  # host -> _Breaker
+        self.requests_sent = 0
+        self.coalesced = 0
+        self.stale_served = 0
+
+    @staticmethod
+    def _key(url, params, headers):
+        return (url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+
+    def _allow(self, host: str) -> bool:
+        breaker = self._breakers.setdefault(host, _Breaker())
+        if breaker.opened_at is None:
+            return True
+        if time.monotonic() - breaker.opened_at >= self.cooldown and not breaker.probing:
+            breaker.probing = True  # half-open: a single probe decides
+            return True
+        return False
+
+    def _record(self, host: str, ok: bool):
+        breaker = self._breakers.setdefault(host, _Breaker())
+        breaker.probing = False
+        if ok:
+            breaker.failures, breaker.opened_at = 0, None
+            return
+        breaker.failures += 1
+        if breaker.failures >= self.failure_threshold:
+            breaker.opened_at = time.monotonic()
+
+    def _stale(self, key, error: Exception) -> Response:
+        last = self._last_good.get(key)
+        if last is None:
+            raise error
+        self.stale_served += 1
+        return Response(last.status_code, last.text, last.headers, stale=True)
+
+    def _fetch(self, key, url, params, headers, timeout) -> Response:
+        host = urlsplit(url).netloc
+        with self._lock:
+            allowed = self._allow(host)
+            if not allowed:
+                return self._stale(key, CircuitOpenError(f"circuit open for {host}"))
+            self.requests_sent += 1
+
+        try:
+            response = self.transport(url, params, headers, timeout)
+            failed = response.status_code == 429 or response.status_code >= 500
+            error = requests.HTTPError(f"{response.status_code} Error", response=response) if failed else None
+        except Exception as e:  # any transport error counts, so a half-open probe always resolves
+            response, failed, error = None, True, e
+
+        with self._lock:
+            self._record(host, not failed)
+            if failed:
+                return self._stale(key, error)
+            if response.status_code < 400:
+                self._last_good[key] = response
+        return response
+
+    def get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+            timeout: Optional[float] = None) -> Response:
+        key = self._key(url, params, headers)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = self._fetch(key, url, params, headers, timeout or self.timeout)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests_sent,
+                "coalesced": self.coalesced,
+                "stale_served": self.stale_served,
+                "open_circuits": sorted(h for h, b in self._breakers.items() if b.opened_at is not None),
+            }
+
+
+# Shared by every session and the background refresher; swap `client.transport` to run offline
+client = HttpClient()
@@ -0,0 +1,155 @@
+#market_history.py
+# Local append-only history of BTC price, hashprice and difficulty. Each series
+# is a flat file of (timestamp_ms, value) records read through np.memmap, so a
+# `days` window is a slice of the mapping rather than a copy. Syncing fetches
+# only the tail since the last stored timestamp. The fetchers (data.btc_api,
+# which needs streamlit) are imported on first sync, so reading works headless.
+
+import math
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+HISTORY_DIR = "market_history"
+RECORD = np.dtype([("t", "<i8"), ("v", "<f8")])
+DAY_MS = 86_400_000
+MAX_BACKFILL_DAYS = 365
+
+
+class Series:
+    """One append-only series; timestamps are strictly increasing."""
+
+    def __init__(self, name: str, path: str = HISTORY_DIR):
+        self.name = name
+        self.file = os.path.join(path, f"{name}.bin")
+        self._lock = threading.Lock()
+        self._map = None
+        self._mapped_size = -1
+
+    def read(self) -> np.ndarray:
+        """All records as a read-only memory map (remapped only when the file grew)."""
+        size = os.path.getsize(self.file) if os.path.exists(self.file) else 0
+        size -= size % RECORD.itemsize  # ignore a torn trailing record
+        if size != self._mapped_size:
+            self._map = np.memmap(self.file, dtype=RECORD, mode="r", shape=(size // RECORD.itemsize,)) if size else np.empty(0, RECORD)
+            self._mapped_size = size
+        return self._map
+
+    def last_timestamp(self) -> Optional[int]:
+        records = self.read()
+        return int(records["t"][-1]) if len(records) else None
+
+    def append(self, timestamps, values) -> int:
+        """Append records newer than the last stored one; returns how many were written."""
+        records = np.empty(len(timestamps), RECORD)
+        records["t"] = timestamps
+        records["v"] = values
+        records = records[np.argsort(records["t"], kind="stable")]
+        with self._lock:
+            last = self.last_timestamp()
+            if last is not None:
+                records = records[records["t"] > last]
+            if len(records):
+                # Keep only the last record for repeated timestamps
+                keep = np.append(records["t"][1:] != records["t"][:-1], True)
+                records = records[keep]
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                with open(self.file, "ab") as f:
+                    f.write(records.tobytes())
+        return len(records)
+
+    def window(self, days: Optional[float] = None, end: Optional[int] = None) -> np.ndarray:
+        """Records in (end - days, end]; a view into the memory map. end defaults to the last record."""
+        records = self.read()
+        if not len(records):
+            return records
+        t = records["t"]
+        end = int(t[-1]) if end is None else end
+        stop = np.searchsorted(t, end, side="right")
+        start = 0 if days is None else np.searchsorted(t, end - days * DAY_MS, side="right")
+        return records[start:stop]
+
+
+def downsample(records: np.ndarray, max_points: int) -> np.ndarray:
+    """Bucket means (timestamp of each bucket's last record), at most `max_points` buckets."""
+    n = len(records)
+    if n <= max_points:
+        return records
+    edges = np.linspace(0, n, max_points + 1).astype(np.int64)[:-1]
+    counts = np.diff(np.append(edges, n))
+    out = np.empty(max_points, RECORD)
+    out["t"] = records["t"][edges + counts - 1]
+    out["v"] = np.add.reduceat(records["v"], edges) / counts
+    return out
+
+
+def log_return_volatility(records: np.ndarray, periods_per_year: float = 365) -> Optional[float]:
+    """Annualized standard deviation of log returns, or None with fewer than 3 records."""
+    values = records["v"]
+    values = values[values > 0]
+    if len(values) < 3:
+        return None
+    return float(np.std(np.diff(np.log(values)), ddof=1) * math.sqrt(periods_per_year))
+
+
+class MarketHistory:
+    """The three market series in one directory, plus the sync logic that fills them."""
+
+    def __init__(self, path: str = HISTORY_DIR):
+        self.path = path
+        self.btc_price = Series("btc_price", path)
+        self.hashprice = Series("hashprice_usd_per_th_day", path)
+        self.difficulty = Series("difficulty", path)
+
+    def sync_prices(self, fetch: Optional[Callable[..., list]] = None, now_ms: Optional[int] = None) -> Tuple[int, float]:
+        """
+        Fetch only the days missing since the last stored price and store completed
+        daily closes (the provider's trailing point is the live price, which changes
+        until the day is over). Returns the live (timestamp_ms, price).
+        """
+        if fetch is None:
+            from data.btc_api import get_btc_prices as fetch
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        last = self.btc_price.last_timestamp()
+        days = MAX_BACKFILL_DAYS if last is None else min(MAX_BACKFILL_DAYS, max(1, math.ceil((now_ms - last) / DAY_MS)))
+        prices = fetch(days=days)
+        if not prices:
+            raise ValueError("empty price history")
+        points = np.asarray(prices, dtype=np.float64)
+        today = now_ms - now_ms % DAY_MS
+        complete = points[points[:, 0] <= today]
+        self.btc_price.append(complete[:, 0].astype(np.int64), complete[:, 1])
+        return int(points[-1, 0]), float(points[-1, 1])
+
+    def sync_hashprice(self, fetch: Optional[Callable[[], tuple]] = None) -> tuple:
+        if fetch is None:
+            from data.btc_api import get_hashprice as fetch
+        usd, sats = fetch()
+        self.hashprice.append([int(time.time() * 1000)], [usd])
+        return usd, sats
+
+    def sync_difficulty(self, fetch: Optional[Callable[[], float]] = None) -> float:
+        if fetch is None:
+            from data.btc_api import get_difficulty as fetch
+        difficulty = fetch()
+        self.difficulty.append([int(time.time() * 1000)], [difficulty])
+        return difficulty
+
+    def price_volatility(self, days: float = 365) -> Optional[float]:
+        """Annualized BTC price volatility from the stored daily closes (no network)."""
+        return log_return_volatility(self.btc_price.window(days))
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_history() -> MarketHistory:
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = MarketHistory()
+        return _history
@@ -0,0 +1,123 @@
+#market_refresher.py
+# Background refresh of live market data (BTC price, hashprice, difficulty).
+# A daemon thread keeps a shared snapshot up to date; renders read the snapshot
+# and never wait on the network (stale-while-revalidate). Each refresh also
+# extends the local history in data.market_history.
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from data.market_history import MarketHistory, get_history
+
+SOURCES = ("btc_price", "hashprice", "difficulty")
+
+
+class MarketRefresher:
+    """
+    Keeps the latest value of each source. A source is refreshed when it is older
+    than `ttl`; after a failed fetch it keeps its last good value and is retried
+    after `retry_after` seconds.
+    """
+
+    def __init__(self, ttl: float = 600, retry_after: float = 60, history: Optional[MarketHistory] = None,
+                 fetchers: Optional[Dict[str, Callable[[], Any]]] = None):
+        self.ttl = ttl
+        self.retry_after = retry_after
+        history = history or get_history()
+        self._fetchers = fetchers or {
+            "btc_price": history.sync_prices,  # (timestamp_ms, price)
+            "hashprice": history.sync_hashprice,
+            "difficulty": history.sync_difficulty,
+        }
+        self._values = {}  # source -> last good value
+        self._updated = {}  # source -> time of last good fetch
+        self._attempted = {}  # source -> time of last attempt (good or not)
+        self._errors = {}  # source -> last error message
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="market-refresher", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _due_in(self, source: str, now: float) -> float:
+        attempted = self._attempted.get(source)
+        if attempted is None:
+            return 0.0
+        wait = self.retry_after if source in self._errors else self.ttl
+        return attempted + wait - now
+
+    def refresh_due(self):
+        """Fetch every source that is due. Runs on the worker thread; callable directly in batch jobs."""
+        for source in self._fetchers:
+            with self._lock:
+                due = self._due_in(source, time.time()) <= 0
+            if due:
+                self.refresh(source)
+
+    def refresh(self, source: str):
+        started = time.time()
+        try:
+            value = self._fetchers[source]()
+        except Exception as e:
+            with self._lock:
+                self._attempted[source] = started
+                self._errors[source] = str(e)
+            return
+        with self._lock:
+            self._values[source] = value
+            self._updated[source] = time.time()
+            self._attempted[source] = started
+            self._errors.pop(source, None)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh_due()
+            with self._lock:
+                now = time.time()
+                wait = min((self._due_in(s, now) for s in self._fetchers), default=self.ttl)
+            self._wake.wait(timeout=max(wait, 1.0))
+            self._wake.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values without blocking, plus age (seconds, None if never fetched),
+        staleness and last error per source. Asking for a stale snapshot wakes the
+        worker so the next one is fresh.
+        """
+        now = time.time()
+        with self._lock:
+            snap = {source: self._values.get(source) for source in self._fetchers}
+            age = {s: (now - self._updated[s]) if s in self._updated else None for s in self._fetchers}
+            snap["age_seconds"] = age
+            snap["stale"] = {s: age[s] is None or age[s] > self.ttl for s in self._fetchers}
+            snap["errors"] = dict(self._errors)
+        if any(snap["stale"].values()):
+            self._wake.set()
+        return snap
+
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_refresher() -> MarketRefresher:
+    """Process-wide refresher, started on first use and shared by every session."""
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = MarketRefresher().start()
+        return _refresher
@@ -0,0 +1,193 @@
+#miner_catalog.py
+# In-memory miner catalog with a hash index on normalized (manufacturer, model),
+# so lookups and duplicate checks are O(1) instead of a scan over the frame.
+# An optional trigram index resolves scraped / misspelled names.
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+# Brand words scraped names often lead with but catalog models may not carry
+BRAND_PREFIXES = {
+    "antminer", "auradine", "avalon", "avalonminer", "bitdeer", "bitmain", "canaan", "ebang", "ebit", "goldshell",
+    "iceriver", "innosilicon", "jasminer", "microbt", "sealminer", "teraflux", "whatsminer",
+}
+
+
+def normalize_name(value) -> str:
+    """Lowercase, trim and collapse whitespace; missing values become ''."""
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return re.sub(r"\s+", " ", str(value).strip().lower())
+
+
+def fuzzy_key(value) -> str:
+    """
+    normalize_name without leading brand words, separators or punctuation other
+    than "+": "Antminer S-21" and "S21" both give "s21", "S21+" stays "s21+".
+    """
+    words = [w for w in re.split(r"[^a-z0-9+]+", normalize_name(value)) if w]
+    while len(words) > 1 and words[0] in BRAND_PREFIXES:
+        words.pop(0)
+    return "".join(words)
+
+
+def _trigrams(name: str) -> set:
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MinerCatalog:
+    """
+    Wraps a normalized miner DataFrame (columns "model" and, optionally,
+    "manufacturer"). Rows are addressed by position; upserts of new miners go to
+    a pending list and are folded into the frame when frame() is called.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, fuzzy: bool = False):
+        self._base = (df if df is not None else pd.DataFrame(columns=["model", "manufacturer"])).reset_index(drop=True)
+        self._pending = []  # new rows (dicts) not yet in _base
+        self._updates = {}  # base position -> dict of changed fields
+        self._index = {}  # (manufacturer, model) -> position
+        self._by_model = {}  # model -> first position, for lookups without a manufacturer
+        self._trigram_index = None
+        self._fuzzy_keys = []  # position -> fuzzy_key(model), for the fuzzy index
+        self._by_key = {}  # fuzzy key -> first position
+
+        models = self._base["model"] if "model" in self._base.columns else pd.Series([""] * len(self._base))
+        makers = self._base["manufacturer"] if "manufacturer" in self._base.columns else pd.Series([""] * len(self._base))
+        for pos, (maker, model) in enumerate(zip(makers.map(normalize_name), models.map(normalize_name))):
+            self._register(pos, maker, model)
+
+        if fuzzy:
+            self._build_fuzzy_index()
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._pending)
+
+    def _register(self, pos: int, maker: str, model: str):
+        self._index[(maker, model)] = pos
+        self._by_model.setdefault(model, pos)
+        key = fuzzy_key(model)
+        self._fuzzy_keys.append(key)
+        self._by_key.setdefault(key, pos)
+        if self._trigram_index is not None:
+            for gram in _trigrams(key):
+                self._trigram_index[gram].add(pos)
+
+    def _build_fuzzy_index(self):
+        self._trigram_index = defaultdict(set)
+        for pos, key in enumerate(self._fuzzy_keys):
+            for gram in _trigrams(key):
+                self._trigram_index[gram].add(pos)
+
+    def position(self, model, manufacturer=None) -> Optional[int]:
+        model = normalize_name(model)
+        if manufacturer is None:
+            return self._by_model.get(model)
+        return self._index.get((normalize_name(manufacturer), model))
+
+    def row(self, pos: int) -> Dict[str, Any]:
+        if pos < len(self._base):
+            row = self._base.iloc[pos].to_dict()
+            row.update(self._updates.get(pos, {}))
+            return row
+        return dict(self._pending[pos - len(self._base)])
+
+    def lookup(self, model, manufacturer=None) -> Optional[Dict[str, Any]]:
+        """Row for an exact (normalized) name, or None. Without a manufacturer, the first row with that model."""
+        pos = self.position(model, manufacturer)
+        return None if pos is None else self.row(pos)
+
+    def fuzzy_lookup(self, name, cutoff: float = 0.5) -> Optional[Dict[str, Any]]:
+        """
+        Closest model for a scraped name: an exact name, then an equal fuzzy_key,
+        then the best trigram similarity of fuzzy keys (Jaccard >= cutoff).
+        """
+        pos = self._by_model.get(normalize_name(name))
+        if pos is None:
+            key = fuzzy_key(name)
+            if not key:
+                return None
+            pos = self._by_key.get(key)
+        if pos is not None:
+            return self.row(pos)
+        if self._trigram_index is None:
+            self._build_fuzzy_index()
+
+        grams = _trigrams(key)
+        shared = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_index.get(gram, ()):
+                shared[candidate] += 1
+        best, best_score = None, cutoff
+        for candidate, overlap in shared.items():
+            score = overlap / (len(grams) + len(_trigrams(self._fuzzy_keys[candidate])) - overlap)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return None if best is None else self.row(best)
+
+    def upsert(self, row: Dict[str, Any]) -> bool:
+        """Insert or update one miner by (manufacturer, model). Returns True if it was new."""
+        key = (normalize_name(row.get("manufacturer")), normalize_name(row.get("model")))
+        pos = self._index.get(key)
+        if pos is None:
+            self._pending.append(dict(row))
+            self._register(len(self) - 1, *key)
+            return True
+        if pos < len(self._base):
+            self._updates.setdefault(pos, {}).update(row)
+        else:
+            self._pending[pos - len(self._base)].update(row)
+        return False
+
+    def merge(self, df: pd.DataFrame) -> int:
+        """
+        Bulk upsert of many rows in one call (later rows win on duplicate keys).
+        Returns the number of new miners added.
+        """
+        if df.empty:
+            return 0
+        base = self.frame()
+        df = df.reset_index(drop=True)
+        makers = df["manufacturer"].map(normalize_name) if "manufacturer" in df.columns else pd.Series([""] * len(df))
+        models = df["model"].map(normalize_name)
+        keys = pd.Series(list(zip(makers, models)))
+        last = ~keys.duplicated(keep="last")
+        df = df[last.to_numpy()].reset_index(drop=True)
+        keys = keys[last].reset_index(drop=True)
+        positions = keys.map(self._index)
+
+        existing = positions.notna().to_numpy()
+        if existing.any():
+            rows = positions[existing].astype(int).to_numpy()
+            for col in df.columns:
+                if col not in base.columns:
+                    base[col] = pd.NA
+                base.iloc[rows, base.columns.get_loc(col)] = df.loc[existing, col].to_numpy()
+
+        new = df[~existing]
+        if len(new):
+            start = len(base)
+            base = pd.concat([base, new], ignore_index=True)
+            for offset, key in enumerate(keys[~existing]):
+                self._register(start + offset, *key)
+        self._base = base
+        return len(new)
+
+    def frame(self) -> pd.DataFrame:
+        """The catalog as a DataFrame, with pending inserts and updates applied."""
+        if self._updates:
+            base = self._base.copy()
+            for pos, changes in self._updates.items():
+                for col, value in changes.items():
+                    if col not in base.columns:
+                        base[col] = pd.NA
+                    base.iat[pos, base.columns.get_loc(col)] = value
+            self._base, self._updates = base, {}
+        if self._pending:
+            self._base = pd.concat([self._base, pd.DataFrame(self._pending)], ignore_index=True)
+            self._pending = []
+        return self._base
@@ -1,25 +1,59 @@
 #miner_data.py
 #Manually upload miner data from CSV file
 
+import io
 import os
 import pandas as pd
+from data import miner_store
+from data.miner_catalog import MinerCatalog
+from data.shared_store import shared_store
+from utils.pareto import ParetoFrontier
 from utils.cleaning import clean_and_normalize
 
 CSV_FILE = "Book123.csv"
 
-# --- Load CSV ---
+# --- Normalize a raw miner CSV for app usage ---
+def normalize_data(df):
+    df = clean_and_normalize(df)
+    if "hashrate" in df.columns:
+        df.rename(columns={"hashrate": "hashrate_ths"}, inplace=True)
+
+    if "power" in df.columns:
+        df["power_kw"] = df["power"] / 1000  # Convert W ➝ kW
+        df.drop(columns=["power"], inplace=True)
+    return df
+
+# --- The CSV stays the source of truth: re-import it when edited after the store's last write ---
+def refresh_store():
+    if miner_store.store_exists() and os.path.exists(CSV_FILE):
+        written = max(mtime for _, _, mtime in miner_store.store_signature())
+        if os.stat(CSV_FILE).st_mtime_ns > written:
+            miner_store.import_csv(CSV_FILE)
+
+# --- Load miners: columnar store if available (imported from the CSV on first use), else CSV ---
 def load_data():
+    refresh_store()
+    if miner_store.store_available():
+        if not miner_store.store_exists() and os.path.exists(CSV_FILE):
+            return miner_store.import_csv(CSV_FILE)
+        if miner_store.store_exists():
+            return miner_store.read_store()
     if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        df = clean_and_normalize(df)
-        # Normalize for app usage
-        if "hashrate" in df.columns:
-            df.rename(columns={"hashrate": "hashrate_ths"}, inplace=True)
-
-        if "power" in df.columns:
-            df["power_kw"] = df["power"] / 1000  # Convert W ➝ kW
-            df.drop(columns=["power"], inplace=True)
-        return df
+        return normalize_data(pd.read_csv(CSV_FILE))
+    else:
+        return read_raw_data(None)
+
+# --- Persist a full normalized miner table: catalog columns only, CSV first, then the store ---
+def save_data(df):
+    df = miner_store.catalog_columns(df)
+    df.to_csv(CSV_FILE, index=False)
+    if miner_store.store_available():
+        miner_store.write_store(df)  # written after the CSV, so it is not re-imported
+
+# --- Parse raw CSV bytes (file contents or an upload); None gives the empty template ---
+def read_raw_data(source: bytes = None):
+    if source is not None:
+        return pd.read_csv(io.BytesIO(source))
     else:
         return pd.DataFrame(columns=[
             "Model", "Manufacturer", "Hashrate (TH/s)", "Power (W)", "Efficiency (J/TH)",
@@ -27,10 +61,51 @@ def load_data():
             "Length (mm)", "Width (mm)", "Height (mm)", "Weight (kg)"
         ])
 
+# --- Indexed catalog over the current miner data, rebuilt only when the data on disk changes ---
+_catalog_cache = (None, None)
+
+def data_signature():
+    refresh_store()
+    if miner_store.store_exists():
+        return ("store", tuple(miner_store.store_signature()))
+    if os.path.exists(CSV_FILE):
+        stat = os.stat(CSV_FILE)
+        return ("csv", stat.st_size, stat.st_mtime_ns)
+    return None
+
+def get_catalog() -> MinerCatalog:
+    global _catalog_cache
+    signature = data_signature()
+    if _catalog_cache[0] != signature or _catalog_cache[1] is None:
+        _catalog_cache = (signature, MinerCatalog(load_data()))
+    return _catalog_cache[1]
+
+# --- Normalized miner table shared read-only by every session; sessions get zero-copy views ---
+def get_shared_data(key=None) -> pd.DataFrame:
+    # `key` identifies the data on disk (default: data_signature()); a new key loads it again
+    def build():
+        df = load_data()
+        if miner_store.store_exists() or os.path.exists(CSV_FILE):
+            return df
+        return normalize_data(df)  # nothing on disk: the empty template
+
+    return shared_store.view(("miners", data_signature() if key is None else key), build)
+
+# --- Pareto frontier of the scored catalog, kept up to date by update_csv ---
+_frontier_cache = None
+
+def get_frontier(df, key, metrics=None, band=10) -> ParetoFrontier:
+    # `key` identifies the market inputs behind df's profit columns; `metrics` scores rows added later
+    global _frontier_cache
+    frontier = _frontier_cache
+    if frontier is None or frontier.key != key or frontier.band < band or frontier.models != df["model"].tolist():
+        frontier = _frontier_cache = ParetoFrontier(df, band=band, metrics=metrics, key=key)
+    return frontier
+
 # --- Update CSV with new miner if not duplicate ---
 def update_csv(new_data: dict):
-    # Load existing data in original format
-    df = pd.read_csv(CSV_FILE) if os.path.exists(CSV_FILE) else pd.DataFrame()
+    global _catalog_cache
+    catalog = get_catalog()
 
     # Map normalized keys back to original CSV column names
     reverse_rename_map = {
@@ -49,19 +124,37 @@ def update_csv(new_data: dict):
     for k, v in new_data.items():
         new_key = reverse_rename_map.get(k.lower(), k)  # fallback to original key if no mapping
         # Convert power_kw (kW) back to Power (W)
-        if new_key == "Power (W)" and v is not None:
+        if k.lower() == "power_kw" and v is not None:
             v = v * 1000  # kW to W
         new_data_original_keys[new_key] = v
 
-    # If CSV is empty, create with columns from new_data keys
-    if df.empty:
-        df = pd.DataFrame(columns=new_data_original_keys.keys())
+    # Check for duplicates by Model and Manufacturer (case insensitive) via the hash index
+    if catalog.position(new_data_original_keys["Model"], new_data_original_keys.get("Manufacturer", "")) is not None:
+        return "⚠️ Miner already exists in CSV."
 
-    # Check for duplicates by Model and Manufacturer (case insensitive)
-    if not ((df["Model"].str.lower() == new_data_original_keys["Model"].lower()) & 
-            (df["Manufacturer"].str.lower() == new_data_original_keys["Manufacturer"].lower())).any():
-        df = pd.concat([df, pd.DataFrame([new_data_original_keys])], ignore_index=True)
-        df.to_csv(CSV_FILE, index=False)
-        return "✅ Added new miner to CSV."
-    else:
-        return "⚠️ Miner already exists in CSV."
\ No newline at end of file
+    new_row = pd.DataFrame([new_data_original_keys])
+    normalized_row = normalize_data(new_row.copy())
+    # Score the row for the frontier before writing, so a failure leaves the data unchanged
+    frontier = _frontier_cache if _frontier_cache is not None and _frontier_cache.metrics is not None else None
+    scored_row = frontier.scored(normalized_row) if frontier is not None else None
+    # The CSV first, then the store, so the store stays newer and is not re-imported
+    store = miner_store.store_exists()
+    if os.path.exists(CSV_FILE):
+        header = pd.read_csv(CSV_FILE, nrows=0).columns
+        # The CSV may use original or normalized column names; match whichever it has
+        fitting = max((new_row, normalized_row), key=lambda r: len(set(r.columns) & set(header)))
+        if set(fitting.columns) <= set(header):
+            # Append one line instead of rewriting the file
+            fitting.reindex(columns=header).to_csv(CSV_FILE, mode="a", header=False, index=False)
+        else:
+            pd.concat([pd.read_csv(CSV_FILE), fitting], ignore_index=True).to_csv(CSV_FILE, index=False)
+    elif not store:
+        new_row.to_csv(CSV_FILE, index=False)
+    if store:
+        miner_store.append_rows(normalized_row)
+
+    catalog.upsert(normalized_row.iloc[0].to_dict())
+    _catalog_cache = (data_signature(), catalog)
+    if frontier is not None:
+        frontier.add(normalized_row, scored=scored_row)
+    return "✅ Added new miner to CSV."
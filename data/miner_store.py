@@ -0,0 +1,140 @@
+#miner_store.py
+# Columnar on-disk miner catalog (Arrow IPC). Holds already-normalized, typed
+# columns so loads skip CSV parsing and regex cleaning. The store is a directory
+# of append-only segment files; reads memory-map every segment and stitch them
+# together without copying. CSV import/export is kept for compatibility.
+# Only catalog data is stored: columns the app derives from market inputs on
+# every run (revenue, profit, metrics) are dropped on write.
+
+import importlib.util
+import os
+
+import pandas as pd
+
+STORE_DIR = "miner_store"
+SEGMENT_PREFIX = "part-"
+SEGMENT_SUFFIX = ".arrow"
+
+# Written by the dashboard's revenue step and calculate_profitability_metrics
+DERIVED_COLUMNS = (
+    "daily_revenue", "daily_cost", "daily_profit", "margin_percent", "run_fraction", "effective_rate",
+    "daily_electric_cost", "break_even", "annual_profit", "irr_1yr", "ppi_1yr", "cpbm", "daily_btc_mined",
+)
+
+
+def store_available() -> bool:
+    # pyarrow is optional (data.miner_data falls back to the CSV file) and only
+    # imported when the store is actually read or written
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _arrow():
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    return pa, ipc
+
+
+def _segments(path: str) -> list:
+    if not os.path.isdir(path):
+        return []
+    return sorted(
+        name for name in os.listdir(path)
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def store_exists(path: str = STORE_DIR) -> bool:
+    return store_available() and bool(_segments(path))
+
+
+def catalog_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """`df` without DERIVED_COLUMNS."""
+    return df.drop(columns=[c for c in DERIVED_COLUMNS if c in df.columns])
+
+
+def store_signature(path: str = STORE_DIR) -> list:
+    """(segment, size, mtime) for every segment; changes whenever the store is written."""
+    signature = []
+    for name in _segments(path):
+        stat = os.stat(os.path.join(path, name))
+        signature.append((name, stat.st_size, stat.st_mtime_ns))
+    return signature
+
+
+def _to_table(df: pd.DataFrame):
+    pa, _ = _arrow()
+    # Mixed-type object columns (e.g. scraped strings next to numbers) are stored as strings
+    df = catalog_columns(df).reset_index(drop=True)
+    for col in df.columns:
+        if df[col].dtype == object:
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                df[col] = df[col].map(lambda v: None if pd.isna(v) else str(v))
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_segment(table, path: str, seq: int):
+    pa, ipc = _arrow()
+    os.makedirs(path, exist_ok=True)
+    final = os.path.join(path, f"{SEGMENT_PREFIX}{seq:06d}{SEGMENT_SUFFIX}")
+    tmp = final + ".tmp"
+    with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, final)
+
+
+def read_table(path: str = STORE_DIR):
+    """Memory-mapped Arrow table over all segments (no copy of the column buffers)."""
+    pa, ipc = _arrow()
+    tables = []
+    for name in _segments(path):
+        # The table keeps the mapping alive; closing it here would unmap the buffers
+        source = pa.memory_map(os.path.join(path, name), "r")
+        tables.append(ipc.open_file(source).read_all())
+    if not tables:
+        return pa.table({})
+    # Segments appended later may add columns or widen types
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def read_store(path: str = STORE_DIR) -> pd.DataFrame:
+    return read_table(path).to_pandas()
+
+
+def write_store(df: pd.DataFrame, path: str = STORE_DIR):
+    """Replace the store with `df` (already normalized) as a single segment."""
+    old = _segments(path)
+    next_seq = int(old[-1][len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1 if old else 0
+    _write_segment(_to_table(df), path, next_seq)
+    for name in old:
+        os.remove(os.path.join(path, name))
+
+
+def append_rows(df: pd.DataFrame, path: str = STORE_DIR):
+    """Append normalized rows as a new segment; existing segments are never rewritten."""
+    if df.empty:
+        return
+    old = _segments(path)
+    next_seq = int(old[-1][len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1 if old else 0
+    _write_segment(_to_table(df), path, next_seq)
+
+
+def compact(path: str = STORE_DIR):
+    """Merge all segments into one (appends leave one small file each)."""
+    if len(_segments(path)) > 1:
+        write_store(read_store(path), path)
+
+
+def import_csv(csv_path: str, path: str = STORE_DIR) -> pd.DataFrame:
+    """Parse and normalize a miner CSV once and store it; returns the normalized frame."""
+    from data.miner_data import normalize_data
+
+    df = normalize_data(pd.read_csv(csv_path))
+    write_store(df, path)
+    return df
+
+
+def export_csv(csv_path: str, path: str = STORE_DIR):
+    read_store(path).to_csv(csv_path, index=False)
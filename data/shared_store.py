@@ -0,0 +1,125 @@
+#shared_store.py
+# Process-wide read-only tables for multi-session deployments. Streamlit runs
+# every browser session in one process, so the normalized miner catalog and
+# common scenario results are kept once here as read-only column buffers.
+# Sessions get zero-copy DataFrame views: adding or replacing a column only
+# allocates that column for the session, and writing into a shared buffer
+# raises instead of leaking into other sessions.
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+import pandas as pd
+
+
+class SharedFrame:
+    """
+    A DataFrame frozen into one buffer per column: the NumPy buffers behind each
+    column (values, masks, category codes) are copied once and made read-only;
+    Arrow-backed columns (pandas' string dtype) are immutable already. view()
+    rebuilds a DataFrame over the same buffers without copying.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = list(df.columns)
+        self.index = df.index
+        self._arrays = []
+        for name in self.columns:
+            array = df[name].array.copy()  # own the buffers so the source frame can't change them
+            for attr in ("_ndarray", "_data", "_mask", "_codes"):
+                buffer = getattr(array, attr, None)
+                if isinstance(buffer, np.ndarray):
+                    buffer.flags.writeable = False
+            self._arrays.append(array)
+        self.attrs = dict(df.attrs)
+        self.nbytes = int(df.memory_usage(index=True, deep=True).sum())
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def view(self) -> pd.DataFrame:
+        df = pd.DataFrame(dict(zip(range(len(self.columns)), self._arrays)), index=self.index, copy=False)
+        df.columns = self.columns
+        df.attrs = dict(self.attrs)
+        return df
+
+
+class SharedStore:
+    """
+    Keyed SharedFrames, LRU-bounded by bytes. view(key, build) returns a view of
+    the stored table, running build() once per key even when several sessions
+    ask at the same time.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024**2):
+        self.max_bytes = max_bytes
+        self._frames = OrderedDict()  # key -> SharedFrame
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._building = {}  # key -> Event, for callers waiting on an in-flight build
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _insert(self, key: Hashable, frame: SharedFrame):
+        if key in self._frames:
+            self._bytes -= self._frames.pop(key).nbytes
+        if frame.nbytes > self.max_bytes:
+            return
+        self._frames[key] = frame
+        self._bytes += frame.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def get(self, key: Hashable):
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return frame.view()
+        return None
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> pd.DataFrame:
+        frame = SharedFrame(df)
+        with self._lock:
+            self._insert(key, frame)
+        return frame.view()
+
+    def view(self, key: Hashable, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        while True:
+            with self._lock:
+                frame = self._frames.get(key)
+                if frame is not None:
+                    self._frames.move_to_end(key)
+                    self.hits += 1
+                    return frame.view()
+                pending = self._building.get(key)
+                if pending is None:
+                    pending = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait()  # another session is building it; use its result
+        try:
+            return self.put(key, build())
+        finally:
+            with self._lock:
+                self._building.pop(key).set()
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self._frames), "bytes": self._bytes}
+
+
+# Process-wide default, shared by every Streamlit session
+shared_store = SharedStore()
@@ -0,0 +1,177 @@
+#batch.py
+# Headless batch runner: reads input sets from YAML / JSON / CSV, runs
+# simulate_all_scenarios over all of them in parallel and writes one results
+# table (Parquet or CSV). Needs only numpy and pandas, not streamlit.
+#
+#   python -m logic.batch runs.yaml -o results.parquet --workers 8
+#
+# An input file is a list of input sets, or {"defaults": {...}, "runs": [...]};
+# a CSV has one input set per row. Missing keys take the dashboard's defaults,
+# and each set may carry a "run_id" (or "name") that labels its result rows.
+# "tariff" may name an hourly tariff CSV (see utils/energy.py); "revenue_model"
+# may be "hashprice" or "replay" (see logic/hashprice.py).
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from logic.simulate import simulate_all_scenarios
+
+# Same defaults as the dashboard sidebar (logic/inputs.py)
+DEFAULT_INPUTS = {
+    "btc_price": 100_000.0,
+    "initial_investment": 100_000.0,
+    "electricity_rate": 0.01,
+    "years": 30,
+    "time_step": "yearly",
+    "network_hashrate_ehs": 1000.0,
+    "difficulty": 115.0e12,
+    "fees_btc": 0.025,
+    "btc_cagr": 15.0,
+    "miner_cost": 1000.0,
+    "miner_hashrate_ths": 100.0,
+    "miner_power_kw": 3.0,
+}
+INT_KEYS = {"years", "start_year"}
+FLOAT_KEYS = (set(DEFAULT_INPUTS) - INT_KEYS - {"time_step"}) | {"block_reward", "uptime", "curtail_above"}
+INPUT_ERROR = "input_error"  # set on input sets whose values could not be read; reported as that run's error
+
+
+def block_reward_for_year(start_year: int) -> float:
+    halvings_passed = max(0, (start_year - 2009) // 4)
+    return 50 / (2 ** halvings_passed)
+
+
+def complete_inputs(raw: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    One input set with defaults filled in, known numeric keys coerced (ValueError
+    naming the key if one is not a number), and block_reward derived from
+    start_year unless the set or its defaults give one. Other keys pass through.
+    """
+    inputs = dict(DEFAULT_INPUTS)
+    inputs["start_year"] = datetime.datetime.now().year + 1
+    inputs.update(defaults or {})
+    inputs.update({k: v for k, v in raw.items() if v is not None and not (isinstance(v, float) and v != v)})
+    for key, value in inputs.items():
+        try:
+            if key in INT_KEYS:
+                inputs[key] = int(value)
+            elif key in FLOAT_KEYS:
+                inputs[key] = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be a number, got {value!r}") from None
+    if "block_reward" not in inputs:
+        inputs["block_reward"] = block_reward_for_year(inputs["start_year"])
+    return inputs
+
+
+def _load_yaml(path: str):
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("Reading YAML input sets requires PyYAML (pip install pyyaml)") from e
+    with open(path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def read_input_sets(path: str) -> List[Dict[str, Any]]:
+    """Input sets from a .yaml/.yml, .json or .csv file, completed with defaults and labelled with run_id."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        doc = pd.read_csv(path).to_dict("records")
+    elif ext in (".yaml", ".yml"):
+        doc = _load_yaml(path)
+    elif ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+    else:
+        raise ValueError(f"Unsupported input file type: {path} (use .yaml, .yml, .json or .csv)")
+
+    defaults = {}
+    if isinstance(doc, dict):
+        defaults = doc.get("defaults", {})
+        doc = doc["runs"] if "runs" in doc else [{k: v for k, v in doc.items() if k != "defaults"}]
+    sets = []
+    base = os.path.splitext(os.path.basename(path))[0]
+    for i, raw in enumerate(doc):
+        try:
+            inputs = complete_inputs(raw, defaults)
+        except ValueError as e:
+            inputs = {INPUT_ERROR: f"ValueError: {e}"}
+        inputs["run_id"] = str(raw.get("run_id") or raw.get("name") or f"{base}-{i}")
+        sets.append(inputs)
+    return sets
+
+
+def _run_one(inputs: Dict[str, Any]):
+    # Module-level so it can be pickled for ProcessPoolExecutor
+    if INPUT_ERROR in inputs:
+        return inputs["run_id"], None, inputs[INPUT_ERROR]
+    try:
+        df = simulate_all_scenarios(inputs)
+    except Exception as e:
+        return inputs["run_id"], None, f"{type(e).__name__}: {e}"
+    df.insert(0, "run_id", inputs["run_id"])
+    return inputs["run_id"], df, None
+
+
+def run_batch(input_sets: List[Dict[str, Any]], max_workers: Optional[int] = None):
+    """
+    Simulate every input set. Returns (results, errors): one DataFrame of all
+    scenario rows with a leading run_id column, and {run_id: message} for sets
+    that failed. max_workers=1 runs in-process (no pool).
+    """
+    if max_workers == 1 or len(input_sets) <= 1:
+        outcomes = [_run_one(inputs) for inputs in input_sets]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(input_sets) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_run_one, input_sets, chunksize=chunksize))
+
+    frames = [df for _, df, _ in outcomes if df is not None]
+    errors = {run_id: error for run_id, _, error in outcomes if error is not None}
+    results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["run_id"])
+    return results, errors
+
+
+def write_results(df: pd.DataFrame, path: str):
+    """Write to .parquet (needs pyarrow) or .csv, chosen by extension."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        df.to_parquet(path, index=False)
+    elif ext == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported output file type: {path} (use .parquet or .csv)")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the scenario simulator over many input sets, without the UI")
+    parser.add_argument("inputs", nargs="+", help="input set files (.yaml, .yml, .json, .csv)")
+    parser.add_argument("-o", "--output", required=True, help="results file (.parquet or .csv)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--time-step", choices=["yearly", "monthly", "weekly", "daily"], help="override every set's time step")
+    args = parser.parse_args(argv)
+
+    input_sets = [inputs for path in args.inputs for inputs in read_input_sets(path)]
+    if args.time_step:
+        for inputs in input_sets:
+            inputs["time_step"] = args.time_step
+
+    results, errors = run_batch(input_sets, max_workers=args.workers)
+    write_results(results, args.output)
+    print(f"{len(input_sets) - len(errors)}/{len(input_sets)} runs, {len(results)} rows -> {args.output}")
+    for run_id, error in errors.items():
+        print(f"  {run_id}: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
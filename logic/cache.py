@@ -0,0 +1,170 @@
+#cache.py
+# Memoized simulation results, keyed on a canonical hash of the inputs that
+# actually reach the simulator. Works without Streamlit (batch jobs) and can
+# persist results to a local directory so they survive restarts.
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from data.shared_store import SharedFrame
+from logic.simulate import filter_simulate_inputs, simulate_all_scenarios
+from utils.graph import stable_hash
+
+
+def simulation_key(user_inputs: Dict[str, Any]) -> str:
+    """Hash of the filtered simulator inputs (plus time step); unrelated keys don't change it."""
+    inputs = filter_simulate_inputs(user_inputs)
+    inputs["time_step"] = user_inputs.get("time_step", "yearly")
+    return stable_hash(inputs)
+
+
+class SimulationCache:
+    """
+    LRU cache of simulate_all_scenarios results, bounded by entry count and bytes.
+
+    With `disk_dir` set, every result is also pickled there and memory misses fall
+    back to disk. The directory is held to the same limits: the least recently
+    used files go first, by modification time, which disk hits refresh.
+
+    Results are held once as read-only SharedFrames and returned as zero-copy
+    views: callers may add or replace columns (only their own view changes) but
+    writing into an existing column raises.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 256 * 1024**2, disk_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+        self._entries = OrderedDict()  # key -> SharedFrame
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def _insert(self, key: str, frame: SharedFrame):
+        if frame.nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).nbytes
+        self._entries[key] = frame
+        self._bytes += frame.nbytes
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            frame = self._entries.get(key)
+            if frame is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return frame.view()
+
+        # Disk reads happen outside the lock so one slow unpickle doesn't stall other callers
+        df = self._read_disk(key) if self.disk_dir else None
+        with self._lock:
+            if df is None:
+                self.misses += 1
+                return None
+            frame = self._entries.get(key)  # another thread may have inserted it meanwhile
+            if frame is None:
+                frame = SharedFrame(df)
+                self._insert(key, frame)
+            else:
+                self._entries.move_to_end(key)
+            self.disk_hits += 1
+            return frame.view()
+
+    def _read_disk(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._path(key)
+        try:
+            df = pd.read_pickle(path)
+        except Exception:
+            return None  # missing, unreadable or partial file: a miss
+        try:
+            os.utime(path)  # recently used: keep it when pruning
+        except OSError:
+            pass
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Store a result; returns a view of the stored copy."""
+        frame = SharedFrame(df)
+        with self._lock:
+            self._insert(key, frame)
+        if self.disk_dir:
+            # Write then rename so a crash never leaves a half-written entry
+            tmp = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            df.to_pickle(tmp)
+            os.replace(tmp, self._path(key))
+            self._prune_disk()
+        return frame.view()
+
+    def _prune_disk(self):
+        # Oldest files first until the directory is within max_entries and max_bytes
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # removed by another process
+                files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for count, (_, size, path) in zip(range(len(files), 0, -1), files):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def get_or_compute(self, user_inputs: Dict[str, Any], fn=simulate_all_scenarios) -> pd.DataFrame:
+        key = simulation_key(user_inputs)
+        df = self.get(key)
+        if df is None:
+            df = self.put(key, fn(user_inputs))
+        return df
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# Process-wide default, shared by every Streamlit session and batch caller
+simulation_cache = SimulationCache(disk_dir=os.environ.get("SIM_CACHE_DIR"))
+
+
+def cached_simulate_all_scenarios(user_inputs: Dict[str, Any], cache: Optional[SimulationCache] = None) -> pd.DataFrame:
+    return (cache or simulation_cache).get_or_compute(user_inputs)
@@ -0,0 +1,218 @@
+#engine.py
+# Array-based scenario engine. Computes every year of every scenario in one pass
+# with NumPy. logic.simulate.simulate_scenario is kept as the reference loop.
+
+import numpy as np
+import pandas as pd
+
+from utils.finance import irr as irr_solver
+
+SCENARIOS = ["HODL", "Miners Only", "BTC Loan", "Hybrid"]
+
+BLOCKS_PER_DAY = 144
+DAYS_PER_YEAR = 365
+HALVING_INTERVAL = 4
+NETWORK_GROWTH = 1.10
+FIRST_HALVING_YEAR = 2012
+
+
+def scenario_allocations(scenarios, initial_investment, btc_price, miner_cost):
+    # Same arithmetic as the reference so int() truncation lands on the same miner count
+    btc_held, loans, miners = [], [], []
+    zero = np.zeros_like(initial_investment)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for scenario in scenarios:
+            if scenario == "HODL":
+                held, loan, spend = initial_investment / btc_price, zero, zero
+            elif scenario == "Miners Only":
+                held, loan, spend = zero, zero, initial_investment
+            elif scenario == "BTC Loan":
+                held = initial_investment / btc_price
+                loan = 0.10 * initial_investment
+                spend = loan
+            elif scenario == "Hybrid":
+                half = initial_investment / 2
+                held = half / btc_price
+                loan = 0.10 * half
+                spend = half + loan
+            else:
+                raise ValueError(f"Unknown scenario: {scenario}")
+            btc_held.append(held)
+            loans.append(loan)
+            miners.append(np.trunc(spend / miner_cost))
+    return np.stack(btc_held, axis=-1), np.stack(loans, axis=-1), np.stack(miners, axis=-1)
+
+
+def simulate_scenarios_array(
+    initial_investment,
+    btc_price,
+    electricity_rate,
+    years: int,
+    miner_cost,
+    miner_hashrate_ths,
+    miner_power_kw,
+    network_hashrate_ehs,
+    btc_cagr,
+    start_year=2026,
+    difficulty=None,
+    fees_btc=0.025,
+    uptime=0.95,
+    block_reward=50.0,
+    scenarios=SCENARIOS,
+    price_factors=None,
+    hashrate_factors=None,
+    hashprice_btc=None,
+    run_fraction=1.0,
+) -> dict:
+    """
+    Vectorized equivalent of running simulate_scenario for each scenario.
+
+    Every parameter except `years` may be a scalar or an array; arrays are broadcast
+    together to a parameter shape P. Per-year outputs have shape (*P, S, Y) and
+    per-scenario summaries have shape (*P, S), where S = len(scenarios).
+    Values the reference returns as None come back as NaN.
+
+    `price_factors` and `hashrate_factors` (shape (..., Y)) override the fixed
+    paths: BTC price in year t is btc_price * price_factors[t-1] instead of
+    compounding btc_cagr, and network hashrate is network_hashrate_ehs *
+    hashrate_factors[t-1] instead of growing by NETWORK_GROWTH. Their leading
+    axes broadcast with the parameter shape (e.g. one row per Monte Carlo path).
+
+    `hashprice_btc` (shape (..., Y)) drives revenue from hashprice instead: BTC
+    earned per TH/s per day in each year (see logic.hashprice), times hashrate
+    and uptime. Difficulty and network hashrate are then unused.
+
+    `run_fraction` is the share of hours the miners run under an hourly tariff
+    (see utils.energy); it scales mining revenue on every path and energy cost.
+    """
+    years = int(years)
+    paths = [np.asarray(f, dtype=float) for f in (price_factors, hashrate_factors, hashprice_btc) if f is not None]
+    inv, price0, rate, cost, m_hash, m_power, net_ehs, cagr, start, fees, up, reward0, run, *_ = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (
+            initial_investment, btc_price, electricity_rate, miner_cost, miner_hashrate_ths,
+            miner_power_kw, network_hashrate_ehs, btc_cagr, start_year, fees_btc, uptime, block_reward, run_fraction,
+        )],
+        *[np.empty(f.shape[:-1]) for f in paths],
+    )
+    diff = np.full(inv.shape, np.nan) if difficulty is None else np.broadcast_to(
+        np.asarray(difficulty, dtype=float), inv.shape
+    )
+
+    def ps(a):  # parameter-shaped -> (*P, 1, 1), broadcasts against (S, Y)
+        return a[..., None, None]
+
+    btc_held0, loan, miner_count = scenario_allocations(scenarios, inv, price0, cost)
+    btc_held0, loan, miner_count = btc_held0[..., None], loan[..., None], miner_count[..., None]
+
+    year = np.arange(1, years + 1)
+    step = year - 1
+
+    # Halving schedule relative to the start year
+    calendar_year = start[..., None] + step
+    halvings = np.maximum(0, (calendar_year - FIRST_HALVING_YEAR) // HALVING_INTERVAL)
+    initial_halvings = np.maximum(0, (start - FIRST_HALVING_YEAR) // HALVING_INTERVAL)
+    reward = reward0[..., None] / 2.0 ** (halvings - initial_halvings[..., None])
+    reward = reward[..., None, :]  # (*P, 1, Y)
+
+    hashrate_ths = miner_count * ps(m_hash)
+    power_kw = miner_count * ps(m_power)
+    if hashrate_factors is None:
+        hashrate_factors = NETWORK_GROWTH ** step
+    network_hashrate_ths = ps(net_ehs) * 1_000_000 * np.asarray(hashrate_factors, dtype=float)[..., None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Difficulty path where a positive difficulty is given, otherwise share of network
+        daily_by_difficulty = (hashrate_ths * 1e12 * ps(up) * (reward + ps(fees)) * 86400) / (ps(diff) * 2**32)
+        share = np.where(network_hashrate_ths > 0, hashrate_ths / network_hashrate_ths, 0.0)
+        mined_by_share = share * BLOCKS_PER_DAY * reward * DAYS_PER_YEAR
+        use_difficulty = ps(diff) > 0
+        btc_mined = np.where(use_difficulty, daily_by_difficulty * DAYS_PER_YEAR, mined_by_share)
+        daily_btc_mined = np.where(use_difficulty, daily_by_difficulty, mined_by_share / 365)
+        if hashprice_btc is not None:
+            daily_btc_mined = hashrate_ths * ps(up) * np.asarray(hashprice_btc, dtype=float)[..., None, :]
+            btc_mined = daily_btc_mined * DAYS_PER_YEAR
+        btc_mined, daily_btc_mined = btc_mined * ps(run), daily_btc_mined * ps(run)
+
+        energy_cost = np.broadcast_to(power_kw * 24 * 365 * ps(rate) * ps(up) * ps(run), btc_mined.shape)
+        cumulative_energy_cost = energy_cost * year
+
+        btc_held = btc_held0 + np.cumsum(btc_mined, axis=-1)
+        if price_factors is None:
+            growth = np.broadcast_to(1 + ps(cagr) / 100, (*inv.shape, 1, years))
+            price = ps(price0) * np.cumprod(growth, axis=-1)
+        else:
+            price = ps(price0) * np.asarray(price_factors, dtype=float)[..., None, :]
+
+        value_of_holdings = btc_held * price
+        roi = value_of_holdings - ps(inv) - cumulative_energy_cost - loan
+        cagr_pct = ((value_of_holdings / ps(inv)) ** (1 / year) - 1) * 100
+        cagr_pct = np.where(ps(inv) != 0, cagr_pct, np.nan)
+
+        # Long-term metrics; yearly cashflow equals ROI for every scenario
+        cumulative_cash = np.cumsum(roi, axis=-1)
+        inv_s = inv[..., None]
+        reached = np.concatenate(
+            [np.broadcast_to((0 >= inv_s)[..., None], (*roi.shape[:-1], 1)), cumulative_cash >= inv_s[..., None]],
+            axis=-1,
+        )
+        months_to_breakeven = np.where(reached.any(axis=-1), reached.argmax(axis=-1) * 12.0, np.nan)
+
+        total_profit = roi.sum(axis=-1)
+        ppi = np.where(inv_s > 0, total_profit / inv_s, np.nan)
+        annual_profit = total_profit / years
+
+    # IRR over [-investment, yearly cashflow...], as in the reference
+    cashflows = np.concatenate([np.broadcast_to(-ps(inv), (*roi.shape[:-1], 1)), roi], axis=-1)
+    irr = irr_solver(cashflows) * 100
+
+    hodl = np.array([s == "HODL" for s in scenarios])
+    irr, months_to_breakeven, ppi, annual_profit = (
+        np.where(hodl, np.nan, a) for a in (irr, months_to_breakeven, ppi, annual_profit)
+    )
+
+    return {
+        "scenarios": list(scenarios),
+        "year": year,
+        "calendar_year": calendar_year,
+        "reward": reward[..., 0, :],
+        "btc_price": price,
+        "btc_held": btc_held,
+        "btc_mined": btc_mined,
+        "daily_btc_mined": daily_btc_mined,
+        "energy_cost": energy_cost,
+        "roi": roi,
+        "cagr": cagr_pct,
+        "irr": irr,
+        "cpbm_months": months_to_breakeven,
+        "ppi": ppi,
+        "annual_profit": annual_profit,
+    }
+
+
+def scenarios_to_frame(result: dict) -> pd.DataFrame:
+    """Long DataFrame in the layout of simulate_all_scenarios, for a single parameter set."""
+    scenarios = result["scenarios"]
+    n_scenarios, n_years = len(scenarios), len(result["year"])
+
+    def per_year(key):
+        return np.broadcast_to(result[key], (n_scenarios, n_years)).ravel()
+
+    def per_scenario(key):
+        return np.repeat(result[key], n_years)
+
+    return pd.DataFrame({
+        "Year": np.tile(result["year"], n_scenarios),
+        "Scenario": np.repeat(scenarios, n_years),
+        "BTC Price": per_year("btc_price"),
+        "BTC Held": per_year("btc_held"),
+        "btc_mined": per_year("btc_mined"),
+        "daily_btc_mined": per_year("daily_btc_mined"),
+        "Energy Cost ($)": per_year("energy_cost"),
+        "ROI ($)": per_year("roi"),
+        "CAGR (%)": per_year("cagr"),
+        "Calendar Year": np.tile(result["calendar_year"], n_scenarios).astype(int),
+        "IRR (%)": per_scenario("irr"),
+        "CPBM (Months)": per_scenario("cpbm_months"),
+        "PPI": per_scenario("ppi"),
+        "Annual Profit": per_scenario("annual_profit"),
+    })
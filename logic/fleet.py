@@ -0,0 +1,240 @@
+#fleet.py
+# Fleet simulator: many miner models bought in tranches, each with its own
+# purchase and retirement date. Storage is structure-of-arrays (one entry per
+# tranche, specs per SKU) and the time axis is built with bincount, so cost
+# scales with tranches + SKUs x steps, never with individual machines.
+
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from data.miner_catalog import MinerCatalog, normalize_name
+from logic.engine import NETWORK_GROWTH
+from logic.timestep import (
+    ANCHOR_DATE, ANCHOR_HEIGHT, BLOCKS_PER_DAY, DAYS_PER_YEAR, STEPS_PER_YEAR, block_height_at, cumulative_subsidy,
+)
+
+TRANCHE_COLUMNS = ("model", "count", "purchase_date", "retirement_date")
+
+
+class Fleet:
+    """
+    Tranches as parallel arrays plus a SKU table:
+
+        sku_index[i], count[i], purchase_day[i], retire_day[i], unit_cost[i]   per tranche
+        skus[j], hashrate_ths[j], power_kw[j]                                 per SKU
+
+    Days are datetime64[D]; a tranche without a retirement date never retires.
+    """
+
+    def __init__(self, skus, hashrate_ths, power_kw, sku_index, count, purchase_day, retire_day, unit_cost):
+        self.skus = list(skus)
+        self.hashrate_ths = np.asarray(hashrate_ths, dtype=np.float64)
+        self.power_kw = np.asarray(power_kw, dtype=np.float64)
+        self.sku_index = np.asarray(sku_index, dtype=np.int64)
+        self.count = np.asarray(count, dtype=np.int64)
+        self.purchase_day = np.asarray(purchase_day, dtype="datetime64[D]")
+        self.retire_day = np.asarray(retire_day, dtype="datetime64[D]")
+        self.unit_cost = np.asarray(unit_cost, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    @property
+    def machines(self) -> int:
+        return int(self.count.sum())
+
+    @classmethod
+    def from_tranches(cls, tranches: Union[pd.DataFrame, Iterable], catalog: Union[MinerCatalog, pd.DataFrame, None] = None) -> "Fleet":
+        """
+        Build a fleet from (model, count, purchase_date, retirement_date) rows: a
+        DataFrame, dicts or tuples. Optional columns: "manufacturer" (to tell models
+        apart) and "unit_cost" (price paid; defaults to the catalog cost). Specs come
+        from the catalog, looked up once per SKU.
+        """
+        if catalog is None:
+            from data.miner_data import get_catalog
+
+            catalog = get_catalog()
+        elif isinstance(catalog, pd.DataFrame):
+            catalog = MinerCatalog(catalog)
+
+        df = tranches if isinstance(tranches, pd.DataFrame) else pd.DataFrame(
+            [t if isinstance(t, dict) else dict(zip(TRANCHE_COLUMNS, t)) for t in tranches]
+        )
+        if "retirement_date" not in df.columns:
+            df["retirement_date"] = pd.NaT
+        if "manufacturer" in df.columns:
+            makers = df["manufacturer"].map(normalize_name)
+        else:
+            makers = pd.Series([""] * len(df), index=df.index)
+        keys = makers + "\x00" + df["model"].map(normalize_name)
+        sku_index, _ = pd.factorize(keys)
+
+        first = pd.Series(np.arange(len(df))).groupby(sku_index).first().to_numpy()
+        specs, missing = [], []
+        for row in first:
+            maker = df["manufacturer"].iloc[row] if "manufacturer" in df.columns else None
+            spec = catalog.lookup(df["model"].iloc[row], maker)
+            if spec is None:
+                missing.append(df["model"].iloc[row])
+            specs.append(spec)
+        if missing:
+            raise KeyError(f"Models not in the miner catalog: {', '.join(map(str, missing))}")
+
+        catalog_cost = np.array([float(s.get("cost", np.nan)) for s in specs])[sku_index]
+        unit_cost = catalog_cost
+        if "unit_cost" in df.columns:
+            unit_cost = df["unit_cost"].astype(float).fillna(pd.Series(catalog_cost, index=df.index)).to_numpy()
+        never = np.datetime64("9999-12-31")
+        return cls(
+            skus=[str(df["model"].iloc[row]) for row in first],
+            hashrate_ths=[float(s["hashrate_ths"]) for s in specs],
+            power_kw=[float(s["power_kw"]) for s in specs],
+            sku_index=sku_index,
+            count=df["count"].to_numpy(dtype=np.int64),
+            purchase_day=pd.to_datetime(df["purchase_date"]).to_numpy().astype("datetime64[D]"),
+            retire_day=pd.to_datetime(df["retirement_date"]).fillna(pd.Timestamp(never)).to_numpy().astype("datetime64[D]"),
+            unit_cost=unit_cost,
+        )
+
+
+def _per_step(sku_index, weight, day, n_skus, n_steps, step_days):
+    """
+    (n_skus, n_steps) unit-steps switched on at `day` (days from the start):
+    a fraction of the step it falls in, then 1 for every later step.
+    """
+    day = np.clip(day, 0.0, None)
+    step = np.floor(day / step_days).astype(np.int64)
+    inside = step < n_steps
+    step, day, sku, weight = step[inside], day[inside], sku_index[inside], weight[inside]
+    fraction = ((step + 1) * step_days - day) / step_days
+    width = n_steps + 1
+    full = np.bincount(sku * width + step + 1, weights=weight, minlength=n_skus * width).reshape(n_skus, width)
+    partial = np.bincount(sku * width + step, weights=weight * fraction, minlength=n_skus * width).reshape(n_skus, width)
+    return (np.cumsum(full, axis=1) + partial)[:, :n_steps]
+
+
+def simulate_fleet(
+    fleet: Fleet,
+    start_date,
+    years: int,
+    btc_price: float,
+    btc_cagr: float,
+    electricity_rate: float,
+    network_hashrate_ehs: float,
+    difficulty: Optional[float] = None,
+    fees_btc: float = 0.025,
+    uptime: float = 0.95,
+    time_step: str = "monthly",
+    network_growth: float = NETWORK_GROWTH,
+) -> Dict[str, Any]:
+    """
+    Output of every SKU and of the whole fleet over `years` from `start_date`.
+
+    Uses the network model of logic.timestep (block-height halvings, difficulty
+    retargets, network hashrate growth). Machines earn and draw power only while
+    active; partial steps are prorated. Capex is booked in the purchase step
+    (purchases before `start_date` are sunk and not counted; tranches retired by
+    their purchase date are ignored).
+
+    Per-SKU arrays have shape (n_skus, n_steps); the "total" entry holds the fleet
+    sums (n_steps,) plus cumulative profit.
+    """
+    if time_step not in STEPS_PER_YEAR:
+        raise ValueError(f"time_step must be one of {', '.join(STEPS_PER_YEAR)}")
+    step_days = DAYS_PER_YEAR / STEPS_PER_YEAR[time_step]
+    n_steps = int(years) * STEPS_PER_YEAR[time_step]
+    n_skus = len(fleet.skus)
+    start = np.datetime64(pd.Timestamp(start_date).date(), "D")
+
+    t_edges = np.arange(n_steps + 1) * step_days
+    t_mid = t_edges[:-1] + step_days / 2
+
+    # Active machines per SKU and step (time-weighted), from purchase/retirement events
+    purchase = (fleet.purchase_day - start).astype(np.float64)
+    retire = (np.maximum(fleet.retire_day, fleet.purchase_day) - start).astype(np.float64)
+    count = fleet.count.astype(np.float64)
+    units = (_per_step(fleet.sku_index, count, purchase, n_skus, n_steps, step_days)
+             - _per_step(fleet.sku_index, count, retire, n_skus, n_steps, step_days))
+
+    # Network: BTC earned per TH/s per step
+    start_height = max(0.0, ANCHOR_HEIGHT + float((start - ANCHOR_DATE).astype(np.int64)) * BLOCKS_PER_DAY)
+    heights = block_height_at(t_edges, start_height, network_growth)
+    paid = np.diff(cumulative_subsidy(heights)) + fees_btc * np.diff(heights)
+    network_hs0 = difficulty * 2**32 / 600 if difficulty else network_hashrate_ehs * 1e18
+    network_hs = network_hs0 * network_growth ** (t_mid / DAYS_PER_YEAR)
+    btc_per_th = uptime * paid * 1e12 / network_hs
+
+    price = btc_price * (1 + btc_cagr / 100) ** (t_mid / DAYS_PER_YEAR)
+
+    hashrate_ths = units * fleet.hashrate_ths[:, None]
+    power_kw = units * fleet.power_kw[:, None]
+    btc_mined = hashrate_ths * btc_per_th
+    revenue = btc_mined * price
+    energy_cost = power_kw * 24 * step_days * electricity_rate * uptime
+
+    # Tranches retired on or before their purchase day are never active, so buy nothing
+    in_window = (purchase >= 0) & (purchase < n_steps * step_days) & (fleet.retire_day > fleet.purchase_day)
+    capex_step = np.floor(purchase[in_window] / step_days).astype(np.int64)
+    capex = np.bincount(
+        fleet.sku_index[in_window] * n_steps + capex_step,
+        weights=(count * fleet.unit_cost)[in_window], minlength=n_skus * n_steps,
+    ).reshape(n_skus, n_steps)
+    profit = revenue - energy_cost - capex
+
+    total = {key: value.sum(axis=0) for key, value in (
+        ("units", units), ("hashrate_ths", hashrate_ths), ("power_kw", power_kw), ("btc_mined", btc_mined),
+        ("revenue", revenue), ("energy_cost", energy_cost), ("capex", capex), ("profit", profit),
+    )}
+    total["cumulative_profit"] = np.cumsum(total["profit"])
+
+    return {
+        "skus": fleet.skus,
+        "step_start": start + np.round(t_edges[:-1]).astype("timedelta64[D]"),
+        "btc_price": price,
+        "btc_per_th": btc_per_th,
+        "units": units,
+        "hashrate_ths": hashrate_ths,
+        "power_kw": power_kw,
+        "btc_mined": btc_mined,
+        "revenue": revenue,
+        "energy_cost": energy_cost,
+        "capex": capex,
+        "profit": profit,
+        "total": total,
+    }
+
+
+def fleet_to_frame(result: Dict[str, Any], per_model: bool = True) -> pd.DataFrame:
+    """Long DataFrame: one row per (model, step), or per step for the whole fleet."""
+    fields = ("units", "hashrate_ths", "power_kw", "btc_mined", "revenue", "energy_cost", "capex", "profit")
+    if not per_model:
+        df = pd.DataFrame({"date": result["step_start"], "btc_price": result["btc_price"]})
+        for field in fields + ("cumulative_profit",):
+            df[field] = result["total"][field]
+        return df
+
+    n_skus, n_steps = result["units"].shape
+    df = pd.DataFrame({
+        "model": np.repeat(result["skus"], n_steps),
+        "date": np.tile(result["step_start"], n_skus),
+        "btc_price": np.tile(result["btc_price"], n_skus),
+    })
+    for field in fields:
+        df[field] = result[field].ravel()
+    return df
+
+
+def model_summary(result: Dict[str, Any]) -> pd.DataFrame:
+    """Per-model totals over the whole run, most profitable first."""
+    return pd.DataFrame({
+        "model": result["skus"],
+        "machine_steps": result["units"].sum(axis=1),
+        "btc_mined": result["btc_mined"].sum(axis=1),
+        "revenue": result["revenue"].sum(axis=1),
+        "energy_cost": result["energy_cost"].sum(axis=1),
+        "capex": result["capex"].sum(axis=1),
+        "profit": result["profit"].sum(axis=1),
+    }).sort_values("profit", ascending=False, ignore_index=True)
@@ -0,0 +1,136 @@
+#hashprice.py
+# Hashprice-driven revenue for the scenario engines. Both engines take
+# `hashprice_btc`, the BTC earned per TH/s per day in each step; this module
+# builds that path either by replaying the stored hashprice history (converted
+# to BTC with the stored daily closes) or by projecting the current hashprice
+# through halvings and network growth. The daily history is loaded once per
+# process and reused until the store grows, so sweeps and batch runs share it.
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data.market_history import DAY_MS, MarketHistory, get_history
+from logic.engine import NETWORK_GROWTH
+from logic.timestep import (
+    BLOCKS_PER_DAY, DAYS_PER_YEAR, HALVING_BLOCKS, INITIAL_SUBSIDY, MAX_HALVINGS, STEPS_PER_YEAR, estimate_block_height,
+)
+
+REVENUE_MODELS = ("network", "hashprice", "replay")
+
+_daily_cache = {}  # history path -> (record counts, (days, btc_per_th_day))
+_daily_lock = threading.Lock()
+
+
+def daily_hashprice_btc(history: Optional[MarketHistory] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stored hashprice as (days, BTC per TH/s per day): daily means of the USD
+    snapshots divided by that day's BTC close (or the latest close before it).
+    Days before the first stored close are dropped. Cached until a series grows.
+    """
+    history = history or get_history()
+    hashprice, prices = history.hashprice.read(), history.btc_price.read()
+    version = (len(hashprice), len(prices))
+    with _daily_lock:
+        cached = _daily_cache.get(history.path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    days, inverse = np.unique(hashprice["t"] // DAY_MS, return_inverse=True)
+    usd = np.bincount(inverse, weights=hashprice["v"], minlength=len(days)) / np.bincount(inverse, minlength=len(days))
+    close = np.searchsorted(prices["t"] // DAY_MS, days, side="right") - 1
+    known = close >= 0
+    days, usd, close = days[known], usd[known], close[known]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        btc = usd / prices["v"][close]
+    valid = np.isfinite(btc) & (btc > 0)
+    result = (days[valid].astype("datetime64[D]"), btc[valid])
+    with _daily_lock:
+        _daily_cache[history.path] = (version, result)
+    return result
+
+
+def import_hashprice_csv(path: str, history: Optional[MarketHistory] = None) -> int:
+    """
+    Append a hashprice export (a "date" or "timestamp" column and a USD per
+    TH/s per day column) to the stored history; returns records written.
+    """
+    history = history or get_history()
+    df = pd.read_csv(path)
+    time_column = next((c for c in df.columns if str(c).strip().lower() in ("date", "timestamp", "time")), df.columns[0])
+    value_column = next((c for c in df.columns if "usd" in str(c).lower()), df.select_dtypes("number").columns[-1])
+    t = pd.to_datetime(df[time_column], utc=True)
+    timestamps = ((t - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(milliseconds=1)).to_numpy(dtype=np.int64)
+    return history.hashprice.append(timestamps, df[value_column].astype(float).to_numpy())
+
+
+def _step_means(daily: np.ndarray, years: int, time_step: str) -> np.ndarray:
+    # Mean of a daily series over each step of the run (yearly or STEPS_PER_YEAR)
+    steps_per_year = 1 if time_step == "yearly" else STEPS_PER_YEAR[time_step]
+    step = np.floor(np.arange(len(daily)) / (DAYS_PER_YEAR / steps_per_year)).astype(np.int64)
+    n_steps = years * steps_per_year
+    return np.bincount(step, weights=daily, minlength=n_steps)[:n_steps] / np.bincount(step, minlength=n_steps)[:n_steps]
+
+
+def projected_hashprice(
+    hashprice_btc0: float,
+    n_days: int,
+    start_year: int,
+    fees_btc: float = 0.0,
+    network_growth: float = NETWORK_GROWTH,
+    start_height: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Daily BTC per TH/s per day from today's value: scaled by subsidy plus fees
+    per block (halving at its block height, 144 blocks a day) over the starting
+    value, and divided by network hashrate growth.
+    """
+    t = np.arange(n_days) + 0.5
+    h0 = float(estimate_block_height(start_year)) if start_height is None else start_height
+    era = np.minimum(np.floor((h0 + BLOCKS_PER_DAY * np.concatenate([[0.0], t])) / HALVING_BLOCKS), MAX_HALVINGS)
+    per_block = np.where(era < MAX_HALVINGS, INITIAL_SUBSIDY * 2.0**-era, 0.0) + fees_btc
+    return hashprice_btc0 * per_block[1:] / per_block[0] / network_growth ** (t / DAYS_PER_YEAR)
+
+
+def hashprice_path(user_inputs: Dict[str, Any], history: Optional[MarketHistory] = None) -> np.ndarray:
+    """
+    `hashprice_btc` for the engines from user_inputs["revenue_model"]:
+
+    - "hashprice": project usd_per_th_per_day / btc_price forward
+    - "replay": replay the stored history from "replay_start" (a date; default
+      the first stored day), then project from the mean of its last 30 days
+
+    One value per step of user_inputs["time_step"].
+    """
+    model = user_inputs.get("revenue_model", "network")
+    if model not in REVENUE_MODELS[1:]:
+        raise ValueError(f"revenue_model must be one of {', '.join(REVENUE_MODELS[1:])} for a hashprice path")
+    years = int(user_inputs["years"])
+    n_days = years * DAYS_PER_YEAR
+    start_year = int(user_inputs.get("start_year", 2026))
+    fees = user_inputs.get("fees_btc", 0.0) or 0.0
+
+    if model == "hashprice":
+        usd = user_inputs.get("usd_per_th_per_day")
+        if not usd:
+            raise ValueError("revenue_model 'hashprice' needs usd_per_th_per_day")
+        daily = projected_hashprice(usd / user_inputs["btc_price"], n_days, start_year, fees)
+    else:
+        days, btc = daily_hashprice_btc(history)
+        if user_inputs.get("replay_start"):
+            keep = days >= np.datetime64(pd.Timestamp(user_inputs["replay_start"]).date(), "D")
+            days, btc = days[keep], btc[keep]
+        if not len(days):
+            raise ValueError("No stored hashprice history to replay")
+        # Calendar days from the first replayed day; gaps carry the previous value
+        offset = (days - days[0]).astype(np.int64)
+        offset = offset[offset < n_days]
+        replayed = btc[np.searchsorted(offset, np.arange(min(n_days, offset[-1] + 1)), side="right") - 1]
+        tail = projected_hashprice(
+            float(np.mean(replayed[-30:])), n_days - len(replayed), start_year, fees,
+            start_height=float(estimate_block_height(start_year)) + BLOCKS_PER_DAY * len(replayed),
+        )
+        daily = np.concatenate([replayed, tail])
+    return _step_means(daily, years, user_inputs.get("time_step", "yearly"))
@@ -5,10 +5,8 @@ import streamlit as st
 import pandas as pd
 import datetime
 
-for key in st.session_state.keys():
-    del st.session_state[key]
-
-def get_user_inputs(df_miners: pd.DataFrame, live_btc_price: Optional[float] = None) -> Dict[str, Any]:
+def get_user_inputs(df_miners: pd.DataFrame, live_btc_price: Optional[float] = None, catalog=None,
+                    live_difficulty: Optional[float] = None) -> Dict[str, Any]:
     # Miner selection
     miner_options = ["Manual Input"] + df_miners["model"].dropna().unique().tolist()
     selected_model = st.sidebar.selectbox("Choose Miner", miner_options)
@@ -29,13 +27,33 @@ def get_user_inputs(df_miners: pd.DataFrame, live_btc_price: Optional[float] = N
         difficulty_t = st.sidebar.number_input("Network Difficulty (T)", value=115.00, step=1.00)
         difficulty = difficulty_t * 1e12
     else:
-        difficulty = None  # Placeholder until API connected
-        st.sidebar.markdown(f"**Live Difficulty:** *(Not available — API not connected)*")
+        difficulty = live_difficulty
+        if difficulty:
+            st.sidebar.markdown(f"**Live Difficulty:** {difficulty / 1e12:,.2f} T")
+        else:
+            st.sidebar.markdown("**Live Difficulty:** *(Not available yet — fetching)*")
 
     # Simulation Parameters
     initial_investment = st.sidebar.number_input("Initial Investment ($)", value=100_000.0, step=100_000.0)
     electricity_rate = st.sidebar.number_input("Electricity Rate ($/kWh)", value=0.01, step=0.01)
+
+    # Optional hourly tariff (8760 values per year) replaces the flat rate
+    tariff = None
+    tariff_file = st.sidebar.file_uploader("Hourly Tariff CSV (optional)", type="csv")
+    if tariff_file is not None:
+        from utils.energy import load_tariff
+
+        try:
+            tariff = load_tariff(tariff_file)
+        except ValueError as e:
+            st.sidebar.error(f"Tariff ignored: {e}")
+    curtail_above = st.sidebar.number_input("Curtail Above ($/kWh, 0 = off)", value=0.0, step=0.01,
+                                            disabled=tariff is None)
+    revenue_models = {"Network (Difficulty)": "network", "Hashprice (Projected)": "hashprice",
+                      "Hashprice (Historical Replay)": "replay"}
+    revenue_model = revenue_models[st.sidebar.selectbox("Revenue Model", list(revenue_models))]
     years = st.sidebar.slider("Years to Simulate", 1, 40, 30)
+    time_step = st.sidebar.selectbox("Time Step", ["yearly", "monthly", "weekly", "daily"])
     
     # Start year & dynamic block reward
     current_year = datetime.datetime.now().year
@@ -54,7 +72,8 @@ def get_user_inputs(df_miners: pd.DataFrame, live_btc_price: Optional[float] = N
         miner_hashrate = st.sidebar.number_input("Miner Hashrate (TH/s)", value=100.0)
         miner_power = st.sidebar.number_input("Miner Power (kW)", value=3.0)
     else:
-        row = df_miners[df_miners["model"] == selected_model].iloc[0]
+        # Hash lookup when a MinerCatalog over df_miners is passed, else scan
+        row = catalog.lookup(selected_model) if catalog is not None else df_miners[df_miners["model"] == selected_model].iloc[0]
         miner_cost = row["cost"]
         miner_hashrate = row["hashrate_ths"]
         miner_power = row["power_kw"]
@@ -65,7 +84,11 @@ def get_user_inputs(df_miners: pd.DataFrame, live_btc_price: Optional[float] = N
         "btc_price": btc_price,
         "initial_investment": initial_investment,
         "electricity_rate": electricity_rate,
+        "tariff": tariff,
+        "curtail_above": curtail_above or None,
+        "revenue_model": revenue_model,
         "years": years,
+        "time_step": time_step,
         "start_year": start_year,
         "block_reward": block_reward,
         "network_hashrate_ehs": network_hashrate_ehs,
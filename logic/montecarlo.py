@@ -0,0 +1,147 @@
+#montecarlo.py
+# Monte Carlo mode for the scenario simulator. Instead of a fixed btc_cagr and
+# NETWORK_GROWTH, price follows a GBM (optionally with Merton jumps) and network
+# hashrate follows a lognormal growth path. Paths are generated and simulated in
+# blocks, reduced to per-path summaries, and thrown away.
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from logic.engine import NETWORK_GROWTH, SCENARIOS, simulate_scenarios_array
+from logic.simulate import filter_simulate_inputs
+
+MC_METRICS = ("roi", "breakeven_months", "irr")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def price_path_factors(
+    rng: np.random.Generator,
+    n_paths: int,
+    years: int,
+    btc_cagr: float,
+    volatility: float = 0.60,
+    jump_intensity: float = 0.0,
+    jump_mean: float = 0.0,
+    jump_std: float = 0.0,
+    steps_per_year: int = 12,
+) -> np.ndarray:
+    """
+    Price multipliers at the end of each year, shape (n_paths, years).
+    Drift is set so the expected price still compounds at btc_cagr; jumps are
+    compensated the same way (Merton).
+    """
+    n_steps = years * steps_per_year
+    dt = 1.0 / steps_per_year
+    mu = np.log1p(btc_cagr / 100)
+    kappa = np.exp(jump_mean + 0.5 * jump_std**2) - 1
+    drift = (mu - 0.5 * volatility**2 - jump_intensity * kappa) * dt
+
+    log_steps = drift + volatility * np.sqrt(dt) * rng.standard_normal((n_paths, n_steps))
+    if jump_intensity > 0:
+        n_jumps = rng.poisson(jump_intensity * dt, (n_paths, n_steps))
+        log_steps += n_jumps * jump_mean + np.sqrt(n_jumps) * jump_std * rng.standard_normal((n_paths, n_steps))
+
+    log_path = np.cumsum(log_steps, axis=1)[:, steps_per_year - 1::steps_per_year]
+    return np.exp(log_path)
+
+
+def hashrate_path_factors(
+    rng: np.random.Generator,
+    n_paths: int,
+    years: int,
+    growth: float = NETWORK_GROWTH,
+    volatility: float = 0.15,
+) -> np.ndarray:
+    """Network hashrate multipliers for each year, shape (n_paths, years); year 1 is 1.0."""
+    log_steps = np.log(growth) + volatility * rng.standard_normal((n_paths, years - 1))
+    log_path = np.concatenate([np.zeros((n_paths, 1)), np.cumsum(log_steps, axis=1)], axis=1)
+    return np.exp(log_path)
+
+
+def _simulate_block(args) -> Dict[str, np.ndarray]:
+    # Module-level so it can be pickled for ProcessPoolExecutor
+    inputs, scenarios, n_paths, seed_seq, price_kwargs, hashrate_kwargs = args
+    rng = np.random.default_rng(seed_seq)
+    years = int(inputs["years"])
+
+    price_factors = price_path_factors(rng, n_paths, years, inputs["btc_cagr"], **price_kwargs)
+    hashrate_factors = hashrate_path_factors(rng, n_paths, years, **hashrate_kwargs)
+    result = simulate_scenarios_array(
+        scenarios=scenarios, price_factors=price_factors, hashrate_factors=hashrate_factors, **inputs
+    )
+    # Only per-path summaries leave the block; the (n_paths, S, Y) arrays are dropped here
+    return {
+        "roi": result["roi"][..., -1].astype(np.float32),
+        "breakeven_months": result["cpbm_months"].astype(np.float32),
+        "irr": result["irr"].astype(np.float32),
+    }
+
+
+def _percentiles(values: np.ndarray, percentiles: Sequence[float]) -> np.ndarray:
+    # values is (n_paths, S); NaN means "never" / "undefined" and is left out
+    out = np.full((values.shape[1], len(percentiles)), np.nan)
+    for s in range(values.shape[1]):
+        column = values[:, s]
+        column = column[~np.isnan(column)]
+        if column.size:
+            out[s] = np.percentile(column, percentiles)
+    return out
+
+
+def history_price_kwargs(days: float = 365, history=None) -> Dict[str, float]:
+    """price_kwargs with volatility estimated from the local price history; {} if there isn't enough."""
+    from data.market_history import get_history
+
+    volatility = (history or get_history()).price_volatility(days)
+    return {} if volatility is None else {"volatility": volatility}
+
+
+def run_monte_carlo(
+    user_inputs: Dict[str, Any],
+    n_paths: int = 100_000,
+    block_size: int = 10_000,
+    seed: Optional[int] = 0,
+    max_workers: Optional[int] = None,
+    scenarios=SCENARIOS,
+    percentiles: Sequence[float] = PERCENTILES,
+    price_kwargs: Optional[Dict[str, float]] = None,
+    hashrate_kwargs: Optional[Dict[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    Percentile bands of final ROI, breakeven month and IRR per scenario.
+
+    Each block of `block_size` paths gets its own child of SeedSequence(seed), so
+    results depend only on `seed`, `n_paths` and `block_size`, not on how many
+    workers ran them. max_workers=1 runs in-process (no pool).
+
+    Returns one row per (Scenario, Metric) with a column per percentile, plus the
+    share of paths where the metric was defined (e.g. breakeven was reached).
+    """
+    inputs = filter_simulate_inputs(user_inputs)
+    sizes = [min(block_size, n_paths - start) for start in range(0, n_paths, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (inputs, list(scenarios), size, seed_seq, price_kwargs or {}, hashrate_kwargs or {})
+        for size, seed_seq in zip(sizes, seeds)
+    ]
+
+    if max_workers == 1:
+        blocks = [_simulate_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            blocks = list(pool.map(_simulate_block, tasks))
+
+    rows = []
+    for metric in MC_METRICS:
+        values = np.concatenate([b[metric] for b in blocks])
+        bands = _percentiles(values, percentiles)
+        defined = (~np.isnan(values)).mean(axis=0)
+        for s, scenario in enumerate(scenarios):
+            row = {"Scenario": scenario, "Metric": metric}
+            row.update({f"P{p:g}": bands[s, i] for i, p in enumerate(percentiles)})
+            row["Defined Share"] = defined[s]
+            rows.append(row)
+    return pd.DataFrame(rows)
@@ -0,0 +1,182 @@
+#optimizer.py
+# Capital allocation: which mix of catalog miners to buy with a budget under a
+# power cap, maximizing NPV or IRR. Per-miner cashflows come from
+# calculate_profitability_metrics for the whole catalog at once; the integer
+# mix is found by a greedy fill followed by swap-based local search, with every
+# candidate move of a round scored in one vectorized pass.
+
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from logic.engine import NETWORK_GROWTH
+from utils.finance import irr, npv
+from utils.metrics import calculate_profitability_metrics
+
+OBJECTIVES = ("npv", "irr")
+
+
+def unit_cashflows(
+    df: pd.DataFrame,
+    years: int,
+    network_growth: float = NETWORK_GROWTH,
+    allow_shutdown: bool = True,
+) -> np.ndarray:
+    """
+    (n, years) yearly cashflow of one unit of each miner (purchase cost excluded).
+    Revenue shrinks as network hashrate grows; with allow_shutdown a miner is
+    switched off in years where it would lose money.
+    """
+    revenue = df["daily_revenue"].to_numpy(dtype=float)[:, None] * network_growth ** -np.arange(years)
+    yearly = (revenue - df["daily_electric_cost"].to_numpy(dtype=float)[:, None]) * 365
+    return np.maximum(yearly, 0.0) if allow_shutdown else yearly
+
+
+def _greedy_fill(x, cost, power, budget_left, power_left, max_units, order):
+    # Take as many units as fit of each miner, best ratio first
+    for i in order:
+        if budget_left < cost[i] or power_left < power[i]:
+            continue
+        n = min(budget_left // cost[i], power_left // power[i] if power[i] > 0 else np.inf, max_units[i] - x[i])
+        if n > 0:
+            x[i] += n
+            budget_left -= n * cost[i]
+            power_left -= n * power[i]
+    return budget_left, power_left
+
+
+def optimize_miner_mix(
+    df: pd.DataFrame,
+    initial_investment: float,
+    electricity_rate: float,
+    power_cap_kw: float,
+    btc_price: float,
+    years: int = 5,
+    objective: str = "npv",
+    discount_rate: float = 0.10,
+    difficulty: Optional[float] = None,
+    block_reward_btc: float = 3.125,
+    fees_btc: float = 0.025,
+    usd_per_th_per_day: Optional[float] = None,
+    uptime: float = 0.95,
+    tariff: Optional[np.ndarray] = None,
+    curtail_above: Optional[float] = None,
+    network_growth: float = NETWORK_GROWTH,
+    allow_shutdown: bool = True,
+    max_rounds: int = 500,
+    time_limit: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Integer number of units of each catalog miner that maximizes the portfolio
+    objective subject to total cost <= initial_investment and total power <=
+    power_cap_kw. An optional "max_units" column caps each miner's count. With an
+    hourly `tariff`, each miner follows its optimal run schedule (see utils.energy).
+
+    objective="npv": sum of unit NPVs at discount_rate over `years`.
+    objective="irr": IRR of the whole budget, i.e. -investment up front, fleet
+    cashflows each year, unspent cash returned in the last year.
+
+    Returns the allocation (one row per bought miner), NPV, IRR, spend, power,
+    an LP upper bound on NPV, the number of local-search rounds and solve_seconds.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {', '.join(OBJECTIVES)}")
+    started = time.perf_counter()
+
+    df = df.dropna(subset=["cost", "hashrate_ths", "power_kw"])
+    df = df[(df["cost"] > 0) & (df["power_kw"] >= 0)].reset_index(drop=True)
+    df = calculate_profitability_metrics(
+        df, btc_price=btc_price, electricity_rate=electricity_rate, difficulty=difficulty,
+        block_reward_btc=block_reward_btc, fees_btc=fees_btc, usd_per_th_per_day=usd_per_th_per_day, uptime=uptime,
+        tariff=tariff, curtail_above=curtail_above,
+    )
+    cost = df["cost"].to_numpy(dtype=float)
+    power = df["power_kw"].to_numpy(dtype=float)
+    max_units = df["max_units"].fillna(np.inf).to_numpy(dtype=float) if "max_units" in df.columns else np.full(len(df), np.inf)
+
+    flows = np.nan_to_num(unit_cashflows(df, years, network_growth, allow_shutdown))
+    value = npv(discount_rate, np.column_stack([-cost, flows]))  # NPV of one unit
+
+    # Greedy start: positive-NPV miners by value per unit of both capacities
+    weight = cost / initial_investment + (power / power_cap_kw if power_cap_kw > 0 else 0)
+    pool = np.flatnonzero(value > 0)
+    pool = pool[np.argsort(-(value[pool] / weight[pool]), kind="stable")]
+    x = np.zeros(len(df))
+    budget_left, power_left = _greedy_fill(x, cost, power, float(initial_investment), float(power_cap_kw),
+                                           max_units, pool)
+
+    def portfolio_flows(fleet_flows, spent):
+        # (..., years + 1): whole budget in, fleet cashflows, leftover cash back at the end
+        shape = np.shape(fleet_flows)[:-1] + (1,)
+        out = np.concatenate([np.full(shape, -float(initial_investment)), fleet_flows], axis=-1)
+        out[..., -1] += initial_investment - spent
+        return out
+
+    def objective_value(fleet_value, fleet_flows, spent):
+        if objective == "npv":
+            return fleet_value
+        result = irr(portfolio_flows(fleet_flows, spent))
+        return np.where(np.isnan(result), -np.inf, result)
+
+    # Local search: drop one unit of a held miner and refill the freed room with as
+    # many units as fit of one pool miner. All (held, pool) moves of a round are
+    # scored at once from deltas; the best improving one is applied, then topped up.
+    rounds = 0
+    while rounds < max_rounds and time.perf_counter() - started < time_limit:
+        held = np.flatnonzero(x > 0)
+        if not len(held) or not len(pool):
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fit = np.minimum((budget_left + cost[held][:, None]) // cost[pool],
+                             np.where(power[pool] > 0, (power_left + power[held][:, None]) // power[pool], np.inf))
+        already = np.where(pool == held[:, None], x[pool] - 1, x[pool])
+        fit = np.clip(np.minimum(fit, max_units[pool] - already), 0, None)  # (held, pool)
+
+        spent = cost @ x
+        move_spent = spent - cost[held][:, None] + fit * cost[pool]
+        move_value = x @ value - value[held][:, None] + fit * value[pool]
+        move_flows = None
+        if objective == "irr":
+            move_flows = x @ flows - flows[held][:, None, :] + fit[..., None] * flows[pool]
+        scores = objective_value(move_value, move_flows, move_spent)
+        current = float(objective_value(x @ value, x @ flows, spent))
+        h, p = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        if scores[h, p] <= current + 1e-9 * max(1.0, abs(current)):
+            break
+        x[held[h]] -= 1
+        x[pool[p]] += fit[h, p]
+        budget_left = float(initial_investment - cost @ x)
+        power_left = float(power_cap_kw - power @ x)
+        budget_left, power_left = _greedy_fill(x, cost, power, budget_left, power_left, max_units, pool)
+        rounds += 1
+
+    spent = float(cost @ x)
+    # Each capacity alone, relaxed to fractional units, bounds the integer NPV from above
+    upper_bound = 0.0
+    if len(pool):
+        upper_bound = float(min(initial_investment * np.max(value[pool] / cost[pool]),
+                                power_cap_kw * np.max(value[pool] / np.maximum(power[pool], 1e-12))))
+
+    bought = np.flatnonzero(x > 0)
+    allocation = df.loc[bought, [c for c in ("model", "manufacturer") if c in df.columns]].copy()
+    allocation["units"] = x[bought].astype(int)
+    allocation["unit_cost"] = cost[bought]
+    allocation["unit_power_kw"] = power[bought]
+    allocation["unit_npv"] = value[bought]
+    allocation["total_cost"] = allocation["units"] * allocation["unit_cost"]
+    allocation["total_power_kw"] = allocation["units"] * allocation["unit_power_kw"]
+    allocation = allocation.sort_values("total_cost", ascending=False, ignore_index=True)
+
+    return {
+        "allocation": allocation,
+        "objective": objective,
+        "npv": float(x @ value) if len(bought) else 0.0,
+        "irr": float(irr(portfolio_flows(x @ flows, spent))) if len(bought) else float("nan"),
+        "spent": spent,
+        "power_kw": float(power @ x),
+        "upper_bound_npv": upper_bound,
+        "rounds": rounds,
+        "solve_seconds": time.perf_counter() - started,
+    }
@@ -2,7 +2,12 @@
 
 import pandas as pd
 import numpy as np
-import streamlit as st
+
+from logic.engine import SCENARIOS, simulate_scenarios_array, scenarios_to_frame
+from logic.timestep import simulate_scenarios_timestep
+from utils.energy import scenario_energy_inputs
+from utils.finance import irr as irr_solver
+from utils.metrics import calculate_profitability_metrics
 
 def simulate_scenario(
     scenario: str,
@@ -19,7 +24,9 @@ def simulate_scenario(
     difficulty: float = None,
     fees_btc: float = 0.025,
     uptime: float = 0.95,
-    block_reward: float = 50.0
+    block_reward: float = 50.0,
+    hashprice_btc=None,
+    run_fraction: float = 1.0
 ):
     BLOCKS_PER_DAY = 144
     DAYS_PER_YEAR = 365
@@ -70,7 +77,12 @@ def simulate_scenario(
         reward = block_reward / (2 ** halving_diff) if halving_diff >= 0 else block_reward * (2 ** abs(halving_diff))
 
 
-        if difficulty is not None and difficulty > 0:
+        if hashprice_btc is not None:
+            # BTC per TH/s per day for this year (logic/hashprice.py)
+            daily_btc_mined = hashrate_ths * uptime * hashprice_btc[year - 1]
+            btc_mined = daily_btc_mined * DAYS_PER_YEAR
+
+        elif difficulty is not None and difficulty > 0:
 
             # Convert miner hashrate TH/s to H/s
             hashrate_hs = hashrate_ths * 1e12
@@ -82,8 +94,11 @@ def simulate_scenario(
             share = hashrate_ths / network_hashrate_ths if network_hashrate_ths > 0 else 0.0
             btc_mined = share * BLOCKS_PER_DAY * reward * DAYS_PER_YEAR
             daily_btc_mined = btc_mined / 365
-            
-        energy_cost = power_kw * 24 * 365 * electricity_rate * uptime
+
+        # Share of hours running under an hourly tariff scales revenue and energy alike
+        btc_mined *= run_fraction
+        daily_btc_mined *= run_fraction
+        energy_cost = power_kw * 24 * 365 * electricity_rate * uptime * run_fraction
         cumulative_energy_cost += energy_cost
 
         btc_held += btc_mined
@@ -118,10 +133,8 @@ def simulate_scenario(
         })
 
     # After yearly results, calculate long-term metrics:
-    try:
-        irr = np.irr([-initial_investment] + yearly_profits) * 100
-    except:
-        irr = None
+    irr = irr_solver([-initial_investment] + yearly_profits) * 100
+    irr = None if np.isnan(irr) else float(irr)
 
     try:
         cumulative_cash = np.cumsum([0] + yearly_profits)
@@ -163,16 +176,37 @@ def filter_simulate_inputs(user_inputs):
         "difficulty",
         "fees_btc",
         "start_year",
-        "block_reward"
+        "block_reward",
+        "uptime"
     }
-    return {k: v for k, v in user_inputs.items() if k in allowed_keys}
+    filtered = {k: v for k, v in user_inputs.items() if k in allowed_keys}
+    if user_inputs.get("tariff") is not None:
+        # Hourly tariff: the optimal schedule's effective rate and share of hours running
+        filtered.update(scenario_energy_inputs(user_inputs))
+    if user_inputs.get("revenue_model", "network") != "network":
+        # Revenue from a replayed or projected hashprice path instead of difficulty / network share
+        from logic.hashprice import hashprice_path
+
+        filtered["hashprice_btc"] = hashprice_path(user_inputs)
+    return filtered
 
 def simulate_all_scenarios(user_inputs):
-    scenarios = ["HODL", "Miners Only", "BTC Loan", "Hybrid"]
+    # All scenarios and years in one array pass (see logic/engine.py)
+    filtered_inputs = filter_simulate_inputs(user_inputs)
+    time_step = user_inputs.get("time_step", "yearly")
+    if time_step == "yearly":
+        result = simulate_scenarios_array(scenarios=SCENARIOS, **filtered_inputs)
+    else:
+        # Sub-year steps with block-height halvings (see logic/timestep.py)
+        result = simulate_scenarios_timestep(scenarios=SCENARIOS, time_step=time_step, **filtered_inputs)
+    return scenarios_to_frame(result)
+
+def simulate_all_scenarios_reference(user_inputs):
+    # Original per-scenario loop, kept to check the array engine against
     filtered_inputs = filter_simulate_inputs(user_inputs)
     
     all_results = []
-    for scenario in scenarios:
+    for scenario in SCENARIOS:
         # Pass scenario explicitly, other args unpacked from filtered inputs
         result = simulate_scenario(scenario=scenario, **filtered_inputs)
         all_results.extend(result)
@@ -180,4 +214,17 @@ def simulate_all_scenarios(user_inputs):
 
 def simulate_single_scenario(scenario, user_inputs):
     filtered_inputs = filter_simulate_inputs(user_inputs)
-    return pd.DataFrame(simulate_scenario(scenario=scenario, **filtered_inputs))
\ No newline at end of file
+    return pd.DataFrame(simulate_scenario(scenario=scenario, **filtered_inputs))
+
+def scenario_metrics(df_scenarios, user_inputs):
+    # Profitability columns for simulated scenario rows. The rows carry daily_btc_mined from
+    # the simulator's revenue model (hashprice and the tariff's run fraction included), so no
+    # tariff is passed here: it would schedule the miners a second time.
+    return calculate_profitability_metrics(
+        df_scenarios,
+        btc_price=user_inputs["btc_price"],
+        electricity_rate=user_inputs["electricity_rate"],
+        difficulty=user_inputs.get("difficulty"),
+        block_reward_btc=user_inputs.get("block_reward"),
+        fees_btc=user_inputs.get("fees_btc"),
+    )
@@ -0,0 +1,106 @@
+#sweep.py
+# Parameter-grid sweeps over the array engine. The whole Cartesian grid runs in a
+# single broadcasted call instead of one simulate_all_scenarios call per cell.
+
+from typing import Any, Dict, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from logic.engine import SCENARIOS, simulate_scenarios_array
+from logic.simulate import filter_simulate_inputs
+
+# Per-scenario outputs kept by default; per-year arrays are dropped to stay compact
+SUMMARY_FIELDS = ("final_roi", "irr", "cpbm_months", "ppi", "annual_profit")
+
+
+def _check_grid(grid: Dict[str, Sequence]) -> Dict[str, np.ndarray]:
+    allowed = set(filter_simulate_inputs({k: None for k in grid}))
+    unknown = [k for k in grid if k not in allowed or k == "years"]
+    if unknown:
+        raise KeyError(f"Cannot sweep over: {', '.join(unknown)}")
+    return {k: np.asarray(v, dtype=float) for k, v in grid.items()}
+
+
+def _run(inputs: Dict[str, Any], fields: Sequence[str], scenarios) -> Dict[str, np.ndarray]:
+    result = simulate_scenarios_array(scenarios=scenarios, **inputs)
+    result["final_roi"] = result["roi"][..., -1]
+    return {f: result[f] for f in fields}
+
+
+def sweep_grid(
+    user_inputs: Dict[str, Any],
+    grid: Dict[str, Sequence],
+    fields: Sequence[str] = SUMMARY_FIELDS,
+    scenarios=SCENARIOS,
+) -> Dict[str, Any]:
+    """
+    Evaluate every combination of `grid` values in one broadcasted pass.
+    Inputs not in `grid` are taken from `user_inputs`.
+
+    Returns an ndarray bundle: {"dims", "coords", "data"}. Each array in "data" has
+    one axis per grid parameter (in `grid` order), then a scenario axis, then a
+    year axis for per-year fields such as "roi".
+    """
+    values = _check_grid(grid)
+    inputs = filter_simulate_inputs(user_inputs)
+
+    # Give each swept parameter its own axis so broadcasting builds the grid
+    n = len(values)
+    for axis, (name, v) in enumerate(values.items()):
+        shape = [1] * n
+        shape[axis] = v.size
+        inputs[name] = v.reshape(shape)
+
+    return {
+        "dims": tuple(values) + ("scenario",),
+        "coords": {**values, "scenario": np.array(scenarios)},
+        "data": _run(inputs, fields, scenarios),
+    }
+
+
+def _frame(params: Dict[str, np.ndarray], data: Dict[str, np.ndarray], scenarios) -> pd.DataFrame:
+    # params are flat (N,), data is (N, S); output is N*S rows, column by column
+    n_scenarios = len(scenarios)
+    columns = {name: np.repeat(v, n_scenarios) for name, v in params.items()}
+    columns["Scenario"] = np.tile(np.asarray(scenarios), len(next(iter(params.values()))))
+    for field, arr in data.items():
+        if arr.ndim != 2:
+            raise ValueError(f"Field '{field}' is per-year; only per-scenario fields fit a long frame")
+        columns[field] = arr.ravel()
+    return pd.DataFrame(columns)
+
+
+def sweep_to_frame(result: Dict[str, Any]) -> pd.DataFrame:
+    """Long DataFrame (one row per grid cell and scenario) from a sweep_grid bundle."""
+    names = result["dims"][:-1]
+    scenarios = result["coords"]["scenario"].tolist()
+    mesh = np.meshgrid(*(result["coords"][k] for k in names), indexing="ij")
+    params = {k: m.ravel() for k, m in zip(names, mesh)}
+    data = {f: a.reshape(-1, len(scenarios)) for f, a in result["data"].items()}
+    return _frame(params, data, scenarios)
+
+
+def iter_sweep_chunks(
+    user_inputs: Dict[str, Any],
+    grid: Dict[str, Sequence],
+    chunk_size: int = 20_000,
+    fields: Sequence[str] = SUMMARY_FIELDS,
+    scenarios=SCENARIOS,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a large grid through the engine `chunk_size` cells at a time.
+    Yields long DataFrames in the same layout as sweep_to_frame, so the full grid
+    never has to fit in memory (e.g. append each chunk to a Parquet/CSV file).
+    """
+    values = _check_grid(grid)
+    shape = tuple(v.size for v in values.values())
+    total = int(np.prod(shape))
+    base = filter_simulate_inputs(user_inputs)
+
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        index = np.unravel_index(flat, shape)
+        params = {k: v[i] for (k, v), i in zip(values.items(), index)}
+        data = _run({**base, **params}, fields, scenarios)
+        yield _frame(params, data, scenarios)
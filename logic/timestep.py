@@ -0,0 +1,225 @@
+#timestep.py
+# Sub-year time steps (daily / weekly / monthly) for the scenario engine.
+# Halvings happen at their block heights and difficulty retargets every 2016
+# blocks. With network hashrate growing exponentially every retarget epoch has
+# the same length, so block height is closed-form in time and the whole run is
+# cumulative array operations instead of a step loop.
+
+import numpy as np
+
+from logic.engine import NETWORK_GROWTH, SCENARIOS, scenario_allocations
+from utils.finance import irr as irr_solver
+
+STEPS_PER_YEAR = {"daily": 365, "weekly": 52, "monthly": 12}
+
+DAYS_PER_YEAR = 365
+BLOCKS_PER_DAY = 144
+RETARGET_BLOCKS = 2016
+HALVING_BLOCKS = 210_000
+INITIAL_SUBSIDY = 50.0
+MAX_HALVINGS = 33  # subsidy rounds to zero sats after this
+
+# Known point used to estimate the block height at the start of a simulation
+ANCHOR_HEIGHT = 840_000
+ANCHOR_DATE = np.datetime64("2024-04-20")
+
+
+def estimate_block_height(start_year):
+    """Approximate block height on Jan 1 of `start_year` (144 blocks/day from the 2024 halving)."""
+    start = np.asarray(start_year).astype(int) - 1970
+    days = (start.astype("datetime64[Y]").astype("datetime64[D]") - ANCHOR_DATE).astype(float)
+    return np.maximum(0.0, ANCHOR_HEIGHT + days * BLOCKS_PER_DAY)
+
+
+def cumulative_subsidy(height):
+    """Total block subsidy (BTC) paid out by blocks [0, height), halving every 210,000 blocks."""
+    height = np.asarray(height, dtype=float)
+    era = np.minimum(np.floor(height / HALVING_BLOCKS), MAX_HALVINGS)
+    full_eras = HALVING_BLOCKS * 2 * INITIAL_SUBSIDY * (1 - 2.0**-era)
+    partial = np.minimum(height - era * HALVING_BLOCKS, HALVING_BLOCKS) * INITIAL_SUBSIDY * 2.0**-era
+    return full_eras + np.where(era < MAX_HALVINGS, partial, 0.0)
+
+
+def block_height_at(t_days, start_height, network_growth: float = NETWORK_GROWTH):
+    """
+    Block height `t_days` after the start, with difficulty lagging hashrate growth.
+
+    Within an epoch blocks arrive at 144/day * g^(s/365), s = days since the last
+    retarget; each retarget resets the rate to 144/day. The first epoch is the
+    remainder of the one `start_height` is in.
+    """
+    t = np.asarray(t_days, dtype=float)
+    h0 = np.asarray(start_height, dtype=float)[..., None]
+    rate = np.log(network_growth) / DAYS_PER_YEAR
+
+    if rate == 0:
+        return h0 + BLOCKS_PER_DAY * t
+
+    def blocks_after(s):
+        return BLOCKS_PER_DAY / rate * np.expm1(rate * s)
+
+    def days_for(blocks):
+        return np.log1p(blocks * rate / BLOCKS_PER_DAY) / rate
+
+    first_blocks = RETARGET_BLOCKS - np.mod(h0, RETARGET_BLOCKS)
+    first_days = days_for(first_blocks)
+    epoch_days = days_for(RETARGET_BLOCKS)
+
+    after = np.maximum(t - first_days, 0.0)
+    epochs = np.floor(after / epoch_days)
+    in_epoch = after - epochs * epoch_days
+    return np.where(
+        t < first_days,
+        h0 + blocks_after(t),
+        h0 + first_blocks + epochs * RETARGET_BLOCKS + blocks_after(in_epoch),
+    )
+
+
+def simulate_scenarios_timestep(
+    initial_investment,
+    btc_price,
+    electricity_rate,
+    years: int,
+    miner_cost,
+    miner_hashrate_ths,
+    miner_power_kw,
+    network_hashrate_ehs,
+    btc_cagr,
+    start_year=2026,
+    difficulty=None,
+    fees_btc=0.025,
+    uptime=0.95,
+    block_reward=None,
+    scenarios=SCENARIOS,
+    time_step: str = "monthly",
+    start_height=None,
+    network_growth: float = NETWORK_GROWTH,
+    hashprice_btc=None,
+    run_fraction=1.0,
+) -> dict:
+    """
+    Same inputs and result layout as logic.engine.simulate_scenarios_array, but with
+    `time_step` steps per year instead of whole years (axis Y becomes the step axis).
+
+    Differences from the yearly engine:
+    - the subsidy comes from block height (`block_reward` is ignored); `start_height`
+      defaults to an estimate for Jan 1 of `start_year`
+    - difficulty, when given, sets the starting network hashrate and then retargets
+      every 2016 blocks; otherwise network_hashrate_ehs is used
+    - uptime applies to mining revenue on both paths
+    - "cpbm_months" uses the yearly engine's cumulative payback, resolved to the step
+      (in real months)
+    - PPI / annual profit are computed from year-end ROI, as in the yearly engine
+
+    `hashprice_btc` (shape (..., N), BTC per TH/s per day in each step) replaces
+    the block-height revenue model, and `run_fraction` scales revenue and energy
+    cost, as in the yearly engine.
+    """
+    if time_step not in STEPS_PER_YEAR:
+        raise ValueError(f"time_step must be one of {', '.join(STEPS_PER_YEAR)}")
+    steps_per_year = STEPS_PER_YEAR[time_step]
+    years = int(years)
+    step_days = DAYS_PER_YEAR / steps_per_year
+
+    paths = [np.asarray(hashprice_btc, dtype=float)] if hashprice_btc is not None else []
+    inv, price0, rate, cost, m_hash, m_power, net_ehs, cagr, start, fees, up, run, *_ = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (
+            initial_investment, btc_price, electricity_rate, miner_cost, miner_hashrate_ths,
+            miner_power_kw, network_hashrate_ehs, btc_cagr, start_year, fees_btc, uptime, run_fraction,
+        )],
+        *[np.empty(f.shape[:-1]) for f in paths],
+    )
+    diff = np.full(inv.shape, np.nan) if difficulty is None else np.broadcast_to(
+        np.asarray(difficulty, dtype=float), inv.shape
+    )
+    h0 = estimate_block_height(start) if start_height is None else np.broadcast_to(
+        np.asarray(start_height, dtype=float), inv.shape
+    )
+
+    def ps(a):  # parameter-shaped -> (*P, 1, 1), broadcasts against (S, N)
+        return a[..., None, None]
+
+    btc_held0, loan, miner_count = scenario_allocations(scenarios, inv, price0, cost)
+    btc_held0, loan, miner_count = btc_held0[..., None], loan[..., None], miner_count[..., None]
+
+    n_steps = years * steps_per_year
+    t_end = np.arange(1, n_steps + 1) * step_days
+    t_edges = np.concatenate([[0.0], t_end])
+    t_mid = t_edges[:-1] + step_days / 2
+
+    # Blocks and subsidy per step from the height path, fees on top per block
+    heights = block_height_at(t_edges, h0, network_growth)  # (*P, N + 1)
+    blocks = np.diff(heights, axis=-1)
+    paid = np.diff(cumulative_subsidy(heights), axis=-1) + fees[..., None] * blocks
+
+    # Network hashrate in H/s: from difficulty if given, otherwise from EH/s
+    with np.errstate(divide="ignore", invalid="ignore"):
+        network_hs0 = np.where(diff > 0, diff * 2**32 / 600, net_ehs * 1e18)
+        network_hs = network_hs0[..., None] * network_growth ** (t_mid / DAYS_PER_YEAR)
+        share = np.where(network_hs > 0, 1e12 / network_hs, 0.0)  # per TH/s of miner hashrate
+
+        hashrate_ths = miner_count * ps(m_hash)
+        power_kw = miner_count * ps(m_power)
+        btc_mined = hashrate_ths * ps(up) * (share * paid)[..., None, :]
+        if hashprice_btc is not None:
+            btc_mined = hashrate_ths * ps(up) * (np.asarray(hashprice_btc, dtype=float) * step_days)[..., None, :]
+        btc_mined = btc_mined * ps(run)
+        daily_btc_mined = btc_mined / step_days
+
+        energy_cost = np.broadcast_to(power_kw * 24 * step_days * ps(rate) * ps(up) * ps(run), btc_mined.shape)
+        cumulative_energy_cost = energy_cost * np.arange(1, n_steps + 1)
+
+        btc_held = btc_held0 + np.cumsum(btc_mined, axis=-1)
+        price = ps(price0) * (1 + ps(cagr) / 100) ** (t_end / DAYS_PER_YEAR)
+
+        value_of_holdings = btc_held * price
+        roi = value_of_holdings - ps(inv) - cumulative_energy_cost - loan
+        year_frac = t_end / DAYS_PER_YEAR
+        cagr_pct = ((value_of_holdings / ps(inv)) ** (1 / year_frac) - 1) * 100
+        cagr_pct = np.where(ps(inv) != 0, cagr_pct, np.nan)
+
+        # Payback as in the yearly engine: ROI is each year's cashflow, so every step
+        # accrues its share of a year of it; breakeven when the total covers the investment
+        inv_s = inv[..., None]
+        cumulative_cash = np.cumsum(roi, axis=-1) / steps_per_year
+        reached = cumulative_cash >= inv_s[..., None]
+        months_to_breakeven = np.where(
+            reached.any(axis=-1), t_end[reached.argmax(axis=-1)] / (DAYS_PER_YEAR / 12), np.nan
+        )
+        months_to_breakeven = np.where(inv_s <= 0, 0.0, months_to_breakeven)
+
+        total_profit = roi[..., steps_per_year - 1::steps_per_year].sum(axis=-1)
+        ppi = np.where(inv_s > 0, total_profit / inv_s, np.nan)
+        annual_profit = total_profit / years
+
+    # IRR on year-end cashflows, so it matches the yearly engine's definition
+    year_end_roi = roi[..., steps_per_year - 1::steps_per_year]
+    cashflows = np.concatenate([np.broadcast_to(-ps(inv), (*roi.shape[:-1], 1)), year_end_roi], axis=-1)
+    irr = irr_solver(cashflows) * 100
+
+    hodl = np.array([s == "HODL" for s in scenarios])
+    irr, months_to_breakeven, ppi, annual_profit = (
+        np.where(hodl, np.nan, a) for a in (irr, months_to_breakeven, ppi, annual_profit)
+    )
+
+    # Subsidy per block at the start of each step, for display
+    era = np.minimum(np.floor(heights[..., :-1] / HALVING_BLOCKS), MAX_HALVINGS)
+
+    return {
+        "scenarios": list(scenarios),
+        "year": year_frac,
+        "calendar_year": start[..., None] + np.floor(t_edges[:-1] / DAYS_PER_YEAR),
+        "block_height": heights[..., 1:],
+        "reward": np.where(era < MAX_HALVINGS, INITIAL_SUBSIDY * 2.0**-era, 0.0),
+        "btc_price": np.broadcast_to(price, btc_mined.shape[:-2] + (1, n_steps)),
+        "btc_held": btc_held,
+        "btc_mined": btc_mined,
+        "daily_btc_mined": daily_btc_mined,
+        "energy_cost": energy_cost,
+        "roi": roi,
+        "cagr": cagr_pct,
+        "irr": irr,
+        "cpbm_months": months_to_breakeven,
+        "ppi": ppi,
+        "annual_profit": annual_profit,
+    }
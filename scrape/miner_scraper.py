@@ -1,44 +1,178 @@
 #Scrape live miner info from Internet
 
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://www.asicminervalue.com"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+CACHE_DIR = ".scrape_cache"
+
+def parse_search_link(html):
+    link_tag = BeautifulSoup(html, "html.parser").select_one(".miner-list a")
+    return link_tag["href"] if link_tag else None
+
+def parse_specs(html):
+    specs_table = BeautifulSoup(html, "html.parser").select_one("table.specs")
+    if not specs_table:
+        return None
+
+    specs = {}
+    for row in specs_table.select("tr"):
+        cols = row.select("td")
+        if len(cols) == 2:
+            key = cols[0].get_text(strip=True)
+            value = cols[1].get_text(strip=True)
+            specs[key] = value
+
+    return {
+        "Noise Level (dB)": specs.get("Noise level"),
+        "Operating Temp (°C)": specs.get("Operating temperature"),
+        "Length (mm)": specs.get("Size", "").split("x")[0].strip(),
+        "Width (mm)": specs.get("Size", "").split("x")[1].strip() if "x" in specs.get("Size", "") else None,
+        "Height (mm)": specs.get("Size", "").split("x")[2].strip() if "x" in specs.get("Size", "") else None,
+        "Weight (kg)": specs.get("Weight"),
+    }
+
+def scrape_miner_specs(miner_name, fetch=None, base_url=BASE_URL):
+    # `fetch(url) -> html` defaults to a plain GET; scrape_many passes a pooled, cached one
+    if fetch is None:
+        def fetch(url):
+            return requests.get(url, headers=HEADERS, timeout=10).text
 
-def scrape_miner_specs(miner_name):
-    base_url = "https://www.asicminervalue.com"
     search_url = f"{base_url}/search?q={miner_name.replace(' ', '+')}"
-    headers = {"User-Agent": "Mozilla/5.0"}
 
     try:
-        search_response = requests.get(search_url, headers=headers)
-        search_soup = BeautifulSoup(search_response.text, "html.parser")
-        link_tag = search_soup.select_one(".miner-list a")
-
-        if not link_tag:
+        href = parse_search_link(fetch(search_url))
+        if not href:
             return None
+        return parse_specs(fetch(base_url + href))
+    except Exception:
+        return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
-        miner_url = base_url + link_tag['href']
-        detail_response = requests.get(miner_url, headers=headers)
-        detail_soup = BeautifulSoup(detail_response.text, "html.parser")
 
-        specs_table = detail_soup.select_one("table.specs")
-        if not specs_table:
+class HttpCache:
+    """
+    On-disk response cache. Entries younger than `ttl` seconds are served without a
+    request; older ones are revalidated with If-None-Match / If-Modified-Since.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttl: float = 24 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def get(self, url):
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
             return None
 
-        specs = {}
-        for row in specs_table.select("tr"):
-            cols = row.select("td")
-            if len(cols) == 2:
-                key = cols[0].get_text(strip=True)
-                value = cols[1].get_text(strip=True)
-                specs[key] = value
-
-        return {
-            "Noise Level (dB)": specs.get("Noise level"),
-            "Operating Temp (°C)": specs.get("Operating temperature"),
-            "Length (mm)": specs.get("Size", "").split("x")[0].strip(),
-            "Width (mm)": specs.get("Size", "").split("x")[1].strip() if "x" in specs.get("Size", "") else None,
-            "Height (mm)": specs.get("Size", "").split("x")[2].strip() if "x" in specs.get("Size", "") else None,
-            "Weight (kg)": specs.get("Weight"),
-        }
-    except Exception:
-        return None
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, url, text, etag=None, last_modified=None):
+        entry = {"url": url, "text": text, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        tmp = f"{self._path(url)}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._path(url))
+        return entry
+
+
+class Fetcher:
+    """Pooled, rate-limited, retrying, cached GET returning response text."""
+
+    def __init__(self, max_workers=8, rate_per_sec=2.0, cache_dir=CACHE_DIR, ttl=24 * 3600,
+                 retries=3, backoff=0.5, timeout=10):
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.bucket = TokenBucket(rate_per_sec)
+        self.cache = HttpCache(cache_dir, ttl) if cache_dir else None
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def __call__(self, url):
+        cached = self.cache.get(url) if self.cache else None
+        if self.cache and self.cache.is_fresh(cached):
+            return cached["text"]
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if response.status_code == 304 and cached:
+                return self.cache.put(url, cached["text"], cached.get("etag"), cached.get("last_modified"))["text"]
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt == self.retries:
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After", "")
+                time.sleep(float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt)
+                continue
+
+            response.raise_for_status()
+            if self.cache:
+                self.cache.put(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return response.text
+
+def scrape_many(miner_names, max_workers=8, rate_per_sec=2.0, cache_dir=CACHE_DIR, ttl=24 * 3600,
+                retries=3, backoff=0.5, timeout=10, base_url=BASE_URL):
+    """
+    Scrape specs for many models concurrently over one pooled session.
+    Returns {miner_name: specs or None}. Point `base_url` at a local stub server to test.
+    """
+    fetch = Fetcher(max_workers, rate_per_sec, cache_dir, ttl, retries, backoff, timeout)
+    names = list(dict.fromkeys(miner_names))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(lambda name: scrape_miner_specs(name, fetch=fetch, base_url=base_url), names)
+        return dict(zip(names, results))
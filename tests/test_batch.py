@@ -0,0 +1,82 @@
+#test_batch.py
+# Batch input sets: defaults and runs, CSV blanks, and bad values reported per
+# run instead of failing the whole batch.
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.batch import DEFAULT_INPUTS, INPUT_ERROR, complete_inputs, main, read_input_sets, run_batch
+from logic.engine import SCENARIOS
+
+
+def test_defaults_apply_under_each_run(tmp_path):
+    path = tmp_path / "runs.json"
+    path.write_text(json.dumps({
+        "defaults": {"years": 5, "electricity_rate": 0.07, "start_year": 2027},
+        "runs": [{"run_id": "cheap", "electricity_rate": 0.02}, {"name": "named", "years": "3"}, {}],
+    }))
+    cheap, named, unnamed = read_input_sets(str(path))
+
+    assert [s["run_id"] for s in (cheap, named, unnamed)] == ["cheap", "named", "runs-2"]
+    assert cheap["electricity_rate"] == 0.02 and cheap["years"] == 5
+    assert named["years"] == 3 and named["electricity_rate"] == 0.07
+    assert unnamed["btc_price"] == DEFAULT_INPUTS["btc_price"]
+    assert unnamed["block_reward"] == 3.125  # derived from start_year 2027
+
+
+def test_yaml_single_set_and_explicit_block_reward(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "one.yaml"
+    path.write_text("defaults:\n  block_reward: 6.25\nyears: 4\ntime_step: monthly\n")
+    (inputs,) = read_input_sets(str(path))
+
+    assert inputs["years"] == 4 and inputs["time_step"] == "monthly"
+    assert inputs["block_reward"] == 6.25
+    assert inputs["run_id"] == "one-0"
+
+
+def test_csv_blanks_take_defaults(tmp_path):
+    path = tmp_path / "grid.csv"
+    pd.DataFrame({
+        "run_id": ["a", "b"],
+        "btc_price": [50_000, None],
+        "years": [None, 7],
+        "difficulty": [None, 90e12],
+    }).to_csv(path, index=False)
+    a, b = read_input_sets(str(path))
+
+    assert a["btc_price"] == 50_000.0 and a["years"] == DEFAULT_INPUTS["years"]
+    assert a["difficulty"] == DEFAULT_INPUTS["difficulty"]
+    assert b["btc_price"] == DEFAULT_INPUTS["btc_price"] and b["years"] == 7 and isinstance(b["years"], int)
+    assert not any(isinstance(v, float) and np.isnan(v) for s in (a, b) for v in s.values())
+
+
+def test_bad_values_are_reported_per_run(tmp_path):
+    path = tmp_path / "runs.json"
+    path.write_text(json.dumps([
+        {"run_id": "ok", "years": 3},
+        {"run_id": "bad-price", "btc_price": "lots"},
+        {"run_id": "bad-years", "years": [5]},
+    ]))
+    sets = read_input_sets(str(path))
+    assert [INPUT_ERROR in s for s in sets] == [False, True, True]
+    assert "btc_price" in sets[1][INPUT_ERROR] and "'lots'" in sets[1][INPUT_ERROR]
+
+    results, errors = run_batch(sets, max_workers=1)
+    assert set(errors) == {"bad-price", "bad-years"}
+    assert errors["bad-years"].startswith("ValueError: years must be a number")
+    assert results["run_id"].unique().tolist() == ["ok"]
+    assert len(results) == 3 * len(SCENARIOS)
+
+    out = tmp_path / "results.csv"
+    assert main([str(path), "-o", str(out), "--workers", "1"]) == 1
+    assert pd.read_csv(out)["run_id"].unique().tolist() == ["ok"]
+
+
+def test_complete_inputs_keeps_unknown_keys():
+    inputs = complete_inputs({"revenue_model": "hashprice", "tariff": np.full(3, 0.05)})
+    assert inputs["revenue_model"] == "hashprice"
+    assert inputs["tariff"].shape == (3,)
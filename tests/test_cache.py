@@ -0,0 +1,105 @@
+#test_cache.py
+# SimulationCache: LRU eviction by entries and bytes, the bounded disk tier,
+# and concurrent readers and writers.
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.cache import SimulationCache
+
+
+def frame(value, rows=100):
+    return pd.DataFrame({"year": np.arange(rows), "btc_held": np.full(rows, float(value))})
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = SimulationCache(max_entries=2)
+    cache.put("a", frame(1))
+    cache.put("b", frame(2))
+    assert cache.get("a") is not None  # "a" is now the most recently used
+    cache.put("c", frame(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a")["btc_held"].iloc[0] == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_is_bounded_by_bytes():
+    probe = SimulationCache()
+    probe.put("x", frame(0))
+    nbytes = probe.stats()["bytes"]
+
+    cache = SimulationCache(max_bytes=int(2.5 * nbytes))
+    for i in range(5):
+        cache.put(str(i), frame(i))
+        assert cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.stats()["entries"] == 2
+    assert [cache.get(str(i)) is not None for i in range(5)] == [False, False, False, True, True]
+
+    cache.put("big", frame(0, rows=10_000))  # larger than the whole cache: not held in memory
+    assert cache.get("big") is None and cache.stats()["entries"] == 2
+
+
+def test_results_are_read_only_views():
+    cache = SimulationCache()
+    df = cache.put("a", frame(1))
+    with pytest.raises(ValueError):
+        df["btc_held"].values[0] = 2.0
+    assert cache.get("a")["btc_held"].iloc[0] == 1
+
+
+def test_disk_tier_survives_restart_and_stays_bounded(tmp_path):
+    cache = SimulationCache(max_entries=3, disk_dir=str(tmp_path))
+    for i in range(3):
+        cache.put(str(i), frame(i))
+        mtime = 1_000_000 + i
+        os.utime(tmp_path / f"{i}.pkl", (mtime, mtime))
+    os.utime(tmp_path / "0.pkl", (2_000_000, 2_000_000))  # touched last: "1" is now the oldest file
+
+    cache.put("3", frame(3))
+    assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["0", "2", "3"]
+
+    restarted = SimulationCache(max_entries=3, disk_dir=str(tmp_path))
+    assert restarted.get("0")["btc_held"].iloc[0] == 0
+    assert restarted.get("1") is None
+    assert restarted.stats()["disk_hits"] == 1 and restarted.stats()["misses"] == 1
+
+
+def test_partial_disk_file_is_a_miss(tmp_path):
+    (tmp_path / "a.pkl").write_bytes(b"not a pickle")
+    cache = SimulationCache(disk_dir=str(tmp_path))
+    assert cache.get("a") is None
+
+
+def test_concurrent_get_and_put(tmp_path):
+    cache = SimulationCache(max_entries=8, disk_dir=str(tmp_path))
+    keys = [str(i) for i in range(20)]
+    errors = []
+
+    def worker(seed):
+        rng = np.random.default_rng(seed)
+        try:
+            for _ in range(200):
+                key = keys[rng.integers(len(keys))]
+                df = cache.get(key)
+                if df is None:
+                    df = cache.put(key, frame(int(key)))
+                assert df["btc_held"].iloc[0] == int(key)
+        except Exception as exc:  # surfaced in the main thread
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    stats = cache.stats()
+    assert stats["entries"] <= 8
+    assert stats["hits"] + stats["disk_hits"] + stats["misses"] == 8 * 200
+    assert len(list(tmp_path.glob("*.pkl"))) <= 8
@@ -0,0 +1,62 @@
+#test_energy.py
+# Hourly tariff schedules, and the tariff applied exactly once on the way from
+# the simulator to the dashboard's scenario metrics.
+
+import numpy as np
+import pytest
+
+from logic.simulate import filter_simulate_inputs, scenario_metrics, simulate_all_scenarios
+from utils.energy import HOURS_PER_YEAR, run_schedule
+
+USER_INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 5,
+    "miner_cost": 3_500.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 900.0,
+    "btc_cagr": 15.0,
+    "start_year": 2026,
+    "difficulty": 115e12,
+    "fees_btc": 0.025,
+    "block_reward": 3.125,
+    "time_step": "yearly",
+}
+
+
+def tariff(seed=0):
+    rng = np.random.default_rng(seed)
+    hours = np.arange(HOURS_PER_YEAR)
+    return 0.04 + 0.03 * np.sin(hours / 24 * 2 * np.pi) + rng.gamma(1.0, 0.05, HOURS_PER_YEAR) * (rng.random(HOURS_PER_YEAR) < 0.05)
+
+
+def test_run_schedule_matches_hourly_mask():
+    prices = tariff()
+    breakeven = np.random.default_rng(1).uniform(0, 0.2, 500)
+    schedule = run_schedule(prices, breakeven, curtail_above=0.08)
+
+    on = prices[None, :] < np.minimum(breakeven, 0.08)[:, None]
+    np.testing.assert_allclose(schedule["run_fraction"], on.mean(axis=1))
+    expected_rate = np.where(on.any(axis=1), (on * prices).sum(axis=1) / np.maximum(on.sum(axis=1), 1), np.nan)
+    np.testing.assert_allclose(schedule["effective_rate"], expected_rate)
+
+
+@pytest.mark.parametrize("time_step", ["yearly", "monthly"])
+@pytest.mark.parametrize("difficulty", [115e12, None])
+def test_scenario_metrics_apply_the_tariff_once(time_step, difficulty):
+    inputs = {**USER_INPUTS, "time_step": time_step, "difficulty": difficulty,
+              "tariff": tariff(), "curtail_above": 0.05}
+    run_fraction = filter_simulate_inputs(inputs)["run_fraction"]
+    assert 0 < run_fraction < 1
+
+    df_scenarios = simulate_all_scenarios(inputs)
+    # As the dashboard prepares scenario rows: miner columns it does not have are NaN
+    df_scenarios = df_scenarios.assign(cost=np.nan, power_kw=np.nan, hashrate_ths=np.nan)
+    metrics = scenario_metrics(df_scenarios, inputs)
+
+    np.testing.assert_allclose(metrics["daily_revenue"], df_scenarios["daily_btc_mined"] * inputs["btc_price"])
+    flat = simulate_all_scenarios({**inputs, "tariff": None})
+    np.testing.assert_allclose(metrics["daily_revenue"], flat["daily_btc_mined"] * inputs["btc_price"] * run_fraction)
+    assert "run_fraction" not in metrics.columns
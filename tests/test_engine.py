@@ -0,0 +1,62 @@
+#test_engine.py
+# The array engine against simulate_scenario, the reference loop it replaced.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.engine import SCENARIOS, scenarios_to_frame, simulate_scenarios_array
+from logic.simulate import simulate_scenario
+
+BASE_INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 12,
+    "miner_cost": 3_500.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 900.0,
+    "btc_cagr": 15.0,
+    "start_year": 2026,
+    "difficulty": 115e12,
+    "fees_btc": 0.025,
+    "uptime": 0.95,
+    "block_reward": 3.125,
+}
+
+
+def reference_frame(inputs):
+    rows = [row for scenario in SCENARIOS for row in simulate_scenario(scenario=scenario, **inputs)]
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"difficulty": None},  # share of network hashrate
+    {"hashprice_btc": np.linspace(6e-7, 2e-7, 12)},
+    {"run_fraction": 0.6, "difficulty": None},
+    {"start_year": 2031, "btc_cagr": -5.0, "electricity_rate": 0.12},
+    {"miner_cost": 250_000.0},  # too dear: no miners bought
+])
+def test_array_engine_matches_reference(overrides):
+    inputs = {**BASE_INPUTS, **overrides}
+    expected = reference_frame(inputs)
+    actual = scenarios_to_frame(simulate_scenarios_array(scenarios=SCENARIOS, **inputs))
+
+    assert list(actual.columns) == list(expected.columns)
+    assert actual["Scenario"].tolist() == expected["Scenario"].tolist()
+    for column in expected.columns.drop("Scenario"):
+        np.testing.assert_allclose(
+            actual[column].to_numpy(dtype=float), expected[column].to_numpy(dtype=float, na_value=np.nan),
+            rtol=1e-9, err_msg=column,
+        )
+
+
+def test_array_engine_broadcasts_parameters():
+    rates = np.array([0.02, 0.05, 0.08])
+    result = simulate_scenarios_array(scenarios=SCENARIOS, **{**BASE_INPUTS, "electricity_rate": rates})
+    assert result["roi"].shape == (3, len(SCENARIOS), BASE_INPUTS["years"])
+    for i, rate in enumerate(rates):
+        single = simulate_scenarios_array(scenarios=SCENARIOS, **{**BASE_INPUTS, "electricity_rate": rate})
+        np.testing.assert_allclose(result["roi"][i], single["roi"])
@@ -0,0 +1,45 @@
+#test_finance.py
+# Vectorized NPV / IRR against known answers (numpy_financial's documented
+# examples) and across batched (P, S, Y) cashflow arrays.
+
+import numpy as np
+import pytest
+
+from utils.finance import irr, npv
+
+
+@pytest.mark.parametrize("cashflows, expected", [
+    ([-100, 39, 59, 55, 20], 0.28094842115996),
+    ([-100, 0, 0, 74], -0.09549583034897),
+    ([-100, 100, 0, 7], 0.06205848562993),
+    ([-150000, 15000, 25000, 35000, 45000, 60000], 0.05243288885941),
+])
+def test_irr_known_answers(cashflows, expected):
+    assert float(irr(cashflows)) == pytest.approx(expected, rel=1e-9)
+    assert float(npv(irr(cashflows), cashflows)) == pytest.approx(0.0, abs=1e-6)
+
+
+@pytest.mark.parametrize("cashflows", [[-100, -10, -5], [0, 0, 0, 0], [100, 10, 5]])
+def test_irr_without_a_sign_change_is_nan(cashflows):
+    assert np.isnan(irr(cashflows))
+
+
+def test_npv_known_answer():
+    assert float(npv(0.05, [-100, 39, 59, 55, 20])) == pytest.approx(-100 + 39 / 1.05 + 59 / 1.05**2 + 55 / 1.05**3 + 20 / 1.05**4)
+    np.testing.assert_allclose(npv([0.0, 0.1], [[-100, 60, 60], [-100, 60, 60]]), [20.0, -100 + 60 / 1.1 + 60 / 1.21])
+
+
+def test_irr_broadcasts_over_a_batch():
+    rng = np.random.default_rng(0)
+    P, S, Y = 4, 3, 6
+    cashflows = np.concatenate([-rng.uniform(50, 150, (P, S, 1)), rng.uniform(-5, 60, (P, S, Y))], axis=-1)
+    cashflows[0, 0, 1:] = -1.0  # never pays back: NaN in its slot only
+
+    rates = irr(cashflows)
+
+    assert rates.shape == (P, S)
+    assert np.isnan(rates[0, 0]) and np.isfinite(rates.ravel()[1:]).all()
+    for p in range(P):
+        for s in range(S):
+            np.testing.assert_allclose(rates[p, s], irr(cashflows[p, s]), equal_nan=True)
+    np.testing.assert_allclose(npv(rates, cashflows).ravel()[1:], 0.0, atol=1e-6)
@@ -0,0 +1,68 @@
+#test_fleet.py
+# The fleet simulator against the block-height engine (one SKU) and against a
+# per-machine brute force of prorated active time.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.fleet import Fleet, simulate_fleet
+from logic.timestep import DAYS_PER_YEAR, STEPS_PER_YEAR, simulate_scenarios_timestep
+
+CATALOG = pd.DataFrame({
+    "model": ["Rig A", "Rig B", "Rig C"],
+    "manufacturer": ["Acme", "Acme", "Other"],
+    "hashrate_ths": [200.0, 100.0, 335.0],
+    "power_kw": [3.5, 3.0, 5.3],
+    "cost": [5000.0, 1000.0, 8000.0],
+})
+MARKET = {"btc_price": 100_000.0, "btc_cagr": 15.0, "electricity_rate": 0.05, "network_hashrate_ehs": 900.0}
+
+
+@pytest.mark.parametrize("difficulty", [None, 115e12])
+@pytest.mark.parametrize("time_step", ["monthly", "daily"])
+def test_one_sku_fleet_matches_miners_only_scenario(difficulty, time_step):
+    investment, cost = 100_000.0, 5000.0
+    fleet = Fleet.from_tranches([("Rig A", int(investment // cost), "2027-01-01", None)], catalog=CATALOG)
+
+    result = simulate_fleet(fleet, "2027-01-01", 3, difficulty=difficulty, time_step=time_step, **MARKET)
+    scenario = simulate_scenarios_timestep(
+        investment, MARKET["btc_price"], MARKET["electricity_rate"], 3, cost, 200.0, 3.5,
+        MARKET["network_hashrate_ehs"], MARKET["btc_cagr"], start_year=2027, difficulty=difficulty,
+        scenarios=["Miners Only"], time_step=time_step,
+    )
+
+    np.testing.assert_allclose(result["btc_mined"][0], scenario["btc_mined"][0])
+    np.testing.assert_allclose(result["energy_cost"][0], scenario["energy_cost"][0])
+    assert result["capex"][0, 0] == investment
+
+
+def test_active_units_match_per_machine_brute_force():
+    rng = np.random.default_rng(0)
+    n = 200
+    start = np.datetime64("2026-01-01")
+    purchase = start + rng.integers(-100, 800, n).astype("timedelta64[D]")
+    retire = purchase + rng.integers(-30, 900, n).astype("timedelta64[D]")  # some retire before they are bought
+    tranches = pd.DataFrame({
+        "model": rng.choice(CATALOG["model"], n),
+        "count": rng.integers(1, 5, n),
+        "purchase_date": purchase,
+        "retirement_date": np.where(rng.random(n) < 0.2, np.datetime64("NaT"), retire),
+    })
+    fleet = Fleet.from_tranches(tranches, catalog=CATALOG)
+    result = simulate_fleet(fleet, str(start), 2, time_step="monthly", **MARKET)
+
+    step_days = DAYS_PER_YEAR / STEPS_PER_YEAR["monthly"]
+    edges = np.arange(2 * STEPS_PER_YEAR["monthly"] + 1) * step_days
+    expected = np.zeros_like(result["units"])
+    for i in range(n):
+        on = float((fleet.purchase_day[i] - start).astype(int))
+        off = float((fleet.retire_day[i] - start).astype(int))
+        overlap = np.clip(np.minimum(edges[1:], off) - np.maximum(edges[:-1], on), 0, None) / step_days
+        expected[fleet.sku_index[i]] += fleet.count[i] * overlap
+    np.testing.assert_allclose(result["units"], expected, atol=1e-9)
+
+    # Capex: purchases inside the window, except tranches retired by their purchase date
+    horizon = start + np.timedelta64(int(edges[-1]), "D")
+    bought = (fleet.purchase_day >= start) & (fleet.purchase_day < horizon) & (fleet.retire_day > fleet.purchase_day)
+    assert result["capex"].sum() == pytest.approx((fleet.count * fleet.unit_cost)[bought].sum())
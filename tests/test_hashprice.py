@@ -0,0 +1,76 @@
+#test_hashprice.py
+# Hashprice paths for the engines: replayed history aligned to calendar days
+# (gaps carried, days without a close dropped), projected tail, step lengths.
+
+import numpy as np
+import pytest
+
+from data.market_history import DAY_MS, MarketHistory
+from logic.engine import NETWORK_GROWTH
+from logic.hashprice import daily_hashprice_btc, hashprice_path
+from logic.timestep import STEPS_PER_YEAR
+
+D0 = 20_000  # days since the epoch (2024-10-04)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = MarketHistory(str(tmp_path))
+    # Two USD snapshots a day on days 0-9 except day 7; closes only on days 1 and 5
+    days = np.array([d for d in range(10) if d != 7])
+    t = np.repeat((D0 + days) * DAY_MS, 2) + np.tile([3_600_000, 7_200_000], len(days))
+    usd = np.repeat(0.05 * (days + 1), 2) + np.tile([-0.01, 0.01], len(days))
+    history.hashprice.append(t, usd)
+    history.btc_price.append([(D0 + 1) * DAY_MS, (D0 + 5) * DAY_MS], [50_000.0, 100_000.0])
+    return history
+
+
+def test_daily_hashprice_uses_the_latest_close(history):
+    days, btc = daily_hashprice_btc(history)
+
+    expected_days = [1, 2, 3, 4, 5, 6, 8, 9]  # day 0 has no close yet, day 7 no snapshots
+    assert days.tolist() == (np.array(expected_days) + D0).astype("datetime64[D]").tolist()
+    closes = np.where(np.array(expected_days) < 5, 50_000.0, 100_000.0)
+    np.testing.assert_allclose(btc, 0.05 * (np.array(expected_days) + 1) / closes)
+
+
+def test_replay_is_aligned_to_calendar_days(history):
+    days, btc = daily_hashprice_btc(history)
+    path = hashprice_path({"revenue_model": "replay", "years": 1, "start_year": 2026, "time_step": "daily"}, history)
+
+    assert path.shape == (STEPS_PER_YEAR["daily"],)
+    np.testing.assert_allclose(path[:9], btc[[0, 1, 2, 3, 4, 5, 5, 6, 7]])  # day 7 carries day 6
+    # Then projected from the mean of the replayed days, half a day of network growth on
+    tail_start = np.mean(path[:9]) / NETWORK_GROWTH ** (0.5 / 365)
+    assert path[9] == pytest.approx(tail_start)
+    assert (np.diff(path[9:]) < 0).all()
+
+    started = hashprice_path({"revenue_model": "replay", "years": 1, "time_step": "daily",
+                              "replay_start": str(np.datetime64(D0 + 5, "D"))}, history)
+    np.testing.assert_allclose(started[:4], btc[[4, 5, 5, 6]])
+
+
+@pytest.mark.parametrize("time_step, steps", [("yearly", 1), ("monthly", 12), ("weekly", 52), ("daily", 365)])
+def test_one_value_per_step(history, time_step, steps):
+    inputs = {"revenue_model": "replay", "years": 3, "start_year": 2026, "time_step": time_step}
+    path = hashprice_path(inputs, history)
+    daily = hashprice_path({**inputs, "time_step": "daily"}, history)
+
+    assert path.shape == (3 * steps,)
+    assert np.isfinite(path).all()
+    if time_step == "yearly":
+        np.testing.assert_allclose(path, daily.reshape(3, 365).mean(axis=1))
+
+
+def test_projection_halves_at_the_halving():
+    inputs = {"revenue_model": "hashprice", "years": 2, "start_year": 2028, "time_step": "daily",
+              "usd_per_th_per_day": 0.05, "btc_price": 100_000.0, "fees_btc": 0.0}
+    path = hashprice_path(inputs)
+    ratios = path[1:] / path[:-1]
+    assert path[0] == pytest.approx(0.05 / 100_000.0 / NETWORK_GROWTH ** (0.5 / 365))
+    assert np.sum(np.isclose(ratios, 0.5 / NETWORK_GROWTH ** (1 / 365))) == 1
+
+
+def test_missing_history_is_an_error(tmp_path):
+    with pytest.raises(ValueError, match="No stored hashprice"):
+        hashprice_path({"revenue_model": "replay", "years": 1}, MarketHistory(str(tmp_path)))
@@ -0,0 +1,110 @@
+#test_http_client.py
+# HttpClient with a fake transport: single-flight coalescing, the circuit
+# breaker's open / half-open / closed cycle, and stale responses.
+
+import threading
+import time
+
+import pytest
+import requests
+
+from data.http_client import CircuitOpenError, HttpClient, Response
+
+URL = "https://api.example.com/price"
+
+
+class FakeTransport:
+    """Answers from a queue of outcomes (Response or exception); blocks while `gate` is clear."""
+
+    def __init__(self, outcomes=None, default=None):
+        self.outcomes = list(outcomes or [])
+        self.default = default or Response(200, '{"price": 1}')
+        self.calls = 0
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params, headers, timeout):
+        self.gate.wait(5)
+        with self._lock:
+            self.calls += 1
+            outcome = self.outcomes.pop(0) if self.outcomes else self.default
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_concurrent_identical_gets_share_one_request():
+    transport = FakeTransport()
+    transport.gate.clear()
+    client = HttpClient(transport=transport)
+    results, n = [], 16
+
+    def get():
+        results.append(client.get(URL, params={"ids": "bitcoin"}).json())
+
+    threads = [threading.Thread(target=get) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while client.stats()["coalesced"] < n - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    transport.gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert transport.calls == 1
+    assert results == [{"price": 1}] * n
+    assert client.stats()["coalesced"] == n - 1
+
+    client.get(URL, params={"ids": "ethereum"})  # different params: its own request
+    assert transport.calls == 2
+
+
+def test_breaker_opens_after_threshold_and_recovers_after_cooldown():
+    transport = FakeTransport([requests.ConnectionError("down"), Response(503, ""), RuntimeError("bad transport")])
+    client = HttpClient(transport=transport, failure_threshold=3, cooldown=0.05)
+
+    for _ in range(3):
+        with pytest.raises(Exception):
+            client.get(URL)
+    assert client.stats()["open_circuits"] == ["api.example.com"]
+
+    # Open: fails fast without calling the transport
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)
+    assert transport.calls == 3
+
+    # Half-open after the cooldown: one probe closes the breaker again
+    time.sleep(0.06)
+    assert client.get(URL).status_code == 200
+    assert transport.calls == 4
+    assert client.stats()["open_circuits"] == []
+
+
+def test_failed_probe_reopens_the_breaker():
+    transport = FakeTransport([requests.Timeout()] * 2 + [RuntimeError("probe fails")])
+    client = HttpClient(transport=transport, failure_threshold=2, cooldown=0.05)
+    for _ in range(2):
+        with pytest.raises(requests.Timeout):
+            client.get(URL)
+
+    time.sleep(0.06)
+    with pytest.raises(RuntimeError):
+        client.get(URL)  # the probe
+    with pytest.raises(CircuitOpenError):
+        client.get(URL)  # open again for another cooldown
+
+    time.sleep(0.06)
+    assert client.get(URL).status_code == 200  # the next probe is let through
+
+
+def test_last_good_response_is_served_while_failing():
+    transport = FakeTransport([Response(200, '{"price": 7}'), requests.ConnectionError("down"), Response(500, "")])
+    client = HttpClient(transport=transport, failure_threshold=5)
+
+    assert client.get(URL).json() == {"price": 7}
+    for _ in range(2):
+        response = client.get(URL)
+        assert response.stale and response.json() == {"price": 7}
+    assert client.stats()["stale_served"] == 2
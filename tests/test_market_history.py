@@ -0,0 +1,84 @@
+#test_market_history.py
+# The memmapped market history: append/read round-trips, windows, and tail-only
+# price syncs.
+
+import numpy as np
+
+from data.market_history import DAY_MS, RECORD, MarketHistory, Series, downsample
+
+T0 = 1_700_000_000_000 - 1_700_000_000_000 % DAY_MS
+
+
+def test_append_and_read_round_trip(tmp_path):
+    series = Series("price", str(tmp_path))
+    assert len(series.read()) == 0 and series.last_timestamp() is None
+
+    t = T0 + np.arange(10) * DAY_MS
+    assert series.append(t[[3, 0, 1, 2, 4]], [3.0, 0.0, 1.0, 2.0, 4.0]) == 5  # sorted on the way in
+    assert series.append(t[3:], np.arange(3, 10) * 10.0) == 5  # only records after the last one
+    assert series.append(t[:5], np.zeros(5)) == 0
+
+    records = series.read()
+    assert isinstance(records, np.memmap) and not records.flags.writeable
+    np.testing.assert_array_equal(records["t"], t)
+    np.testing.assert_array_equal(records["v"], [0, 1, 2, 3, 4, 50, 60, 70, 80, 90])
+
+    reopened = Series("price", str(tmp_path)).read()
+    np.testing.assert_array_equal(reopened, records)
+
+
+def test_repeated_timestamps_keep_the_last_value(tmp_path):
+    series = Series("price", str(tmp_path))
+    series.append([T0, T0, T0 + DAY_MS], [1.0, 2.0, 3.0])
+    assert series.read()["v"].tolist() == [2.0, 3.0]
+
+
+def test_torn_trailing_record_is_ignored(tmp_path):
+    series = Series("price", str(tmp_path))
+    series.append([T0, T0 + DAY_MS], [1.0, 2.0])
+    with open(series.file, "ab") as f:
+        f.write(b"\x00" * (RECORD.itemsize // 2))
+    assert Series("price", str(tmp_path)).read()["v"].tolist() == [1.0, 2.0]
+
+
+def test_window_is_a_view_of_the_last_days(tmp_path):
+    series = Series("price", str(tmp_path))
+    series.append(T0 + np.arange(30) * DAY_MS, np.arange(30.0))
+
+    window = series.window(7)
+    assert window["v"].tolist() == list(np.arange(23.0, 30.0))
+    assert np.shares_memory(window, series.read())
+    assert series.window(3, end=int(T0 + 10 * DAY_MS))["v"].tolist() == [8.0, 9.0, 10.0]
+    assert len(series.window()) == 30
+
+
+def test_downsample_bucket_means():
+    records = np.empty(10, RECORD)
+    records["t"] = np.arange(10)
+    records["v"] = np.arange(10.0)
+    out = downsample(records, 3)
+    assert out["v"].tolist() == [1.0, 4.0, 7.5]
+    assert out["t"].tolist() == [2, 5, 9]
+
+
+def test_sync_fetches_only_missing_days_and_skips_today(tmp_path):
+    history = MarketHistory(str(tmp_path))
+    requested = []
+
+    def sync(now_ms):
+        today = now_ms - now_ms % DAY_MS
+
+        def fetch(days):  # daily closes up to today, then the live price
+            requested.append(days)
+            return [[today - i * DAY_MS, 100.0 + i] for i in range(days, -1, -1)] + [[now_ms, 999.0]]
+
+        return history.sync_prices(fetch, now_ms=now_ms)
+
+    assert sync(T0 + DAY_MS // 2) == (T0 + DAY_MS // 2, 999.0)
+    assert history.btc_price.last_timestamp() == T0  # the live intraday point is not stored
+    sync(T0 + 3 * DAY_MS + 1)
+
+    assert requested == [365, 4]
+    t = history.btc_price.read()["t"]
+    np.testing.assert_array_equal(np.diff(t), DAY_MS)
+    assert len(t) == 366 + 3 and t[-1] == T0 + 3 * DAY_MS
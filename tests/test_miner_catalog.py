@@ -0,0 +1,69 @@
+#test_miner_catalog.py
+# MinerCatalog lookups: exact keys, pending upserts, bulk merges, and fuzzy
+# matching of scraped names with brand prefixes and punctuation.
+
+import pandas as pd
+import pytest
+
+from data.miner_catalog import MinerCatalog, fuzzy_key
+
+CATALOG = pd.DataFrame({
+    "manufacturer": ["Bitmain", "Bitmain", "Bitmain", "MicroBT", "MicroBT"],
+    "model": ["S21", "S21+", "S21 XP Hydro", "M63S", "M63S++"],
+    "hashrate_ths": [200.0, 216.0, 473.0, 408.0, 478.0],
+})
+
+
+@pytest.mark.parametrize("name, key", [
+    ("Antminer S21", "s21"),
+    ("S-21", "s21"),
+    ("  bitmain  ANTMINER s21+ ", "s21+"),
+    ("Antminer S21 XP Hydro", "s21xphydro"),
+    ("Whatsminer", "whatsminer"),  # a bare brand is left alone
+])
+def test_fuzzy_key(name, key):
+    assert fuzzy_key(name) == key
+
+
+@pytest.mark.parametrize("name, model", [
+    ("Antminer S21", "S21"),
+    ("S-21", "S21"),
+    ("Antminer S21+", "S21+"),
+    ("Whatsminer M63S++", "M63S++"),
+    ("Antminer S21 XP Hyd.", "S21 XP Hydro"),  # trigram match
+    ("S21 XP Hydr0", "S21 XP Hydro"),
+])
+def test_fuzzy_lookup_resolves_scraped_names(name, model):
+    catalog = MinerCatalog(CATALOG, fuzzy=True)
+    assert catalog.fuzzy_lookup(name)["model"] == model
+
+
+def test_fuzzy_lookup_rejects_unrelated_names():
+    catalog = MinerCatalog(CATALOG)
+    assert catalog.fuzzy_lookup("Avalon A1566") is None
+    assert catalog.fuzzy_lookup("---") is None
+
+
+def test_upserted_miners_are_found_by_every_lookup():
+    catalog = MinerCatalog(CATALOG, fuzzy=True)
+    assert catalog.upsert({"manufacturer": "Bitmain", "model": "S23 Hydro", "hashrate_ths": 580.0})
+    assert not catalog.upsert({"manufacturer": "bitmain", "model": "s21", "hashrate_ths": 201.0})
+
+    assert catalog.lookup("S23 HYDRO", "Bitmain")["hashrate_ths"] == 580.0
+    assert catalog.fuzzy_lookup("Antminer S23-Hydro")["model"] == "S23 Hydro"
+    assert catalog.lookup("S21")["hashrate_ths"] == 201.0
+    assert len(catalog) == 6 and len(catalog.frame()) == 6
+
+
+def test_merge_updates_existing_rows_and_appends_new_ones():
+    catalog = MinerCatalog(CATALOG)
+    added = catalog.merge(pd.DataFrame({
+        "manufacturer": ["MicroBT", "Canaan", "Canaan"],
+        "model": ["M63S", "A1566", "A1566"],
+        "hashrate_ths": [410.0, 185.0, 190.0],  # later duplicate wins
+    }))
+
+    assert added == 1
+    assert catalog.lookup("M63S", "MicroBT")["hashrate_ths"] == 410.0
+    assert catalog.lookup("A1566", "Canaan")["hashrate_ths"] == 190.0
+    assert catalog.fuzzy_lookup("Avalon A1566")["model"] == "A1566"
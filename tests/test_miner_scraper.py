@@ -0,0 +1,103 @@
+#test_miner_scraper.py
+# scrape_many against a local stub of the specs site: parsing, retries on 5xx,
+# the on-disk cache and ETag revalidation.
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrape.miner_scraper import scrape_many
+
+SEARCH_PAGE = '<div class="miner-list"><a href="/miner/{q}">{q}</a></div>'
+SPECS_PAGE = (
+    '<table class="specs">'
+    "<tr><td>Noise level</td><td>75 dB</td></tr>"
+    "<tr><td>Size</td><td>400 x 195 x 290</td></tr>"
+    "<tr><td>Weight</td><td>14 kg</td></tr>"
+    "</table>"
+)
+ETAG = '"v1"'
+
+
+@pytest.fixture
+def stub_site():
+    counts = {"requests": 0, "not_modified": 0, "failed": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with lock:
+                counts["requests"] += 1
+                # "flaky" searches fail twice before succeeding
+                if self.path.startswith("/search") and "flaky" in self.path and counts["failed"] < 2:
+                    counts["failed"] += 1
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    return
+                if self.path.startswith("/miner") and self.headers.get("If-None-Match") == ETAG:
+                    counts["not_modified"] += 1
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+            if self.path.startswith("/search"):
+                body = SEARCH_PAGE.format(q=self.path.split("q=")[1]).encode()
+            elif self.path.startswith("/miner"):
+                body = SPECS_PAGE.encode()
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", counts
+    server.shutdown()
+    server.server_close()
+
+
+def scrape(names, base_url, cache_dir, **kwargs):
+    return scrape_many(names, rate_per_sec=200, backoff=0.01, cache_dir=cache_dir, base_url=base_url, **kwargs)
+
+
+def test_scrapes_specs_and_retries_server_errors(stub_site, tmp_path):
+    base_url, counts = stub_site
+    names = [f"Model {i}" for i in range(12)] + ["Model 3", "flaky one"]
+
+    specs = scrape(names, base_url, str(tmp_path))
+
+    assert set(specs) == set(names)  # duplicates scraped once
+    assert specs["Model 3"]["Noise Level (dB)"] == "75 dB"
+    assert (specs["Model 3"]["Length (mm)"], specs["Model 3"]["Width (mm)"], specs["Model 3"]["Height (mm)"]) == (
+        "400", "195", "290")
+    assert specs["flaky one"] is not None
+    assert counts["failed"] == 2
+    assert counts["requests"] == 2 * 13 + 2
+
+
+def test_fresh_cache_entries_skip_the_network(stub_site, tmp_path):
+    base_url, counts = stub_site
+    names = [f"Model {i}" for i in range(5)]
+    first = scrape(names, base_url, str(tmp_path))
+    sent = counts["requests"]
+
+    assert scrape(names, base_url, str(tmp_path)) == first
+    assert counts["requests"] == sent
+
+
+def test_stale_cache_entries_are_revalidated(stub_site, tmp_path):
+    base_url, counts = stub_site
+    names = [f"Model {i}" for i in range(5)]
+    first = scrape(names, base_url, str(tmp_path))
+
+    assert scrape(names, base_url, str(tmp_path), ttl=0) == first
+    assert counts["not_modified"] == len(names)  # spec pages answered 304 from the stored ETag
@@ -0,0 +1,82 @@
+#test_miner_store.py
+# The columnar miner store: catalog-only schema, round-trips, and the CSV as
+# source of truth (edited CSVs are re-imported, the app's own writes are not).
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from data import miner_data, miner_store  # noqa: E402
+
+CATALOG = pd.DataFrame({
+    "model": ["Rig A", "Rig B", "Rig C"],
+    "hashrate_ths": [200.0, 100.0, 335.0],
+    "efficiency": [17.5, 30.0, 15.8],
+    "cost": [5000.0, 1000.0, 8000.0],
+    "power_kw": [3.5, 3.0, 5.3],
+})
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # CSV and store paths are relative
+    monkeypatch.setattr(miner_data, "_catalog_cache", (None, None))
+    monkeypatch.setattr(miner_data, "_frontier_cache", None)
+    CATALOG.to_csv(miner_data.CSV_FILE, index=False)
+    return tmp_path
+
+
+def bump_mtime(path, seconds=5):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + int(seconds * 1e9)))
+
+
+def test_store_round_trips_and_appends(workdir):
+    miner_store.write_store(CATALOG)
+    miner_store.append_rows(CATALOG.iloc[[0]].assign(model="Rig D", noise="75 dB"))
+
+    df = miner_store.read_store()
+    assert df["model"].tolist() == ["Rig A", "Rig B", "Rig C", "Rig D"]
+    np.testing.assert_allclose(df["hashrate_ths"], [200.0, 100.0, 335.0, 200.0])
+    assert df["noise"].isna().tolist() == [True, True, True, False]
+
+    miner_store.compact()
+    assert len(miner_store.store_signature()) == 1
+    pd.testing.assert_frame_equal(miner_store.read_store(), df)
+
+
+def test_derived_columns_are_not_persisted(workdir):
+    enriched = CATALOG.assign(daily_revenue=10.0, daily_profit=5.0, break_even=3.0, run_fraction=0.5, noise="75 dB")
+    miner_data.save_data(enriched)
+    miner_store.append_rows(enriched.iloc[[0]].assign(model="Rig D"))
+
+    for df in (miner_store.read_store(), pd.read_csv(miner_data.CSV_FILE)):
+        assert not set(miner_store.DERIVED_COLUMNS) & set(df.columns)
+        assert "noise" in df.columns
+
+
+def test_edited_csv_is_reimported(workdir):
+    assert len(miner_data.load_data()) == 3  # first load imports the CSV
+    signature = miner_data.data_signature()
+
+    pd.concat([CATALOG, CATALOG.iloc[[0]].assign(model="Rig D")]).to_csv(miner_data.CSV_FILE, index=False)
+    bump_mtime(miner_data.CSV_FILE)
+
+    assert miner_data.data_signature() != signature
+    assert miner_data.load_data()["model"].tolist()[-1] == "Rig D"
+
+
+def test_added_miners_do_not_trigger_a_reimport(workdir):
+    miner_data.load_data()
+    message = miner_data.update_csv({"Model": "Rig D", "Manufacturer": "Acme", "Hashrate (TH/s)": 500.0,
+                                     "Power (W)": 1000.0, "Efficiency (J/TH)": 2.0})
+    assert message.startswith("✅")
+
+    signature = miner_data.data_signature()
+    assert len(signature[1]) == 2  # the import plus one appended segment, not rewritten
+    assert "Rig D" in miner_data.load_data()["model"].tolist()
+    assert "Rig D" in pd.read_csv(miner_data.CSV_FILE)["model"].tolist()
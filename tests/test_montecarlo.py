@@ -0,0 +1,69 @@
+#test_montecarlo.py
+# Monte Carlo mode: with no volatility and no jumps every path is the fixed
+# btc_cagr / NETWORK_GROWTH path, so it must reproduce the deterministic engine.
+
+import numpy as np
+
+from logic.engine import SCENARIOS, simulate_scenarios_array
+from logic.montecarlo import MC_METRICS, _simulate_block, price_path_factors, run_monte_carlo
+from logic.simulate import filter_simulate_inputs
+
+USER_INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 6,
+    "miner_cost": 3_500.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 900.0,
+    "btc_cagr": 25.0,
+    "start_year": 2026,
+    "difficulty": None,  # share of network: the hashrate path matters too
+    "fees_btc": 0.025,
+    "block_reward": 3.125,
+}
+FLAT = {"price_kwargs": {"volatility": 0.0, "jump_intensity": 0.0}, "hashrate_kwargs": {"volatility": 0.0}}
+
+
+def deterministic():
+    result = simulate_scenarios_array(scenarios=SCENARIOS, **filter_simulate_inputs(USER_INPUTS))
+    return {"roi": result["roi"][..., -1], "breakeven_months": result["cpbm_months"], "irr": result["irr"]}
+
+
+def test_zero_volatility_paths_equal_the_deterministic_engine():
+    inputs = filter_simulate_inputs(USER_INPUTS)
+    seed = np.random.SeedSequence(0)
+    block = _simulate_block((inputs, SCENARIOS, 7, seed, FLAT["price_kwargs"], FLAT["hashrate_kwargs"]))
+
+    expected = deterministic()
+    for metric in MC_METRICS:
+        assert block[metric].shape == (7, len(SCENARIOS))
+        np.testing.assert_allclose(block[metric], np.broadcast_to(expected[metric], (7, len(SCENARIOS))),
+                                   rtol=1e-5, err_msg=metric)  # summaries are float32
+
+
+def test_zero_volatility_bands_collapse_to_the_deterministic_value():
+    bands = run_monte_carlo(USER_INPUTS, n_paths=50, block_size=20, max_workers=1, **FLAT)
+    expected = deterministic()
+
+    for metric in MC_METRICS:
+        rows = bands[bands["Metric"] == metric].set_index("Scenario").loc[SCENARIOS]
+        for column in ("P5", "P50", "P95"):
+            np.testing.assert_allclose(rows[column], expected[metric], rtol=1e-5, err_msg=f"{metric} {column}")
+        np.testing.assert_array_equal(rows["Defined Share"], ~np.isnan(expected[metric]))
+
+
+def test_price_drift_keeps_the_expected_price_on_btc_cagr():
+    rng = np.random.default_rng(0)
+    factors = price_path_factors(rng, 200_000, 3, btc_cagr=20.0, volatility=0.6, jump_intensity=1.0,
+                                 jump_mean=-0.1, jump_std=0.2)
+    np.testing.assert_allclose(factors.mean(axis=0), 1.2 ** np.arange(1, 4), rtol=0.02)
+
+
+def test_results_depend_on_seed_not_workers():
+    kwargs = {"n_paths": 40, "block_size": 15, "seed": 3}
+    in_process = run_monte_carlo(USER_INPUTS, max_workers=1, **kwargs)
+    pooled = run_monte_carlo(USER_INPUTS, max_workers=2, **kwargs)
+    assert in_process.equals(pooled)
+    assert not in_process.equals(run_monte_carlo(USER_INPUTS, max_workers=1, **{**kwargs, "seed": 4}))
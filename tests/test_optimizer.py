@@ -0,0 +1,82 @@
+#test_optimizer.py
+# The miner-mix optimizer: budget and power cap always hold, and small
+# instances against brute-force enumeration of every integer mix.
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.optimizer import optimize_miner_mix, unit_cashflows
+from utils.finance import npv
+from utils.metrics import calculate_profitability_metrics
+
+MARKET = {"electricity_rate": 0.05, "btc_price": 100_000.0, "usd_per_th_per_day": 0.05}
+
+
+def unit_npv(df, years=5, discount_rate=0.10):
+    metrics = calculate_profitability_metrics(df, btc_price=MARKET["btc_price"], electricity_rate=MARKET["electricity_rate"],
+                                              usd_per_th_per_day=MARKET["usd_per_th_per_day"])
+    flows = np.nan_to_num(unit_cashflows(metrics, years))
+    return npv(discount_rate, np.column_stack([-df["cost"].to_numpy(), flows]))
+
+
+def brute_force(df, budget, power_cap):
+    cost, power, value = df["cost"].to_numpy(), df["power_kw"].to_numpy(), unit_npv(df)
+    limits = [int(min(budget // c, power_cap // p)) for c, p in zip(cost, power)]
+    best = 0.0
+    for x in itertools.product(*(range(n + 1) for n in limits)):
+        x = np.array(x)
+        if x @ cost <= budget and x @ power <= power_cap:
+            best = max(best, float(x @ value))
+    return best
+
+
+def random_catalog(rng, n=3):
+    return pd.DataFrame({
+        "model": [f"m{i}" for i in range(n)],
+        "hashrate_ths": rng.uniform(50, 400, n),
+        "power_kw": rng.uniform(1.5, 6, n),
+        "cost": rng.integers(5, 60, n) * 100.0,
+    })
+
+
+def test_matches_brute_force_where_greedy_alone_does_not():
+    # A has the best NPV per dollar, so the greedy fill buys one and strands $4,000;
+    # two of B are worth more, which the swap search must find
+    df = pd.DataFrame({"model": ["A", "B", "C"], "hashrate_ths": [300.0, 240.0, 60.0],
+                       "power_kw": [3.0, 2.5, 2.0], "cost": [6000.0, 5000.0, 4000.0]})
+    value = unit_npv(df)
+    assert value[0] / 6000 > value[1] / 5000 > 0 and 2 * value[1] > value[0] + max(value[2], 0)
+
+    result = optimize_miner_mix(df, 10_000.0, power_cap_kw=100.0, **MARKET)
+
+    assert result["npv"] == pytest.approx(brute_force(df, 10_000.0, 100.0))
+    assert dict(zip(result["allocation"]["model"], result["allocation"]["units"])) == {"B": 2}
+    assert result["rounds"] >= 1
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_never_exceeds_budget_or_power_cap(seed):
+    rng = np.random.default_rng(seed)
+    df = random_catalog(rng)
+    budget, power_cap = float(rng.integers(50, 300) * 100), float(rng.uniform(10, 40))
+
+    for objective in ("npv", "irr"):
+        result = optimize_miner_mix(df, budget, power_cap_kw=power_cap, objective=objective, **MARKET)
+        allocation = result["allocation"]
+        assert result["spent"] == allocation["total_cost"].sum() <= budget
+        assert result["power_kw"] == pytest.approx(allocation["total_power_kw"].sum())
+        assert result["power_kw"] <= power_cap + 1e-9
+
+    # Local search is a heuristic: never above the true optimum, which the LP bound caps
+    best = brute_force(df, budget, power_cap)
+    assert result["npv"] <= best + 1e-6 <= result["upper_bound_npv"] + 1e-6
+
+
+def test_max_units_caps_each_miner():
+    df = pd.DataFrame({"model": ["A", "B"], "hashrate_ths": [300.0, 100.0], "power_kw": [3.0, 3.0],
+                       "cost": [1000.0, 1000.0], "max_units": [2, np.nan]})
+    result = optimize_miner_mix(df, 5_000.0, power_cap_kw=100.0, **MARKET)
+    assert dict(zip(result["allocation"]["model"], result["allocation"]["units"])) == {"A": 2, "B": 3}
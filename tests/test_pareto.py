@@ -0,0 +1,105 @@
+#test_pareto.py
+# The sort-based skyband against a brute-force O(n^2) one, incremental adds
+# against a rebuild, and top_k against full scoring.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.pareto import ParetoFrontier, objective_matrix, skyband
+from utils.scoring import _prepare, calculate_miner_scores
+
+WEIGHTS = {"eff_score": 0.3, "cost_score": 0.2, "profit_score": 0.3, "margin_score": 0.2, "age_score": 0.0}
+
+
+def catalog(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "model": [f"m{i}" for i in range(n)],
+        "efficiency": rng.random(n) * 30,
+        "daily_profit": rng.normal(size=n),
+        "daily_revenue": rng.random(n) + 1,
+        "cost": rng.integers(1000, 5000, n).astype(float),  # repeated values: ties
+    })
+
+
+def brute_force_counts(values):
+    le = (values[None, :, :] <= values[:, None, :]).all(axis=2)
+    lt = (values[None, :, :] < values[:, None, :]).any(axis=2)
+    return (le & lt).sum(axis=1)
+
+
+@pytest.mark.parametrize("n", [1, 600, 2500])
+@pytest.mark.parametrize("k", [1, 5, 10])
+def test_skyband_matches_brute_force(n, k):
+    values = objective_matrix(_prepare(catalog(n)))
+    counts = brute_force_counts(values)
+
+    keep, kept_counts = skyband(values, k)
+
+    assert sorted(keep) == list(np.flatnonzero(counts < k))
+    np.testing.assert_array_equal(kept_counts, counts[keep])
+
+
+def test_incremental_adds_match_rebuild():
+    df = catalog(2500, seed=1)
+    frontier = ParetoFrontier(df.iloc[:2000], band=5)
+    frontier.add(df.iloc[2000:2300])
+    for i in range(2300, 2500):
+        frontier.add(df.iloc[[i]])
+
+    rebuilt = ParetoFrontier(df, band=5)
+
+    assert frontier.models == df["model"].tolist()
+    assert set(frontier.skyband()["model"]) == set(rebuilt.skyband()["model"])
+    assert set(frontier.frontier()["model"]) == set(rebuilt.frontier()["model"])
+
+
+def test_add_scores_raw_rows_and_drops_unpriced_ones():
+    def metrics(rows):
+        rows = rows.copy()
+        rows["daily_revenue"] = rows["hashrate_ths"] * 0.05
+        rows["daily_profit"] = rows["daily_revenue"] - rows["power_kw"] * 24 * 0.05
+        return rows
+
+    df = metrics(catalog(200, seed=2).assign(hashrate_ths=200.0, power_kw=3.0))
+    frontier = ParetoFrontier(df, band=3, metrics=metrics)
+    best = pd.DataFrame([{"model": "best", "efficiency": 0.0, "cost": 1.0, "hashrate_ths": 500.0, "power_kw": 1.0}])
+    unpriced = pd.DataFrame([{"model": "unpriced", "efficiency": 0.1, "hashrate_ths": 500.0, "power_kw": 1.0}])
+
+    assert frontier.add(best) == 1
+    assert frontier.add(unpriced) == 0
+    assert frontier.frontier()["model"].tolist() == ["best"]
+    assert frontier.models[-2:] == ["best", "unpriced"]
+
+
+def test_top_k_matches_full_scoring():
+    df = catalog(2500, seed=3)
+    frontier = ParetoFrontier(df, band=5)
+
+    assert frontier.top_k(WEIGHTS, 5)["model"].tolist() == calculate_miner_scores(df, WEIGHTS, k=5)["model"].tolist()
+
+
+def test_update_csv_extends_the_cached_frontier(tmp_path, monkeypatch):
+    from data import miner_data
+
+    monkeypatch.chdir(tmp_path)  # relative CSV and store paths
+    monkeypatch.setattr(miner_data, "_catalog_cache", (None, None))
+    monkeypatch.setattr(miner_data, "_frontier_cache", None)
+    catalog(50, seed=4).assign(hashrate_ths=200.0, power_kw=3.0).drop(columns=["daily_profit", "daily_revenue"]).to_csv(
+        miner_data.CSV_FILE, index=False)
+
+    def metrics(rows):
+        rows = rows.copy()
+        rows["daily_revenue"] = rows["hashrate_ths"] * 0.05
+        rows["daily_profit"] = rows["daily_revenue"] - rows["power_kw"] * 24 * 0.05
+        return rows
+
+    df = miner_data.load_data()
+    frontier = miner_data.get_frontier(metrics(df), key="market", metrics=metrics)
+    message = miner_data.update_csv({"Model": "New Rig", "Manufacturer": "Acme", "Hashrate (TH/s)": 500.0,
+                                     "Power (W)": 1000.0, "Efficiency (J/TH)": 2.0})
+
+    assert message.startswith("✅")
+    assert frontier.models[-1] == miner_data.load_data()["model"].iloc[-1]
+    assert miner_data.get_frontier(metrics(miner_data.load_data()), key="market") is frontier
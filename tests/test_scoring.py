@@ -0,0 +1,81 @@
+#test_scoring.py
+# NumPy scoring against the original MinMaxScaler-based ranking, top-k against
+# a full sort, and weight sensitivity against one scoring per weighting.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.scoring import SCORE_FEATURES, calculate_miner_scores, top_k, weight_sensitivity
+
+WEIGHTS = {"eff_score": 0.3, "cost_score": 0.2, "profit_score": 0.3, "margin_score": 0.1, "age_score": 0.1}
+
+
+def catalog(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "model": [f"m{i}" for i in range(n)],
+        "efficiency": rng.uniform(12, 40, n),
+        "daily_profit": rng.normal(5, 10, n),
+        "daily_revenue": rng.uniform(5, 30, n),
+        "cost": rng.integers(500, 9000, n).astype(float),
+        "release year": rng.integers(2016, 2026, n),
+    })
+    df.loc[3, "daily_profit"] = np.nan  # dropped by both
+    return df
+
+
+def baseline_scores(df, weights):
+    # The ranking before the NumPy rewrite (sklearn MinMaxScaler, column by column)
+    MinMaxScaler = pytest.importorskip("sklearn.preprocessing").MinMaxScaler
+    df = df.copy()
+    df["margin"] = df["daily_profit"] / df["daily_revenue"] * 100
+    df = df.dropna(subset=["efficiency", "daily_profit", "cost", "margin"]).copy()
+    norm = MinMaxScaler().fit_transform(df[["efficiency", "daily_profit", "cost", "margin"]])
+    df["eff_score"] = 1 - norm[:, 0]
+    df["profit_score"] = norm[:, 1]
+    df["cost_score"] = 1 - norm[:, 2]
+    df["margin_score"] = norm[:, 3]
+    df["age"] = pd.Timestamp.now().year - df["release year"]
+    df["age_score"] = 1 - MinMaxScaler().fit_transform(df[["age"]])[:, 0]
+    df["overall_score"] = sum(weights[f] * df[f] for f in SCORE_FEATURES)
+    df["rank"] = df["overall_score"].rank(ascending=False)
+    return df.sort_values("overall_score", ascending=False)
+
+
+def test_scores_match_the_baseline_ranking():
+    df = catalog()
+    expected = baseline_scores(df, WEIGHTS)
+    actual = calculate_miner_scores(df, WEIGHTS)
+
+    assert actual["model"].tolist() == expected["model"].tolist()
+    for column in (*SCORE_FEATURES, "overall_score", "rank"):
+        np.testing.assert_allclose(actual[column], expected[column], rtol=1e-12, err_msg=column)
+
+    assert calculate_miner_scores(df, WEIGHTS, k=5)["model"].tolist() == expected["model"].tolist()[:5]
+
+
+def test_missing_columns_and_empty_frames():
+    with pytest.raises(KeyError, match="cost"):
+        calculate_miner_scores(catalog().drop(columns="cost"), WEIGHTS)
+    empty = calculate_miner_scores(catalog().assign(daily_profit=np.nan), WEIGHTS)
+    assert empty.empty and {"overall_score", "rank"} <= set(empty.columns)
+
+
+@pytest.mark.parametrize("k", [1, 7, 50])
+def test_top_k_matches_a_full_sort(k):
+    scores = np.random.default_rng(1).random((40, 6))
+    expected = np.argsort(-scores, axis=0, kind="stable")[:k]
+    np.testing.assert_array_equal(top_k(scores, k), expected)
+
+
+def test_weight_sensitivity_matches_scoring_each_weighting():
+    df = catalog(seed=2)
+    weightings = np.random.default_rng(3).dirichlet(np.ones(len(SCORE_FEATURES)), 25)
+    result = weight_sensitivity(df, weightings, k=3).set_index("model")
+
+    hits = pd.Series(0.0, index=result.index)
+    for w in weightings:
+        top = calculate_miner_scores(df, dict(zip(SCORE_FEATURES, w)), k=3)["model"]
+        hits[top] += 1
+    np.testing.assert_allclose(result["top_k_share"], hits[result.index] / len(weightings))
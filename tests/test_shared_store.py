@@ -0,0 +1,80 @@
+#test_shared_store.py
+# Read-only shared tables: views share the frozen buffers, writes into them
+# raise, per-session column changes stay local, and builds run once per key.
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.shared_store import SharedFrame, SharedStore
+
+
+def table():
+    return pd.DataFrame({
+        "model": ["Rig A", "Rig B", "Rig C"],
+        "hashrate_ths": [200.0, 100.0, 335.0],
+        "units": pd.array([1, None, 3], dtype="Int64"),
+        "maker": pd.Categorical(["Acme", "Acme", "Other"]),
+    })
+
+
+def test_views_share_buffers_and_refuse_writes():
+    source = table()
+    frame = SharedFrame(source)
+    a, b = frame.view(), frame.view()
+
+    assert np.shares_memory(a["hashrate_ths"].to_numpy(), b["hashrate_ths"].to_numpy())
+    assert not np.shares_memory(a["hashrate_ths"].to_numpy(), source["hashrate_ths"].to_numpy())
+    with pytest.raises(ValueError, match="read-only"):
+        a["hashrate_ths"].to_numpy()[0] = 1.0
+    with pytest.raises(ValueError, match="read-only"):
+        a["units"].array._data[0] = 9
+    with pytest.raises(ValueError, match="read-only"):
+        a["maker"].array.codes[0] = 1
+
+    source.loc[0, "hashrate_ths"] = -1.0  # the source frame is no longer tied to the store
+    pd.testing.assert_frame_equal(b, table())
+
+
+def test_column_changes_stay_in_one_view():
+    frame = SharedFrame(table())
+    a = frame.view()
+    a["hashrate_ths"] = a["hashrate_ths"] * 2  # replaced, not written through
+    a["daily_profit"] = 1.0
+
+    b = frame.view()
+    assert b["hashrate_ths"].tolist() == [200.0, 100.0, 335.0]
+    assert "daily_profit" not in b.columns
+
+
+def test_store_builds_once_under_concurrent_views():
+    store = SharedStore()
+    calls, release = [], threading.Event()
+
+    def build():
+        calls.append(1)
+        release.wait(5)
+        return table()
+
+    views = []
+    threads = [threading.Thread(target=lambda: views.append(store.view("catalog", build))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1 and len(views) == 8
+    assert all(np.shares_memory(v["hashrate_ths"].to_numpy(), views[0]["hashrate_ths"].to_numpy()) for v in views)
+    assert store.stats()["misses"] == 1
+
+
+def test_store_evicts_by_bytes():
+    nbytes = SharedFrame(table()).nbytes
+    store = SharedStore(max_bytes=int(2.5 * nbytes))
+    for key in "abc":
+        store.put(key, table())
+    assert store.get("a") is None and store.get("b") is not None and store.get("c") is not None
+    assert store.stats()["evictions"] == 1
@@ -0,0 +1,64 @@
+#test_sweep.py
+# Grid sweeps against simulate_all_scenarios run one cell at a time.
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic.engine import SCENARIOS
+from logic.simulate import simulate_all_scenarios
+from logic.sweep import iter_sweep_chunks, sweep_grid, sweep_to_frame
+
+USER_INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 8,
+    "miner_cost": 3_500.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 900.0,
+    "btc_cagr": 15.0,
+    "start_year": 2026,
+    "difficulty": 115e12,
+    "fees_btc": 0.025,
+    "block_reward": 3.125,
+}
+GRID = {"btc_price": [60_000.0, 100_000.0, 150_000.0], "electricity_rate": [0.03, 0.08], "btc_cagr": [-5.0, 20.0]}
+COLUMNS = {"irr": "IRR (%)", "cpbm_months": "CPBM (Months)", "ppi": "PPI", "annual_profit": "Annual Profit"}
+
+
+def single_run(**params):
+    df = simulate_all_scenarios({**USER_INPUTS, **params})
+    last = df.groupby("Scenario", sort=False).tail(1).set_index("Scenario").loc[SCENARIOS]
+    return {"final_roi": last["ROI ($)"].to_numpy(dtype=float),
+            **{field: last[column].to_numpy(dtype=float) for field, column in COLUMNS.items()}}
+
+
+@pytest.mark.parametrize("difficulty", [115e12, None])
+def test_every_grid_point_matches_simulate_all_scenarios(difficulty):
+    user_inputs = {**USER_INPUTS, "difficulty": difficulty}
+    result = sweep_grid(user_inputs, GRID, fields=("final_roi", *COLUMNS, "roi"))
+
+    assert result["dims"] == ("btc_price", "electricity_rate", "btc_cagr", "scenario")
+    assert result["data"]["roi"].shape == (3, 2, 2, len(SCENARIOS), USER_INPUTS["years"])
+    for index in itertools.product(*(range(len(v)) for v in GRID.values())):
+        params = {name: values[i] for (name, values), i in zip(GRID.items(), index)}
+        expected = single_run(difficulty=difficulty, **params)
+        for field, values in expected.items():
+            np.testing.assert_allclose(result["data"][field][index], values, rtol=1e-9, err_msg=f"{field} at {params}")
+
+
+def test_chunks_match_the_full_frame():
+    full = sweep_to_frame(sweep_grid(USER_INPUTS, GRID))
+    chunked = pd.concat(iter_sweep_chunks(USER_INPUTS, GRID, chunk_size=5), ignore_index=True)
+
+    assert len(full) == 12 * len(SCENARIOS)
+    pd.testing.assert_frame_equal(chunked, full)
+
+
+def test_unknown_grid_keys_are_rejected():
+    with pytest.raises(KeyError, match="years"):
+        sweep_grid(USER_INPUTS, {"years": [5, 10]})
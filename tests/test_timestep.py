@@ -0,0 +1,86 @@
+#test_timestep.py
+# The block-height engine: sub-year steps against the yearly engine where the
+# two models coincide, and halvings that fall inside a step.
+
+import numpy as np
+import pytest
+
+from logic.engine import simulate_scenarios_array
+from logic.timestep import (
+    BLOCKS_PER_DAY, HALVING_BLOCKS, RETARGET_BLOCKS, STEPS_PER_YEAR, block_height_at, cumulative_subsidy,
+    simulate_scenarios_timestep,
+)
+
+INPUTS = {
+    "initial_investment": 100_000.0,
+    "btc_price": 100_000.0,
+    "electricity_rate": 0.05,
+    "years": 3,
+    "miner_cost": 3_500.0,
+    "miner_hashrate_ths": 200.0,
+    "miner_power_kw": 3.5,
+    "network_hashrate_ehs": 900.0,
+    "btc_cagr": 15.0,
+    "start_year": 2025,
+}
+
+
+@pytest.mark.parametrize("time_step", list(STEPS_PER_YEAR))
+@pytest.mark.parametrize("market", [
+    {"difficulty": None, "fees_btc": 0.0, "uptime": 1.0},  # the yearly share path has no fees or uptime
+    {"difficulty": 115e12, "fees_btc": 0.025, "uptime": 0.95},
+])
+def test_sub_year_steps_match_yearly_engine_without_a_halving(time_step, market):
+    # Flat network hashrate and heights 850,000-1,008,000: both engines see the same
+    # 144 blocks/day at a 3.125 BTC subsidy, so year ends must agree
+    inputs = {**INPUTS, **market}
+    yearly = simulate_scenarios_array(block_reward=3.125, hashrate_factors=np.ones(INPUTS["years"]), **inputs)
+    stepped = simulate_scenarios_timestep(time_step=time_step, start_height=850_000, network_growth=1.0, **inputs)
+
+    per_year = STEPS_PER_YEAR[time_step]
+    assert stepped["block_height"][-1] < 5 * HALVING_BLOCKS  # no halving inside the run
+    np.testing.assert_allclose(stepped["btc_held"][..., per_year - 1::per_year], yearly["btc_held"], rtol=1e-9)
+    np.testing.assert_allclose(stepped["roi"][..., per_year - 1::per_year], yearly["roi"], rtol=1e-9, atol=1e-6)
+
+
+def test_cumulative_subsidy_known_heights():
+    assert cumulative_subsidy(0) == 0
+    assert cumulative_subsidy(HALVING_BLOCKS) == HALVING_BLOCKS * 50
+    assert cumulative_subsidy(4 * HALVING_BLOCKS) == HALVING_BLOCKS * (50 + 25 + 12.5 + 6.25)
+    assert cumulative_subsidy(840_001) == cumulative_subsidy(840_000) + 3.125
+    assert cumulative_subsidy(1e9) == pytest.approx(21e6)
+
+
+def test_halving_inside_a_step_splits_its_subsidy():
+    halving = 5 * HALVING_BLOCKS
+    start_height = halving - 1000.5  # mid-way through a block, 1000.5 blocks before the halving
+    inputs = {**INPUTS, "difficulty": None, "fees_btc": 0.0, "uptime": 1.0, "years": 1}
+    result = simulate_scenarios_timestep(time_step="weekly", start_height=start_height, network_growth=1.0,
+                                         scenarios=["Miners Only"], **inputs)
+
+    step_blocks = BLOCKS_PER_DAY * 365 / 52  # > 1000.5: the halving lands in the first step
+    np.testing.assert_allclose(result["block_height"][:2], start_height + step_blocks * np.arange(1, 3))
+    assert cumulative_subsidy(start_height + step_blocks) - cumulative_subsidy(start_height) == pytest.approx(
+        1000.5 * 3.125 + (step_blocks - 1000.5) * 1.5625)
+
+    share = INPUTS["miner_hashrate_ths"] / (INPUTS["network_hashrate_ehs"] * 1e6)
+    miners = INPUTS["initial_investment"] // INPUTS["miner_cost"]
+    mined = result["btc_mined"][0]
+    assert mined[0] == pytest.approx(miners * share * (1000.5 * 3.125 + (step_blocks - 1000.5) * 1.5625))
+    assert mined[1] == pytest.approx(miners * share * step_blocks * 1.5625)
+    assert result["reward"][:2].tolist() == [3.125, 1.5625]
+
+
+def test_block_height_retargets_every_2016_blocks():
+    start_height = 10 * RETARGET_BLOCKS + 16
+    assert block_height_at(np.array([0.0, 10.0]), start_height, network_growth=1.0).tolist() == [
+        start_height, start_height + 10 * BLOCKS_PER_DAY]
+
+    # With hashrate growth blocks come faster than 144/day between retargets, and
+    # each retarget resets the rate, so every full epoch takes the same time
+    t = np.linspace(0, 365, 3651)
+    heights = block_height_at(t, start_height, network_growth=1.5)
+    assert (np.diff(heights) > 0).all()
+    assert heights[-1] > start_height + 365 * BLOCKS_PER_DAY
+    crossings = t[np.searchsorted(heights, (11 + np.arange(20)) * RETARGET_BLOCKS)]
+    np.testing.assert_allclose(np.diff(crossings)[1:], np.diff(crossings)[0], atol=0.2)
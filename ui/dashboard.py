@@ -1,33 +1,37 @@
 #dashboard.py
 
 def run_dashboard():
-    import datetime
+    # Heavy or feature-specific modules (plotly, bs4, pyarrow) are imported where they are used
     import pandas as pd
-    import plotly.express as px
-    import plotly.graph_objects as go
     import streamlit as st
-    import time
     import os
     import numpy as np
 
-    from data.btc_api import fetch_btc_prices, fetch_hashprice
-    from data.miner_data import load_data, update_csv
-    from scrape.miner_scraper import scrape_miner_specs
+    from data.market_history import get_history
+    from data.market_refresher import get_refresher
+    from data import miner_store
+    from data.miner_catalog import MinerCatalog
+    from data.miner_data import (
+        CSV_FILE, data_signature, get_frontier, get_shared_data, normalize_data, read_raw_data, save_data, update_csv,
+    )
+    from data.shared_store import shared_store
     from ui.column_config import column_config
     from ui.column_config import scenario_column_config
-    from utils.cleaning import clean_and_normalize
-    from utils.scoring import calculate_miner_scores
-    from utils.metrics import calculate_profitability_metrics
+    from utils.charts import MAX_SERIES_POINTS, cap_categories, lttb, payload_sizes, render_mode
+    from utils.energy import breakeven_rate, run_schedule
+    from utils.graph import ComputeGraph, stable_hash
     from logic.inputs import get_user_inputs
-    from logic.simulate import simulate_all_scenarios
-    
-    df = load_data()  # loads, cleans, renames, power → power_kw
+    from logic.cache import cached_simulate_all_scenarios, simulation_cache
+    from logic.simulate import scenario_metrics
 
-    if df.empty:
-        st.warning("No miner data loaded. Upload CSV or add miners manually.")
+    # One graph per session; nodes only rerun when their inputs change
+    if "compute_graph" not in st.session_state:
+        st.session_state["compute_graph"] = ComputeGraph()
+    graph = st.session_state["compute_graph"]
 
-    def update_miner_revenue_profit(df, btc_price, electricity_rate, usd_per_th_per_day=None):
-        df = df.copy()
+    def update_miner_revenue_profit(df, btc_price, electricity_rate, usd_per_th_per_day=None, tariff=None,
+                                    curtail_above=None):
+        df = df.copy(deep=False)  # only the columns added below are this session's
 
         # If you have a live usd_per_th_per_day from hashprice API, use that,
         # else estimate it from btc_price and a rough factor.
@@ -37,25 +41,123 @@ def run_dashboard():
             base_btc_price = 100000
             base_usd_per_th_per_day = 0.06
             usd_per_th_per_day = base_usd_per_th_per_day * (btc_price / base_btc_price)
-
-        st.write(f"BTC Price used: {btc_price}")
-        st.write(f"USD per TH per day: {usd_per_th_per_day}")
-        st.write(f"Sample miner hashrate (TH/s): {df['hashrate_ths'].iloc[0] if not df.empty else 'No data'}")
-
+        df.attrs["usd_per_th_per_day"] = usd_per_th_per_day
 
         # Calculate daily revenue ($)
         df["daily_revenue"] = df["hashrate_ths"] * usd_per_th_per_day
 
         # Calculate daily electricity cost ($)
-        df["daily_cost"] = df["power_kw"] * 24 * electricity_rate
+        if tariff is None:
+            df["daily_cost"] = df["power_kw"] * 24 * electricity_rate
+        else:
+            # Hourly tariff: each miner only runs in hours below its breakeven rate
+            schedule = run_schedule(tariff, breakeven_rate(usd_per_th_per_day, df["hashrate_ths"], df["power_kw"]),
+                                    curtail_above)
+            df["run_fraction"] = schedule["run_fraction"]
+            df["effective_rate"] = schedule["effective_rate"]
+            df["daily_revenue"] *= schedule["run_fraction"]
+            df["daily_cost"] = df["power_kw"] * 24 * np.nan_to_num(schedule["effective_rate"]) * schedule["run_fraction"]
 
         # Calculate daily profit ($)
         df["daily_profit"] = df["daily_revenue"] - df["daily_cost"]
 
+        # Months to pay back the miner's cost
+        if "cost" in df.columns:
+            profit = df["daily_profit"].where(df["daily_profit"] > 0)
+            df["break_even"] = df["cost"] / (profit * 30)
+
         # Profit margin (%)
         df["margin_percent"] = 100 * df["daily_profit"] / df["daily_revenue"].replace(0, 1)  # avoid div by zero
         return df
-    
+
+    def prepare_scenarios(user_inputs):
+        df_scenarios = cached_simulate_all_scenarios(user_inputs)
+        df_scenarios["Scenarios"] = df_scenarios["Scenario"].str.strip().str.lower()
+        # Rename miner columns for consistency in downstream calculations
+        rename_map = {
+            "miner_cost": "cost",
+            "miner_power_kw": "power_kw",
+            "miner_hashrate_ths": "hashrate_ths"
+        }
+        for old_col, new_col in rename_map.items():
+            df_scenarios[new_col] = df_scenarios.get(old_col, np.nan)
+        return df_scenarios
+
+    def build_price_chart(prices):
+        import plotly.express as px
+
+        prices = prices[lttb(prices["t"], prices["v"], MAX_SERIES_POINTS)]
+        df_prices = pd.DataFrame({"timestamp": prices["t"], "price": prices["v"]})
+        df_prices["date"] = pd.to_datetime(df_prices["timestamp"], unit="ms")
+
+        fig = px.line(df_prices, x="date", y="price", title="Bitcoin Price (USD)", render_mode=render_mode(len(df_prices)))
+        fig.update_traces(line_color="#F2A900")  # Bitcoin brand orange
+        return fig
+
+    def build_miner_charts(df):
+        import plotly.express as px
+
+        df = df.copy()
+        if "release_date" in df.columns:
+            df["release_year"] = pd.to_datetime(df["release_date"], format="%y-%b", errors="coerce").dt.year
+        # One trace per color: keep the most profitable models, the rest share one "other" trace
+        df["model_group"] = cap_categories(df["model"], rank_by=df["daily_profit"] if "daily_profit" in df.columns else None)
+        mode = render_mode(len(df))
+        fig1 = px.scatter(df, x="power_kw", y="hashrate_ths", color="model_group", hover_name="model",
+                          hover_data=["release_year"] if "release_year" in df.columns else None, render_mode=mode)
+
+        fig2 = px.bar(df.sort_values("efficiency"), x="model", y="efficiency", color="model_group", text_auto=".2s")
+
+        df_filtered = df.dropna(subset=["daily_profit", "cost", "efficiency"]).copy()
+        fig3 = px.scatter(
+            df_filtered,
+            x="efficiency",
+            y="cost",
+            color="model_group",
+            hover_name="model",
+            title="Efficiency vs Cost",
+            render_mode=mode,
+        )
+
+        df_filtered["daily_profit_size"] = df_filtered["daily_profit"].clip(lower=0)
+
+        fig4 = px.scatter(
+            df_filtered,
+            x="cost",
+            y="daily_profit",
+            size="daily_profit_size",
+            color="model_group",
+            hover_name="model",
+            title="Cost vs Daily Profit",
+            render_mode=mode,
+        )
+        return fig1, fig2, fig3, fig4
+
+    def build_scenario_chart(df_scenarios, selected_strategies):
+        import plotly.express as px
+
+        df_filtered = df_scenarios[df_scenarios["Scenario"].isin(selected_strategies)].copy()
+
+        fig = px.line(
+            df_filtered,
+            x="Year",
+            y=["ROI ($)"],
+            color="Scenario",
+            title="ROI Over Time by Strategy",
+        )
+
+        y_min = min(df_filtered["ROI ($)"].min(), 0)
+        y_max = df_filtered["ROI ($)"].max() * 1.1  # Add padding to top
+
+        fig.update_layout(
+            yaxis=dict(range=[y_min, y_max]),
+            xaxis_title="Year",
+            yaxis_title="ROI ($)",
+            title_font_size=20,
+            margin=dict(l=40, r=40, t=60, b=40),
+        )
+        return fig, df_filtered
+
     st.title("Bitcoin Miner Scraper & Dashboard")
 
     # === Live Bitcoin Price Chart ===
@@ -64,40 +166,74 @@ def run_dashboard():
     days_options = [7, 30, 90, 180, 365]
     selected_days = st.radio("Select time range (days)", days_options, index=1, horizontal=True)
 
-    prices = fetch_btc_prices(days=selected_days)
-    if prices:
-        df_prices = pd.DataFrame(prices, columns=["timestamp", "price"])
-        df_prices["date"] = pd.to_datetime(df_prices["timestamp"], unit="ms")
-
-        fig = px.line(df_prices, x="date", y="price", title="Bitcoin Price (USD)")
-        fig.update_traces(line_color="#F2A900")  # Bitcoin brand orange
+    # Live market data comes from a background refresher; this never waits on the network
+    figures = {}  # charts drawn this run, for the payload report
+    market = get_refresher().snapshot()
+    prices = get_history().btc_price.window(selected_days)  # stored daily closes, no network
+    if market["btc_price"] is not None:
+        live = np.array([market["btc_price"]], dtype=prices.dtype)
+        prices = np.concatenate([prices, live[live["t"] > (prices["t"][-1] if len(prices) else -1)]])
+    if len(prices):
+        fig = graph.compute("price_chart", build_price_chart, params={"prices": prices})
+        figures["price"] = fig
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("Unable to fetch BTC price data currently.")
+    ages = {k: f"{v / 60:.0f} min" if v is not None else "pending" for k, v in market["age_seconds"].items()}
+    st.caption("Market data age: " + ", ".join(f"{k} {v}" for k, v in ages.items()) + (" (refreshing)" if any(market["stale"].values()) else ""))
 
     # Upload CSV
     uploaded_file = st.file_uploader("Upload CSV", type=["csv"])
+
+    # Load → clean. An upload is this session's own data, keyed on its raw bytes. The
+    # common catalog (columnar store or CSV) is held once per process, read-only, and
+    # every session gets a zero-copy view of it.
     if uploaded_file:
-        df = clean_and_normalize(pd.read_csv(uploaded_file))
+        graph.compute("load", read_raw_data, params={"source": uploaded_file.getvalue()})
+        df = graph.compute("clean", lambda raw: normalize_data(raw.copy()), deps=("load",))  # renames, power → power_kw
+        data_key = None
+    else:
+        if miner_store.store_available():
+            # data_signature() first re-imports the CSV if it was edited after the store
+            data_key = data_signature() if miner_store.store_exists() else ("store", ())
+        else:
+            # The CSV's bytes, so rewriting it with the same content keeps the key
+            source = None
+            if os.path.exists(CSV_FILE):
+                with open(CSV_FILE, "rb") as f:
+                    source = f.read()
+            data_key = ("csv", stable_hash(source))
+        df = graph.compute("clean", get_shared_data, params={"key": data_key})
+
+    if df.empty:
+        st.warning("No miner data loaded. Upload CSV or add miners manually.")
 
     # Prepare df_miner_db for inputs and scenarios
-    df_miner_db = df[["model", "cost", "hashrate_ths", "power_kw"]].dropna().copy()
-    df_miner_db["model"] = df_miner_db["model"].str.strip().str.lower()
-    df_miner_db.rename(columns={"hashrate": "hashrate_ths"}, inplace=True)
-    #df_miner_db.drop(columns=["power"], inplace=True)
+    def prepare_miner_db(df):
+        df_miner_db = df[["model", "cost", "hashrate_ths", "power_kw"]].dropna().copy()
+        df_miner_db["model"] = df_miner_db["model"].str.strip().str.lower()
+        df_miner_db.rename(columns={"hashrate": "hashrate_ths"}, inplace=True)
+        #df_miner_db.drop(columns=["power"], inplace=True)
+        return df_miner_db
+
+    df_miner_db = graph.compute("miner_db", lambda df: prepare_miner_db(df) if data_key is None else shared_store.view(
+        ("miner_db", data_key), lambda: prepare_miner_db(df)
+    ), deps=("clean",))
     
-    # Fetch live price for sidebar if needed
-    prices = fetch_btc_prices(days=1)
-    if prices:
-        live_btc_price = prices[-1][1]  # last price in data
+    # Live price for sidebar if needed
+    if market["btc_price"] is not None:
+        live_btc_price = market["btc_price"][1]
     else:
         live_btc_price = None
 
     # Get user inputs with live BTC price
-    user_inputs = get_user_inputs(df_miner_db, live_btc_price=live_btc_price)
+    miner_index = graph.compute("miner_index", MinerCatalog, deps=("miner_db",))
+    user_inputs = get_user_inputs(
+        df_miner_db, live_btc_price=live_btc_price, catalog=miner_index, live_difficulty=market["difficulty"]
+    )
 
-    # Fetch live hashprice from Luxor API
-    usd_per_th_per_day, sats_per_th_per_day = fetch_hashprice()
+    # Live hashprice from Luxor API
+    usd_per_th_per_day, sats_per_th_per_day = market["hashprice"] or (None, None)
 
     st.sidebar.markdown("### Live Hashprice (from Luxor API)")
     if usd_per_th_per_day is not None:
@@ -105,34 +241,41 @@ def run_dashboard():
     else:
         st.sidebar.markdown("⚠️ Unable to fetch live hashprice")
 
-    # Update miner data with fresh revenue & profit based on current btc price & electricity
-    df = update_miner_revenue_profit(
-        df,
-        btc_price=user_inputs["btc_price"],
-        electricity_rate=user_inputs["electricity_rate"],
-        usd_per_th_per_day=usd_per_th_per_day  # from live hashprice API if available
-    )
+    # Hashprice revenue model: projected from the live hashprice or replayed from stored history
+    user_inputs["usd_per_th_per_day"] = usd_per_th_per_day
+    if user_inputs["revenue_model"] == "hashprice" and usd_per_th_per_day is None:
+        st.sidebar.warning("No live hashprice yet; simulating with the network model.")
+        user_inputs["revenue_model"] = "network"
+    elif user_inputs["revenue_model"] == "replay":
+        from logic.hashprice import daily_hashprice_btc
 
-    df_scenarios = simulate_all_scenarios(user_inputs)
-    df_scenarios["Scenarios"] = df_scenarios["Scenario"].str.strip().str.lower()
-    # Rename miner columns for consistency in downstream calculations
-    rename_map = {
-        "miner_cost": "cost",
-        "miner_power_kw": "power_kw",
-        "miner_hashrate_ths": "hashrate_ths"
+        if not len(daily_hashprice_btc()[0]):
+            st.sidebar.warning("No stored hashprice history yet; simulating with the network model.")
+            user_inputs["revenue_model"] = "network"
+
+    # Update miner data with fresh revenue & profit based on current btc price & electricity
+    revenue_params = {
+        "btc_price": user_inputs["btc_price"],
+        "electricity_rate": user_inputs["electricity_rate"],
+        "usd_per_th_per_day": usd_per_th_per_day,  # from live hashprice API if available
+        "tariff": user_inputs["tariff"],
+        "curtail_above": user_inputs["curtail_above"],
     }
-    for old_col, new_col in rename_map.items():
-        df_scenarios[new_col] = df_scenarios.get(old_col, np.nan)
-
-    df_scenarios = calculate_profitability_metrics(
-        df_scenarios,
-        btc_price=user_inputs["btc_price"],
-        electricity_rate=user_inputs["electricity_rate"],
-        difficulty=user_inputs.get("difficulty"),
-        block_reward_btc=user_inputs.get("block_reward_btc"),
-        fees_btc=user_inputs.get("fees_btc"),
-        usd_per_th_per_day=user_inputs.get("usd_per_th_per_day"),
-    )
+    df = graph.compute("revenue", update_miner_revenue_profit, deps=("clean",), params=revenue_params)
+
+    # Pareto frontier over efficiency / cost / profit / margin; miners added below extend it in place
+    frontier = graph.compute("frontier", lambda df: get_frontier(
+        df, key=stable_hash(revenue_params),
+        metrics=lambda rows: update_miner_revenue_profit(rows, **revenue_params),
+    ), deps=("revenue",))
+
+    st.write(f"BTC Price used: {user_inputs['btc_price']}")
+    st.write(f"USD per TH per day: {df.attrs.get('usd_per_th_per_day')}")
+    st.write(f"Sample miner hashrate (TH/s): {df['hashrate_ths'].iloc[0] if not df.empty else 'No data'}")
+
+    graph.compute("scenarios", prepare_scenarios, params={"user_inputs": user_inputs})
+    # The tariff is applied once, in the simulator (see scenario_metrics)
+    df_scenarios = graph.compute("metrics", scenario_metrics, deps=("scenarios",), params={"user_inputs": user_inputs})
 
     # --- Miner Data Section (AFTER metrics update) ---
     st.subheader("📋 Current Miner Database (with dynamic profit & cost)")
@@ -170,24 +313,29 @@ def run_dashboard():
     st.subheader("🧲 Enrich Miner Specs via Web Scraping")
     if st.button("Scrape Specs for All Models"):
         enriched_df = df.copy()
-        for idx, row in enriched_df.iterrows():
-            model = row.get("model") or row.get("Model") or row.get("Model Name")
-            if not model or not isinstance(model, str) or model.strip() == "":
-                continue
-            st.write(f"Scraping: {model}...")
-            scraped = scrape_miner_specs(model)
+        name_col = next((c for c in ("model", "Model", "Model Name") if c in enriched_df.columns), None)
+        models = enriched_df[name_col] if name_col else []
+        targets = [(idx, m) for idx, m in zip(enriched_df.index, models) if isinstance(m, str) and m.strip()]
+
+        # Concurrent, rate-limited and cached (see scrape/miner_scraper.py)
+        from scrape.miner_scraper import scrape_many
+
+        with st.spinner(f"Scraping {len(targets)} models..."):
+            scraped_specs = scrape_many([m for _, m in targets])
+        for idx, model in targets:
+            scraped = scraped_specs.get(model)
             if scraped:
                 for key, val in scraped.items():
                     enriched_df.loc[idx, key] = val
-            time.sleep(1)
 
-        enriched_df.to_csv("Book123.csv", index=False)
+        save_data(enriched_df)
         st.success("✅ Specs scraped and updated.")
         st.dataframe(enriched_df)
 
-    # Save updated miner DB with dynamic revenue/profit to CSV
-    if "daily_revenue" in df.columns and "daily_profit" in df.columns:
-        df.to_csv("Book123.csv", index=False)
+    # Save updated miner DB with dynamic revenue/profit to CSV (only when it changed).
+    # The columnar store keeps only catalog data; revenue columns are derived each run.
+    if graph.recomputed("revenue") and not miner_store.store_available() and "daily_revenue" in df.columns and "daily_profit" in df.columns:
+        df.to_csv(CSV_FILE, index=False)
     
     # --- Export CSV ---
     st.subheader("⬇️ Download Updated Miner List")
@@ -198,42 +346,64 @@ def run_dashboard():
     st.subheader("📊 Miner Comparison Charts")
 
     if not df.empty:
+        fig1, fig2, fig3, fig4 = graph.compute("miner_charts", build_miner_charts, deps=("revenue",))
+        figures.update({"hashrate_vs_power": fig1, "efficiency": fig2, "efficiency_vs_cost": fig3, "cost_vs_profit": fig4})
+
         st.markdown("**Hashrate (TH/s) vs Power Consumption**")
-        if "release_date" in df.columns:
-            df["release_year"] = pd.to_datetime(df["release_date"], format="%y-%b", errors="coerce").dt.year
-        fig1 = px.scatter(df, x="power_kw", y="hashrate_ths", color="model", hover_data=["release_year"])
         st.plotly_chart(fig1, use_container_width=True)
 
         st.markdown("**Miner Efficiency (J/TH)**")
-        fig2 = px.bar(df.sort_values("efficiency"), x="model", y="efficiency", color="model", text_auto=".2s")
         st.plotly_chart(fig2, use_container_width=True)
 
-        df_filtered = df.dropna(subset=["daily_profit", "cost", "efficiency"])
-        fig3 = px.scatter(
-            df_filtered,
-            x="efficiency",
-            y="cost",
-            color="model",
-            hover_name="model",
-            title="Efficiency vs Cost",
-        )
         st.plotly_chart(fig3, use_container_width=True)
-
-        df_filtered["daily_profit_size"] = df_filtered["daily_profit"].apply(lambda x: max(x, 0))
-
-        fig4 = px.scatter(
-            df_filtered,
-            x="cost",
-            y="daily_profit",
-            size="daily_profit_size",
-            color="model",
-            hover_name="model",
-            title="Cost vs Daily Profit",
-        )
         st.plotly_chart(fig4, use_container_width=True)
     else:
         st.info("No miner data to chart yet. Add or upload miners first.")
 
+    # --- Pareto-optimal miners ---
+    st.subheader("🏆 Pareto-Optimal Miners")
+    st.caption("No other miner is at least as good on efficiency, cost, daily profit and margin, and better on one.")
+    df_frontier = frontier.frontier()
+    if not df_frontier.empty:
+        st.dataframe(df_frontier[["model", "efficiency", "cost", "daily_profit", "margin"]], use_container_width=True)
+    else:
+        st.info("No miners with efficiency, cost and profit data yet.")
+
+    # --- Capital allocation ---
+    st.subheader("💰 Best Miner Mix for Your Budget")
+    col1, col2, col3 = st.columns(3)
+    power_cap_kw = col1.number_input("Power Cap (kW)", value=1000.0, step=100.0, min_value=0.0)
+    objective = col2.selectbox("Maximize", ["npv", "irr"], format_func=str.upper)
+    horizon = col3.number_input("Horizon (years)", value=5, min_value=1, max_value=30)
+    # Revenue from the live hashprice, else difficulty, else the estimate the miner table uses
+    allocation_hashprice = usd_per_th_per_day
+    if allocation_hashprice is None and not user_inputs.get("difficulty"):
+        allocation_hashprice = df.attrs.get("usd_per_th_per_day")
+    if not df.empty and allocation_hashprice is None and not user_inputs.get("difficulty"):
+        st.info("Waiting for a live hashprice or difficulty to value miners.")
+    elif not df.empty:
+        from logic.optimizer import optimize_miner_mix
+
+        mix = graph.compute("allocation", optimize_miner_mix, deps=("revenue",), params={
+            **revenue_params,
+            "usd_per_th_per_day": allocation_hashprice,
+            "initial_investment": user_inputs["initial_investment"],
+            "power_cap_kw": power_cap_kw,
+            "objective": objective,
+            "years": int(horizon),
+            "difficulty": user_inputs.get("difficulty"),
+            "block_reward_btc": user_inputs.get("block_reward"),
+            "fees_btc": user_inputs.get("fees_btc"),
+        })
+        if not mix["allocation"].empty:
+            st.dataframe(mix["allocation"], use_container_width=True)
+            st.caption(
+                f"NPV ${mix['npv']:,.0f} (bound ${mix['upper_bound_npv']:,.0f}) · IRR {mix['irr']:.1%} · "
+                f"${mix['spent']:,.0f} spent · {mix['power_kw']:,.1f} kW · solved in {mix['solve_seconds'] * 1000:.0f} ms"
+            )
+        else:
+            st.info("No miner has a positive NPV within this budget and power cap.")
+
     # === BTC Investment Scenario Simulator ===
     st.subheader("💡 BTC Investment Strategy Simulator")
 
@@ -245,32 +415,25 @@ def run_dashboard():
     )
 
     if not df_scenarios.empty and "Year" in df_scenarios.columns and selected_strategies:
-        df_filtered = df_scenarios[df_scenarios["Scenario"].isin(selected_strategies)].copy()
-
-        fig = px.line(
-            df_filtered,
-            x="Year",
-            y=["ROI ($)"],
-            color="Scenario",
-            title="ROI Over Time by Strategy",
-        )
-
-        y_min = min(df_filtered["ROI ($)"].min(), 0)
-        y_max = df_filtered["ROI ($)"].max() * 1.1  # Add padding to top
-
-        fig.update_layout(
-            yaxis=dict(range=[y_min, y_max]),
-            xaxis_title="Year",
-            yaxis_title="ROI ($)",
-            title_font_size=20,
-            margin=dict(l=40, r=40, t=60, b=40),
+        fig, df_filtered = graph.compute(
+            "scenario_chart", build_scenario_chart, deps=("metrics",),
+            params={"selected_strategies": selected_strategies},
         )
 
+        figures["scenarios"] = fig
         st.plotly_chart(fig, use_container_width=True)
         st.dataframe(df_filtered, column_config=scenario_column_config, use_container_width=True)
     else:
         st.warning("⚠️ No scenario data to display or selected.")
 
+    with st.expander("⏱️ Recompute timings"):
+        st.dataframe(graph.report(), use_container_width=True)
+        st.caption(f"Simulation cache: {simulation_cache.stats()}")
+        st.caption(f"Shared tables: {shared_store.stats()}")
+        # Serializing every figure again costs about as much as sending it, so only on request
+        if st.checkbox("Measure chart payloads", value=False):
+            st.dataframe(payload_sizes(figures), use_container_width=True)
+
     if df_scenarios.empty:
         st.warning("No scenario simulation results. Check inputs or try again.")
         return
\ No newline at end of file
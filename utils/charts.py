@@ -0,0 +1,71 @@
+#charts.py
+# Data reduction before Plotly: LTTB downsampling for time series, a cap on the
+# number of discrete color traces, WebGL rendering for large scatters, and the
+# serialized size of a figure so the savings can be measured.
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+MAX_SERIES_POINTS = 1000  # points per time-series trace
+MAX_COLOR_TRACES = 12  # distinct colors before the rest become OTHER_LABEL
+WEBGL_THRESHOLD = 1000  # points above which scatters use scattergl
+OTHER_LABEL = "other"
+
+
+def lttb(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of `n_out` points that keep the visual
+    shape of (x, y). The first and last points are always kept.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # n_out - 2 inner buckets
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def cap_categories(labels: pd.Series, max_categories: int = MAX_COLOR_TRACES, rank_by: Optional[pd.Series] = None,
+                   other: str = OTHER_LABEL) -> pd.Series:
+    """
+    Keep the `max_categories` most frequent labels (or those with the highest
+    `rank_by`) and replace the rest with `other`, so a color column makes at most
+    max_categories + 1 traces.
+    """
+    if labels.nunique(dropna=True) <= max_categories:
+        return labels
+    if rank_by is None:
+        top = labels.value_counts().index[:max_categories]
+    else:
+        top = rank_by.groupby(labels).max().nlargest(max_categories).index
+    return labels.where(labels.isin(top), other)
+
+
+def render_mode(n_points: int, threshold: int = WEBGL_THRESHOLD) -> str:
+    """render_mode for px.scatter / px.line: WebGL above the threshold."""
+    return "webgl" if n_points > threshold else "svg"
+
+
+def payload_size(fig) -> int:
+    """Bytes of the figure's JSON, roughly what is sent to the browser."""
+    return len(fig.to_json().encode("utf-8"))
+
+
+def payload_sizes(figures: Dict[str, object]) -> pd.DataFrame:
+    rows = [{"chart": name, "traces": len(fig.data), "bytes": payload_size(fig)} for name, fig in figures.items()]
+    return pd.DataFrame(rows, columns=["chart", "traces", "bytes"])
@@ -12,6 +12,7 @@ def clean_and_normalize(df):
     df.rename(columns={
         "hashrate (th/s)": "hashrate",
         "watts": "power",
+        "power (w)": "power",
         "efficiency (j/th)": "efficiency",
         "noise level (db)": "noise_level",
         "model": "model",
@@ -0,0 +1,99 @@
+#energy.py
+# Time-of-use energy model. A miner earns the same per hour whatever the tariff,
+# so the profit-maximizing schedule is to run in every hour priced below its
+# breakeven $/kWh (revenue per kWh drawn) and, on curtailing sites, never above
+# the curtailment threshold. Breakeven depends only on efficiency (J/TH) and
+# hashprice, so one sorted tariff and a searchsorted cover the whole catalog.
+# The schedule is summarized as an effective $/kWh and a run fraction, which
+# the simulator and the metrics apply to revenue and energy cost alike.
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+HOURS_PER_YEAR = 8760
+TARIFF_COLUMNS = ("usd_per_kwh", "price", "rate", "tariff")
+
+
+def load_tariff(source) -> np.ndarray:
+    """
+    Hourly $/kWh from a CSV (path or file object). Uses the first column named
+    like TARIFF_COLUMNS, else the last numeric column. The series must cover
+    whole years of 8760 hours.
+    """
+    df = pd.read_csv(source)
+    named = [c for c in df.columns if str(c).strip().lower() in TARIFF_COLUMNS]
+    numeric = df.select_dtypes("number").columns
+    if not named and not len(numeric):
+        raise ValueError("Tariff CSV has no numeric column")
+    tariff = pd.to_numeric(df[named[0] if named else numeric[-1]], errors="coerce").to_numpy(dtype=float)
+    if not len(tariff) or len(tariff) % HOURS_PER_YEAR:
+        raise ValueError(f"Tariff has {len(tariff)} hourly values; expected a multiple of {HOURS_PER_YEAR}")
+    if np.isnan(tariff).any():
+        raise ValueError("Tariff has missing or non-numeric values")
+    return tariff
+
+
+def hashprice(
+    btc_price: float,
+    block_reward: float,
+    fees_btc: float = 0.0,
+    difficulty: Optional[float] = None,
+    network_hashrate_ehs: Optional[float] = None,
+) -> float:
+    """USD earned per TH/s per day at full availability, by difficulty or else by share of network hashrate (as in the simulator)."""
+    if difficulty:
+        return 1e12 * (block_reward + fees_btc) * 86400 / (difficulty * 2**32) * btc_price
+    if network_hashrate_ehs:
+        return 144 * block_reward / (network_hashrate_ehs * 1e6) * btc_price
+    return 0.0
+
+
+def breakeven_rate(usd_per_th_per_day, hashrate_ths, power_kw) -> np.ndarray:
+    """$/kWh at which a running miner's revenue equals its power bill."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(usd_per_th_per_day * np.asarray(hashrate_ths, dtype=float) / (24 * np.asarray(power_kw, dtype=float)))
+
+
+def run_schedule(tariff, breakeven, curtail_above: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Optimal on/off schedule against an hourly tariff, summarized per breakeven
+    rate (one per miner or efficiency class): the miner runs in every hour with
+    tariff < min(breakeven, curtail_above).
+
+    Returns run_fraction (share of hours running) and effective_rate (mean $/kWh
+    over the running hours; NaN for a miner that never runs), shaped like breakeven.
+    """
+    tariff = np.sort(np.asarray(tariff, dtype=float))
+    prefix = np.concatenate([[0.0], np.cumsum(tariff)])
+    limit = np.nan_to_num(np.asarray(breakeven, dtype=float), nan=-np.inf)
+    if curtail_above is not None:
+        limit = np.minimum(limit, curtail_above)
+    hours = np.searchsorted(tariff, limit, side="left")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_rate = np.where(hours > 0, prefix[hours] / hours, np.nan)
+    return {"run_fraction": hours / len(tariff), "effective_rate": effective_rate}
+
+
+def scenario_energy_inputs(user_inputs: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Effective electricity_rate and run_fraction for the simulator's miner under
+    user_inputs["tariff"] (array or CSV path) and optional "curtail_above".
+    The schedule is set from the starting hashprice and held for the whole run.
+    """
+    tariff = user_inputs["tariff"]
+    if isinstance(tariff, str):
+        tariff = load_tariff(tariff)
+    price = hashprice(
+        user_inputs["btc_price"], user_inputs.get("block_reward", 0.0), user_inputs.get("fees_btc", 0.0),
+        user_inputs.get("difficulty"), user_inputs.get("network_hashrate_ehs"),
+    )
+    schedule = run_schedule(
+        tariff, breakeven_rate(price, user_inputs["miner_hashrate_ths"], user_inputs["miner_power_kw"]),
+        user_inputs.get("curtail_above"),
+    )
+    return {
+        "electricity_rate": float(np.nan_to_num(schedule["effective_rate"])),
+        "run_fraction": float(schedule["run_fraction"]),
+    }
@@ -0,0 +1,72 @@
+#finance.py
+# Vectorized NPV / IRR. Replaces np.irr, which was removed from NumPy.
+# Every function works on a 2-D array of cashflows (one series per row) so a
+# whole catalog or sweep is solved in one call.
+
+import numpy as np
+
+
+def npv(rate, cashflows):
+    """NPV of each cashflow row at `rate` (scalar or one rate per row). Period 0 is undiscounted."""
+    cashflows = np.asarray(cashflows, dtype=float)
+    rate = np.asarray(rate, dtype=float)[..., None]
+    periods = np.arange(cashflows.shape[-1])
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return (cashflows * (1 + rate) ** -periods).sum(axis=-1)
+
+
+def irr(cashflows, guess: float = 0.1, tol: float = 1e-10, max_iter: int = 50,
+        low: float = -0.9999, high: float = 1e4, bisect_iter: int = 200):
+    """
+    Internal rate of return per row of `cashflows` (shape (..., T)), as a fraction.
+
+    Newton's method runs on all rows at once; rows it can't settle (flat
+    derivative, rate drifting below -100%, no convergence) fall back to bisection
+    on [low, high]. Rows with no sign change there get NaN.
+    """
+    cashflows = np.asarray(cashflows, dtype=float)
+    shape = cashflows.shape[:-1]
+    cf = cashflows.reshape(-1, cashflows.shape[-1])
+    periods = np.arange(cf.shape[1])
+    scale = np.abs(cf).sum(axis=1)
+    scale[scale == 0] = 1.0
+
+    def f(r, rows=slice(None)):
+        return npv(r, cf[rows])
+
+    rate = np.full(cf.shape[0], guess)
+    done = np.zeros(cf.shape[0], dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            active = ~done
+            if not active.any():
+                break
+            r = rate[active]
+            disc = (1 + r)[:, None] ** -periods
+            value = (cf[active] * disc).sum(axis=1)
+            slope = (-periods * cf[active] * disc / (1 + r)[:, None]).sum(axis=1)
+            r_new = r - value / slope
+            rate[active] = r_new
+            done[active] = np.abs(value) <= tol * scale[active]
+
+        good = done & np.isfinite(rate) & (rate > -1) & (np.abs(f(rate)) <= np.sqrt(tol) * scale)
+        rate[~good] = np.nan
+
+        # Bisection fallback for everything Newton didn't settle
+        todo = np.flatnonzero(~good)
+        if todo.size:
+            lo = np.full(todo.size, low)
+            hi = np.full(todo.size, high)
+            f_lo = f(lo, todo)
+            f_hi = f(hi, todo)
+            bracketed = (np.sign(f_lo) != np.sign(f_hi)) & np.isfinite(f_lo) & np.isfinite(f_hi)
+            for _ in range(bisect_iter):
+                mid = (lo + hi) / 2
+                f_mid = f(mid, todo)
+                left = np.sign(f_mid) == np.sign(f_lo)
+                lo = np.where(left, mid, lo)
+                f_lo = np.where(left, f_mid, f_lo)
+                hi = np.where(left, hi, mid)
+            rate[todo] = np.where(bracketed, (lo + hi) / 2, np.nan)
+
+    return rate.reshape(shape)
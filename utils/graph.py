@@ -0,0 +1,95 @@
+#graph.py
+# Dependency-tracked computation layer. Each named node is keyed on a hash of its
+# parameters and the keys of the nodes it depends on, so after an input changes
+# only that node and the nodes downstream of it are recomputed.
+
+import hashlib
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def _update(h, obj):
+    if isinstance(obj, pd.DataFrame):
+        h.update(b"frame")
+        _update(h, list(obj.columns))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b"series")
+        _update(h, obj.name)
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"array{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=repr):
+            _update(h, k)
+            _update(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _update(h, item)
+        h.update(b"]")
+    elif isinstance(obj, (bytes, bytearray)):
+        h.update(b"bytes")
+        h.update(obj)
+    elif isinstance(obj, (bool, np.bool_)) or obj is None:
+        h.update(repr(obj).encode())
+    elif isinstance(obj, (int, float, np.number)):
+        # 1, 1.0 and np.float64(1) hash the same
+        h.update(f"num{float(obj)!r}".encode())
+    else:
+        h.update(f"{type(obj).__name__}:{obj!r}".encode())
+
+
+def stable_hash(obj) -> str:
+    """Canonical content hash of nested dicts/lists/scalars/arrays/DataFrames, stable across processes."""
+    h = hashlib.blake2b(digest_size=16)
+    _update(h, obj)
+    return h.hexdigest()
+
+
+class ComputeGraph:
+    """
+    Named nodes computed on demand:
+
+        graph.compute("clean", clean_fn, deps=("load",))
+        graph.compute("revenue", revenue_fn, deps=("clean",), params={"btc_price": price})
+
+    `fn` is called as fn(*dep_values, **params). If the node's key (its params plus
+    its deps' keys) hasn't changed since the last call, the stored value is returned.
+    Values are shared between reruns, so callers must not mutate them.
+    """
+
+    def __init__(self):
+        self._entries = {}  # name -> (key, value)
+        self._runs = {}  # name -> (status, seconds) for the latest call of each node
+
+    def compute(self, name: str, fn, deps=(), params=None):
+        start = time.perf_counter()
+        params = params or {}
+        key = stable_hash([name, [self._entries[d][0] for d in deps], params])
+
+        cached = self._entries.get(name)
+        if cached is not None and cached[0] == key:
+            self._runs[name] = ("cached", time.perf_counter() - start)
+            return cached[1]
+
+        value = fn(*(self._entries[d][1] for d in deps), **params)
+        self._entries[name] = (key, value)
+        self._runs[name] = ("recomputed", time.perf_counter() - start)
+        return value
+
+    def recomputed(self, name: str) -> bool:
+        """True if the latest compute() of `name` actually ran its function."""
+        return self._runs.get(name, ("",))[0] == "recomputed"
+
+    def report(self) -> pd.DataFrame:
+        """Status and wall time (seconds, including hashing) of each node's latest call."""
+        return pd.DataFrame(
+            [(name, status, seconds) for name, (status, seconds) in self._runs.items()],
+            columns=["node", "status", "seconds"],
+        )
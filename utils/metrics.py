@@ -1,5 +1,17 @@
 #metrics.py
 
+import numpy as np
+
+from utils.energy import breakeven_rate, run_schedule
+from utils.finance import irr
+
+def _masked_divide(num, den, mask):
+    # num / den where mask holds, NaN elsewhere (no warnings, no row loop)
+    return np.divide(num, den, out=np.full(np.shape(num), np.nan), where=mask)
+
+def _column(df, name):
+    return df[name].to_numpy(dtype=float, na_value=np.nan)
+
 def calculate_profitability_metrics(
     df,
     btc_price=None,
@@ -8,42 +20,66 @@ def calculate_profitability_metrics(
     block_reward_btc=6.25,
     fees_btc=0.0,
     usd_per_th_per_day=None,
-    uptime=0.95
+    uptime=0.95,
+    irr_years=None,
+    inplace=False,
+    tariff=None,
+    curtail_above=None
 ):
-    df = df.copy()
+    # inplace=True writes the metric columns into the caller's frame; otherwise they go on a
+    # shallow copy, so input columns (possibly read-only shared buffers) are never copied
+    if not inplace:
+        df = df.copy(deep=False)
+
+    hashrate_ths = _column(df, "hashrate_ths")
+    cost = _column(df, "cost")
 
     if usd_per_th_per_day is not None:
         # Calculate revenue directly from hashprice
-        df["daily_revenue"] = df["hashrate_ths"] * usd_per_th_per_day
+        daily_revenue = hashrate_ths * usd_per_th_per_day
+    else:
+        # Difficulty-based calculation. Use daily_btc_mined when the frame has it,
+        # otherwise derive it from difficulty, block reward and fees.
+        if "daily_btc_mined" not in df.columns:
+            if not difficulty:
+                raise KeyError("Need a 'daily_btc_mined' column or a difficulty to compute it")
+            reward_per_block = (block_reward_btc or 0.0) + (fees_btc or 0.0)
+            df["daily_btc_mined"] = (hashrate_ths * 1e12 * uptime * reward_per_block * 86400) / (difficulty * 2**32)
+        daily_revenue = _column(df, "daily_btc_mined") * btc_price
 
-        # Calculate electricity cost
-        df["daily_electric_cost"] = df["power_kw"] * 24 * electricity_rate * uptime
+    power_kw = _column(df, "power_kw")
+    if tariff is None:
+        daily_electric_cost = power_kw * 24 * electricity_rate * uptime
+    else:
+        # Hourly tariff: each miner runs only in hours below its breakeven (and the curtailment threshold)
+        running_revenue = daily_revenue if usd_per_th_per_day is not None else daily_revenue / uptime
+        schedule = run_schedule(tariff, breakeven_rate(1.0, running_revenue, power_kw), curtail_above)
+        df["run_fraction"] = schedule["run_fraction"]
+        df["effective_rate"] = schedule["effective_rate"]
+        daily_revenue = daily_revenue * schedule["run_fraction"]
+        daily_electric_cost = power_kw * 24 * np.nan_to_num(schedule["effective_rate"]) * uptime * schedule["run_fraction"]
+    daily_profit = daily_revenue - daily_electric_cost
 
-        # Profit and break-even
-        df["daily_profit"] = df["daily_revenue"] - df["daily_electric_cost"]
-        df["break_even"] = df.apply(
-            lambda row: (row["cost"] / row["daily_profit"] / 30) if row["daily_profit"] > 0 else None,
-            axis=1
-        )
+    df["daily_revenue"] = daily_revenue
+    df["daily_electric_cost"] = daily_electric_cost
+    df["daily_profit"] = daily_profit
+    df["break_even"] = _masked_divide(cost, daily_profit * 30, daily_profit > 0)
 
+    # ---- Financial Metrics (applies to both cases) ----
+    annual_profit = daily_profit * 365
+    has_cost = cost != 0
+    df["annual_profit"] = annual_profit
+    df["irr_1yr"] = _masked_divide(annual_profit - cost, cost, has_cost)
+    df["ppi_1yr"] = _masked_divide(annual_profit, cost, has_cost)
+    if "daily_btc_mined" in df.columns:
+        daily_btc_mined = _column(df, "daily_btc_mined")
+        df["cpbm"] = _masked_divide(cost, daily_btc_mined, daily_btc_mined > 0)
     else:
-        # Difficulty-based calculation fallback
-        # Make sure 'daily_btc_mined' column exists in df when using this path
-        df["daily_revenue"] = df["daily_btc_mined"] * btc_price
-        df["daily_electric_cost"] = df["power_kw"] * 24 * electricity_rate * uptime
-        df["daily_profit"] = df["daily_revenue"] - df["daily_electric_cost"]
-        df["break_even"] = df.apply(
-            lambda row: (row["cost"] / row["daily_profit"] / 30) if row["daily_profit"] > 0 else None,
-            axis=1
-        )
+        df["cpbm"] = np.nan
 
-    # ---- Financial Metrics (applies to both cases) ----
-    df["annual_profit"] = df["daily_profit"] * 365
-    df["irr_1yr"] = (df["annual_profit"] - df["cost"]) / df["cost"]
-    df["ppi_1yr"] = df["annual_profit"] / df["cost"]
-    df["cpbm"] = df.apply(
-        lambda row: (row["cost"] / row["daily_btc_mined"]) if "daily_btc_mined" in df.columns and row["daily_btc_mined"] > 0 else None,
-        axis=1
-    )
-
-    return df
\ No newline at end of file
+    # Multi-year IRR: pay `cost` up front, then `annual_profit` each year. One solve for all rows.
+    if irr_years:
+        cashflows = np.column_stack([-cost] + [annual_profit] * irr_years)
+        df[f"irr_{irr_years}yr"] = irr(cashflows)
+
+    return df
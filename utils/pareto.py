@@ -0,0 +1,187 @@
+# utils/pareto.py
+# Pareto frontier (and k-skyband) of the miner catalog over the columns used for
+# scoring: lower efficiency (J/TH) and cost, higher daily profit and margin.
+#
+# A miner is in the k-skyband if fewer than k miners dominate it; the frontier is
+# the 1-skyband. For any weighting of those columns, the top k miners are all in
+# the k-skyband, so top-k queries only score the band, not the whole catalog.
+
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.scoring import SCORE_FEATURES, _prepare, top_k as _top_k, weight_matrix
+
+PARETO_COLUMNS = ("efficiency", "cost", "daily_profit", "margin")
+MAXIMIZE = np.array([False, False, True, True])
+# Position of each scoring feature's column in PARETO_COLUMNS (age_score has none)
+_FEATURE_COLUMN = {"eff_score": 0, "cost_score": 1, "profit_score": 2, "margin_score": 3}
+BLOCK = 512
+PRUNERS = 64
+
+
+def objective_matrix(df: pd.DataFrame) -> np.ndarray:
+    """(n, 4) values oriented so that lower is better in every column."""
+    values = df[list(PARETO_COLUMNS)].to_numpy(dtype=np.float64)
+    return np.where(MAXIMIZE, -values, values)
+
+
+def _dominated_counts(points: np.ndarray, by: np.ndarray) -> np.ndarray:
+    # counts[i] = how many rows of `by` dominate points[i] (<= everywhere, < somewhere)
+    if not len(by) or not len(points):
+        return np.zeros(len(points), dtype=np.int64)
+    # One column at a time keeps the temporaries at (len(points), len(by))
+    le = np.ones((len(points), len(by)), dtype=bool)
+    lt = np.zeros((len(points), len(by)), dtype=bool)
+    for col in range(points.shape[1]):
+        p, b = points[:, col, None], by[None, :, col]
+        le &= b <= p
+        lt |= b < p
+    return (le & lt).sum(axis=1)
+
+
+def skyband(values: np.ndarray, k: int = 1):
+    """
+    Sort-based skyline: positions of rows dominated by fewer than k others, and
+    their dominator counts. Rows are visited in order of their summed normalized
+    values, so nothing can dominate a row visited before it, and each block is
+    only compared with the band kept so far and with itself.
+    """
+    if not len(values):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    lo, hi = values.min(axis=0), values.max(axis=0)
+    key = ((values - lo) / np.where(hi > lo, hi - lo, 1.0)).sum(axis=1)
+    order = np.lexsort(tuple(values.T[::-1]) + (key,))  # ties on key: lexicographic
+    kept, counts = [], []
+    band = np.empty((0, values.shape[1]))
+    for start in range(0, len(order), BLOCK):
+        block = order[start:start + BLOCK]
+        points = values[block]
+        # Cheap pass against the strongest band members (visited first) rejects most rows
+        candidates = np.flatnonzero(_dominated_counts(points, band[:PRUNERS]) < k)
+        points, block = points[candidates], block[candidates]
+        # In-block dominators are counted only among candidates, band ones in full;
+        # that is exact for the test "count >= k" (any dominator with k dominators
+        # of its own brings k band members that also dominate the row)
+        c = _dominated_counts(points, band) + _dominated_counts(points, points)
+        keep = c < k
+        kept.append(block[keep])
+        counts.append(c[keep])
+        band = np.concatenate([band, points[keep]])
+    return np.concatenate(kept), np.concatenate(counts)
+
+
+class ParetoFrontier:
+    """
+    k-skyband of a scored miner frame, maintained as miners are added.
+
+    `metrics(df) -> df` adds daily_profit / daily_revenue to new raw rows (e.g. the
+    dashboard's revenue step with the current price and electricity rate); rows
+    that already have those columns are used as is. Removing miners or changing
+    market inputs requires a rebuild.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, band: int = 10,
+                 metrics: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None, key=None):
+        self.band = band
+        self.metrics = metrics
+        self.key = key  # caller's identifier for the inputs behind `metrics`
+        self.models = []  # model of every row added, in order (including dropped ones)
+        self._rows = pd.DataFrame()
+        self._values = np.empty((0, len(PARETO_COLUMNS)))
+        self._counts = np.empty(0, dtype=np.int64)
+        self._lo = np.full(len(PARETO_COLUMNS), np.inf)  # catalog-wide ranges, for scoring
+        self._hi = np.full(len(PARETO_COLUMNS), -np.inf)
+        if df is not None:
+            self._build(df)
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def scored(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rows with the frontier columns, as add() and the build use them: scored by
+        `metrics` if they have no daily_profit yet. Rows missing efficiency or cost
+        (e.g. a miner added without a price) are dropped, as in scoring.
+        """
+        if self.metrics is not None and "daily_profit" not in df.columns:
+            df = self.metrics(df)
+        df = df.assign(**{c: np.nan for c in ("efficiency", "cost") if c not in df.columns})
+        return _prepare(df).reset_index(drop=True)
+
+    def _scored(self, df: pd.DataFrame, scored: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        self.models.extend(df["model"].tolist() if "model" in df.columns else [None] * len(df))
+        df = self.scored(df) if scored is None else scored
+        raw = df[list(PARETO_COLUMNS)].to_numpy(dtype=np.float64)
+        if len(raw):
+            self._lo = np.minimum(self._lo, raw.min(axis=0))
+            self._hi = np.maximum(self._hi, raw.max(axis=0))
+        return df
+
+    def _build(self, df: pd.DataFrame):
+        df = self._scored(df)
+        values = objective_matrix(df)
+        keep, counts = skyband(values, self.band)
+        self._rows = df.iloc[keep].reset_index(drop=True)
+        self._values = values[keep]
+        self._counts = counts
+
+    def add(self, df: pd.DataFrame, scored: Optional[pd.DataFrame] = None) -> int:
+        """Add new miners; returns how many entered the band. `scored` is scored(df), if already computed."""
+        df = self._scored(df, scored)
+        entered = 0
+        for i in range(len(df)):
+            point = objective_matrix(df.iloc[[i]])
+            count = int(_dominated_counts(point, self._values)[0])
+            if count >= self.band:
+                continue
+            # The new miner may push band members it dominates out of the band
+            dominated = _dominated_counts(self._values, point) > 0
+            self._counts = self._counts + dominated
+            keep = self._counts < self.band
+            self._rows = pd.concat([self._rows[keep], df.iloc[[i]]], ignore_index=True)
+            self._values = np.concatenate([self._values[keep], point])
+            self._counts = np.append(self._counts[keep], count)
+            entered += 1
+        return entered
+
+    def frontier(self) -> pd.DataFrame:
+        """Miners no other miner dominates."""
+        return self._rows[self._counts == 0]
+
+    def skyband(self) -> pd.DataFrame:
+        """Band members with the number of miners dominating each."""
+        return self._rows.assign(dominated_by=self._counts)
+
+    def _feature_weights(self, weights) -> np.ndarray:
+        W = np.atleast_2d(weight_matrix(weights))
+        if np.any(W[:, SCORE_FEATURES.index("age_score")] != 0):
+            raise ValueError("age_score is not a frontier column; use utils.scoring.calculate_miner_scores")
+        return W
+
+    def scores(self, weights) -> np.ndarray:
+        """calculate_miner_scores' overall score for each band member, shape (band rows, n weightings)."""
+        W = self._feature_weights(weights)
+        raw = self._rows[list(PARETO_COLUMNS)].to_numpy(dtype=np.float64)
+        span = np.where(self._hi > self._lo, self._hi - self._lo, 1.0)
+        norm = (raw - self._lo) / span
+        features = np.zeros((len(raw), len(SCORE_FEATURES)))
+        for name, col in _FEATURE_COLUMN.items():
+            features[:, SCORE_FEATURES.index(name)] = norm[:, col] if MAXIMIZE[col] else 1 - norm[:, col]
+        return features @ W.T
+
+    def top_k(self, weights, k: int = 5):
+        """
+        Best k miners for a weighting (dict or 5-vector), best first, with their
+        overall_score. For a 2-D array of weightings, returns (k, m) band row
+        positions instead. k may not exceed the band depth.
+        """
+        if k > self.band:
+            raise ValueError(f"k={k} exceeds the band depth {self.band}")
+        scores = self.scores(weights)
+        idx = _top_k(scores, k)
+        if np.ndim(weight_matrix(weights)) == 2:
+            return idx
+        idx = idx[:, 0]
+        return self._rows.iloc[idx].assign(overall_score=scores[idx, 0])
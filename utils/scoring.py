@@ -1,59 +1,127 @@
 # utils/scoring.py
+# Miner scoring in NumPy: min-max normalized feature scores, weighted sums and
+# top-k selection. A 2-D array of weight vectors is scored in one matrix
+# multiply, for weight-sensitivity analysis.
 
-from sklearn.preprocessing import MinMaxScaler
+import numpy as np
 import pandas as pd
 
-def calculate_miner_scores(df: pd.DataFrame, weights: dict) -> pd.DataFrame:
-    df = df.copy()
+# Column order of the feature matrix and of every weight vector
+SCORE_FEATURES = ("eff_score", "cost_score", "profit_score", "margin_score", "age_score")
 
+
+def minmax(values: np.ndarray) -> np.ndarray:
+    """Column-wise min-max scaling to [0, 1]; constant columns become 0 (as MinMaxScaler)."""
+    values = np.asarray(values, dtype=np.float64)
+    lo = values.min(axis=0)
+    span = values.max(axis=0) - lo
+    return (values - lo) / np.where(span == 0, 1.0, span)
+
+
+def weight_matrix(weights) -> np.ndarray:
+    """A weights dict (keys SCORE_FEATURES), a list of such dicts, or an array (..., 5) as float64."""
+    if isinstance(weights, dict):
+        return np.array([weights[f] for f in SCORE_FEATURES], dtype=np.float64)
+    if len(weights) and isinstance(weights[0], dict):
+        return np.array([[w[f] for f in SCORE_FEATURES] for w in weights], dtype=np.float64)
+    return np.asarray(weights, dtype=np.float64)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first. For a 2-D (n_miners, n_weightings)
+    array, returns (k, n_weightings). Uses argpartition, so only the top k are sorted.
+    """
+    n = scores.shape[0]
+    k = min(k, n)
+    if k == 0:
+        return np.empty((0,) + scores.shape[1:], dtype=np.int64)
+    idx = np.argpartition(-scores, k - 1, axis=0)[:k] if k < n else np.argsort(-scores, axis=0)
+    order = np.argsort(-np.take_along_axis(scores, idx, axis=0), axis=0, kind="stable")
+    return np.take_along_axis(idx, order, axis=0)
+
+
+def _prepare(df: pd.DataFrame) -> pd.DataFrame:
     # Ensure required columns exist
-    required_cols = ["efficiency", "daily_profit", "cost"]
-    for col in required_cols:
+    for col in ["efficiency", "daily_profit", "cost"]:
         if col not in df.columns:
             raise KeyError(f"Missing required column: {col}")
 
-    df["daily_profit"] = pd.to_numeric(df["daily_profit"], errors="coerce")
-    df["daily_revenue"] = pd.to_numeric(df["daily_revenue"], errors="coerce")
+    extra = {"daily_profit": pd.to_numeric(df["daily_profit"], errors="coerce")}
+    if "daily_revenue" in df.columns:
+        extra["daily_revenue"] = pd.to_numeric(df["daily_revenue"], errors="coerce")
+        if "margin" not in df.columns:
+            extra["margin"] = (extra["daily_profit"] / extra["daily_revenue"]) * 100
 
-    if "margin" not in df.columns and "daily_revenue" in df.columns:
-        df["margin"] = (df["daily_profit"] / df["daily_revenue"]) * 100
+    if "expected_cost" in df.columns:
+        if "price_diff_usd" not in df.columns:
+            extra["price_diff_usd"] = df["expected_cost"] - df["cost"]
+        if "price_diff_pct" not in df.columns:
+            # 0 instead of NaN if cost was zero
+            extra["price_diff_pct"] = (df["expected_cost"] / df["cost"].replace(0, np.nan) * 100).fillna(0)
 
-    if "price_diff_usd" not in df.columns and "expected_cost" in df.columns:
-        df["price_diff_usd"] = (df["expected_cost"] - df["cost"])
+    df = df.assign(**extra)
+    if "margin" not in df.columns:
+        df["margin"] = np.nan
+    return df.dropna(subset=["efficiency", "daily_profit", "cost", "margin"])
 
-    if "price_diff_pct" not in df.columns and "expected_cost" in df.columns:
-        df["price_diff_pct"] = ((df["expected_cost"]) / df["cost"].replace(0, np.nan)) * 100
-        df["price_diff_pct"] = df["price_diff_pct"].fillna(0)  # Avoid NaN if cost was zero
 
-    df = df.dropna(subset=["efficiency", "daily_profit", "cost", "margin"]).copy()
+def feature_scores(df: pd.DataFrame) -> np.ndarray:
+    """(n, 5) scores in SCORE_FEATURES order for a frame already passed through _prepare."""
+    norm = minmax(df[["efficiency", "cost", "daily_profit", "margin"]].to_numpy(dtype=np.float64))
+    scores = np.zeros((len(df), len(SCORE_FEATURES)))
+    scores[:, 0] = 1 - norm[:, 0]  # lower J/TH is better
+    scores[:, 1] = 1 - norm[:, 1]  # cheaper is better
+    scores[:, 2] = norm[:, 2]
+    scores[:, 3] = norm[:, 3]
+    if "release year" in df.columns:
+        age = pd.Timestamp.now().year - df["release year"].to_numpy(dtype=np.float64)
+        scores[:, 4] = 1 - minmax(age[:, None])[:, 0]
+    return scores
 
+
+def calculate_miner_scores(df: pd.DataFrame, weights: dict, k: int = None) -> pd.DataFrame:
+    """
+    Score and rank miners by a weighted sum of normalized features. Returns the
+    scored rows sorted best first, or only the best `k` when k is given.
+    """
+    df = _prepare(df)
     if df.empty:
         return pd.DataFrame(columns=df.columns.tolist() + ["overall_score", "rank"])
 
-    scaler = MinMaxScaler()
-    df[["eff_norm", "profit_norm", "cost_norm", "margin_norm"]] = scaler.fit_transform(
-        df[["efficiency", "daily_profit", "cost", "margin"]]
-    )
-
-    df["eff_score"] = 1 - df["eff_norm"]
-    df["cost_score"] = 1 - df["cost_norm"]
-    df["profit_score"] = df["profit_norm"]
-    df["margin_score"] = df["margin_norm"]
+    scores = feature_scores(df)
+    overall = scores @ weight_matrix(weights)
+    order = top_k(overall, len(df) if k is None else k)
 
+    out = df.iloc[order].copy()
+    for i, name in enumerate(SCORE_FEATURES):
+        out[name] = scores[order, i]
     if "release year" in df.columns:
-        current_year = pd.Timestamp.now().year
-        df["age"] = current_year - df["release year"]
-        df["age_score"] = 1 - MinMaxScaler().fit_transform(df[["age"]])
-    else:
-        df["age_score"] = 0
-
-    df["overall_score"] = (
-        weights["eff_score"] * df["eff_score"] +
-        weights["cost_score"] * df["cost_score"] +
-        weights["profit_score"] * df["profit_score"] +
-        weights["margin_score"] * df["margin_score"] +
-        weights["age_score"] * df["age_score"]
-    )
-
-    df["rank"] = df["overall_score"].rank(ascending=False)
-    return df.sort_values("overall_score", ascending=False)
\ No newline at end of file
+        out["age"] = pd.Timestamp.now().year - out["release year"]
+    out["overall_score"] = overall[order]
+    out["rank"] = pd.Series(overall).rank(ascending=False).to_numpy()[order]
+    return out
+
+
+def weight_sensitivity(df: pd.DataFrame, weights, k: int = 5) -> pd.DataFrame:
+    """
+    Score every miner under many weightings at once (`weights` is (m, 5) or a list
+    of dicts) and report, per miner, the share of weightings that put it in the
+    top k and its best rank. Sorted by that share.
+    """
+    df = _prepare(df)
+    W = np.atleast_2d(weight_matrix(weights))
+    if df.empty:
+        return pd.DataFrame(columns=df.columns.tolist() + ["top_k_share", "best_rank"])
+
+    overall = feature_scores(df) @ W.T  # (n_miners, m)
+    top = top_k(overall, k)  # (k, m)
+    hits = np.bincount(top.ravel(), minlength=len(df))
+    best_rank = np.full(len(df), np.nan)
+    for rank in range(top.shape[0] - 1, -1, -1):
+        best_rank[top[rank]] = rank + 1
+
+    out = df.copy()
+    out["top_k_share"] = hits / W.shape[0]
+    out["best_rank"] = best_rank
+    return out.sort_values(["top_k_share", "best_rank"], ascending=[False, True])